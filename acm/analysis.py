@@ -2,14 +2,18 @@ from __future__ import annotations
 
 """Utilities for analysing manuscript files and matching journal guidelines."""
 
-from dataclasses import dataclass
+from array import array
+from dataclasses import asdict, dataclass
+import heapq
 import re
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Set
+from importlib import import_module
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+import zipfile
 
-from docx import Document
-
-from .journal import Guideline, load_guidelines
+from .journal import Guideline, GuidelineRegistry, guideline_registry
+from .keywords import KeywordMatcher
+from .parsers import FIGURE, HEADING, PARAGRAPH, TABLE, TITLE, Block
 
 
 SECTION_KEYWORDS: Dict[str, str] = {
@@ -27,6 +31,84 @@ SECTION_KEYWORDS: Dict[str, str] = {
     "abstract": "Abstract",
 }
 
+# Category tried first when a title matches keywords from several categories.
+SECTION_PRIORITIES: Sequence[str] = (
+    "Introduction",
+    "Methods",
+    "Results",
+    "Discussion",
+    "Conclusion",
+    "Abstract",
+)
+
+SECTION_KEYWORDS_I18N: Dict[str, Dict[str, str]] = {
+    "fr": {
+        "introduction": "Introduction",
+        "contexte": "Introduction",
+        "méthode": "Methods",
+        "matériel et méthodes": "Methods",
+        "résultat": "Results",
+        "discussion": "Discussion",
+        "conclusion": "Conclusion",
+        "résumé": "Abstract",
+    },
+    "de": {
+        "einleitung": "Introduction",
+        "hintergrund": "Introduction",
+        "methode": "Methods",
+        "ergebnis": "Results",
+        "diskussion": "Discussion",
+        "schlussfolgerung": "Conclusion",
+        "zusammenfassung": "Abstract",
+    },
+    "es": {
+        "introducción": "Introduction",
+        "antecedentes": "Introduction",
+        "método": "Methods",
+        "materiales y métodos": "Methods",
+        "resultado": "Results",
+        "discusión": "Discussion",
+        "conclusión": "Conclusion",
+        "conclusiones": "Conclusion",
+        "resumen": "Abstract",
+    },
+}
+
+SECTION_MATCHER = KeywordMatcher(SECTION_KEYWORDS, priorities=SECTION_PRIORITIES)
+
+# Bump whenever parsing changes what ends up in a ``SectionSummary`` so that
+# cached analyses from older versions are ignored.
+PARSER_VERSION = "3"
+
+
+def analysis_version() -> str:
+    """Return :data:`PARSER_VERSION` qualified by the section keywords.
+
+    Cached results carry section categories, so keywords added with
+    :func:`register_section_keywords` must miss entries cached without them.
+    """
+
+    return f"{PARSER_VERSION}+{SECTION_MATCHER.fingerprint}"
+
+# Manuscript format -> module (imported on first use) or callable yielding
+# ``(kind, text)`` blocks. Extend with :func:`register_parser`.
+PARSERS: Dict[str, Union[str, Callable[[Path], Iterator[Block]]]] = {
+    "docx": "acm.parsers.docx_xml",
+    "odt": "acm.parsers.odt",
+    "md": "acm.parsers.markdown",
+    "markdown": "acm.parsers.markdown",
+    "txt": "acm.parsers.plaintext",
+    "tex": "acm.parsers.latex",
+}
+
+_FIGURE_MENTION = re.compile(r"\b(?:figures?|figs?\.?)\s*(\d+)", re.IGNORECASE)
+_TABLE_MENTION = re.compile(r"\btables?\s*(\d+)", re.IGNORECASE)
+_CAPTION = re.compile(r"^(?:(figure|fig\.?)|table)\s*(\d+)\s*[.:|\u2013\u2014-]", re.IGNORECASE)
+_REFERENCE_HEADING = re.compile(
+    r"^\W*(?:\d+[.)]?\s*)?(?:references|bibliography|literature cited|works cited)\b",
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class SectionSummary:
@@ -37,6 +119,59 @@ class SectionSummary:
     category: str
 
 
+@dataclass
+class ManuscriptMetrics:
+    """Everything measured in one pass over a manuscript.
+
+    ``figures`` and ``tables`` count distinct "Figure n"/"Table n" numbers
+    mentioned or captioned in the text, or the figure/table objects found by
+    the parser when that is larger. ``references`` counts the entries under a
+    References/Bibliography heading.
+    """
+
+    sections: List[SectionSummary]
+    total_words: int = 0
+    title: Optional[str] = None
+    figures: int = 0
+    figure_captions: int = 0
+    tables: int = 0
+    table_captions: int = 0
+    references: int = 0
+
+    @property
+    def title_chars(self) -> Optional[int]:
+        return len(self.title) if self.title is not None else None
+
+    @property
+    def display_items(self) -> int:
+        return self.figures + self.tables
+
+    @classmethod
+    def from_sections(cls, sections: Sequence[SectionSummary]) -> "ManuscriptMetrics":
+        """Wrap bare section summaries; other metrics are left at zero."""
+
+        sections = list(sections)
+        return cls(sections=sections, total_words=sum(s.word_count for s in sections))
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ManuscriptMetrics":
+        fields = dict(data)
+        fields["sections"] = [SectionSummary(**s) for s in data.get("sections", [])]
+        return cls(**fields)
+
+
+@dataclass
+class JournalMatch:
+    """A guideline ranked by the estimated cost of fitting it."""
+
+    guideline: Guideline
+    cost: int
+    changes: List[str]
+
+
 @dataclass
 class AnalysisResult:
     """Result of analysing a manuscript against journal guidelines."""
@@ -46,40 +181,129 @@ class AnalysisResult:
     categories: Set[str]
     accepted_journals: List[str]
     required_changes: Dict[str, List[str]]
+    metrics: Optional[ManuscriptMetrics] = None
 
 
-def _is_heading(paragraph) -> bool:
-    style = paragraph.style.name if paragraph.style else ""
-    return style.lower().startswith("heading")
+def register_section_keywords(
+    table: Dict[str, str], priorities: Sequence[str] = ()
+) -> None:
+    """Extend the section keyword table used for categorisation.
+
+    ``table`` maps keywords to categories, e.g. one of
+    :data:`SECTION_KEYWORDS_I18N` or a user-supplied mapping. New categories
+    rank after the built-in ones unless listed in ``priorities``.
+
+    Cached analyses and compiled guideline sets built with the previous
+    keywords are not reused afterwards (see :func:`analysis_version`).
+    """
+
+    SECTION_MATCHER.extend(table, priorities)
 
 
 def categorize_section(title: str) -> str:
     """Return a normalised section category inferred from ``title``."""
 
-    lowered = title.lower()
-    for key, category in SECTION_KEYWORDS.items():
-        if key in lowered:
-            return category
-    return "Other"
+    return SECTION_MATCHER.categorize(title)
 
 
-def parse_docx_sections(path: Path) -> List[SectionSummary]:
-    """Parse a ``.docx`` file into section summaries.
+def register_parser(
+    fmt: str, parser: Union[str, Callable[[Path], Iterator[Block]]]
+) -> None:
+    """Register a block parser for files with suffix ``fmt``.
 
-    Sections are defined as the text between heading paragraphs.
+    ``parser`` is either a callable taking a path or the dotted name of a
+    module exposing ``iter_blocks(path)``, imported only when needed.
     """
 
-    document = Document(path)
-    sections: List[SectionSummary] = []
-    current_title: Optional[str] = None
-    word_count = 0
+    PARSERS[fmt.lower().lstrip(".")] = parser
+
 
-    for paragraph in document.paragraphs:
+def detect_format(path: Path) -> str:
+    """Return the manuscript format of ``path`` from its suffix or content."""
+
+    suffix = Path(path).suffix.lower().lstrip(".")
+    if suffix in PARSERS:
+        return suffix
+
+    with open(path, "rb") as f:
+        head = f.read(4096)
+    if head.startswith(b"PK\x03\x04"):
+        with zipfile.ZipFile(path) as archive:
+            names = set(archive.namelist())
+            if "word/document.xml" in names:
+                return "docx"
+            if "mimetype" in names and archive.read("mimetype").startswith(
+                b"application/vnd.oasis.opendocument.text"
+            ):
+                return "odt"
+        raise ValueError(f"Unsupported manuscript archive: {path}")
+    text = head.decode("utf-8", errors="ignore")
+    if re.search(r"\\(documentclass|section\*?\{|begin\{document\})", text):
+        return "tex"
+    if re.search(r"^#{1,6}\s", text, flags=re.MULTILINE):
+        return "md"
+    return "txt"
+
+
+def iter_blocks(path: Path, fmt: Optional[str] = None) -> Iterator[Block]:
+    """Stream ``(kind, text)`` blocks from a manuscript in any registered format."""
+
+    fmt = fmt or detect_format(path)
+    try:
+        parser = PARSERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unsupported manuscript format: {fmt}") from None
+    if isinstance(parser, str):
+        parser = import_module(parser).iter_blocks
+    return parser(Path(path))
+
+
+def _iter_python_docx_blocks(path: Path) -> Iterator[Block]:
+    """Yield ``(kind, text)`` blocks using the full python-docx object model."""
+
+    from docx import Document
+
+    for paragraph in Document(path).paragraphs:
         text = paragraph.text.strip()
         if not text:
             continue
+        style = ((paragraph.style.name or "") if paragraph.style else "").lower()
+        if style.startswith("heading"):
+            yield HEADING, text
+        else:
+            yield (TITLE if style == "title" else PARAGRAPH), text
+
+
+def collect_metrics(blocks: Iterable[Block]) -> ManuscriptMetrics:
+    """Fold a stream of ``(kind, text)`` blocks into :class:`ManuscriptMetrics`.
+
+    Section word counts, the title, figure/table mentions and captions and
+    reference-list entries are all gathered in the same single pass.
+    """
+
+    sections: List[SectionSummary] = []
+    current_title: Optional[str] = None
+    in_references = False
+    word_count = 0
+    total_words = 0
+    title: Optional[str] = None
+    figure_numbers: Set[str] = set()
+    table_numbers: Set[str] = set()
+    figure_captions: Set[str] = set()
+    table_captions: Set[str] = set()
+    figure_objects = table_objects = references = 0
+
+    for kind, text in blocks:
+        if kind == FIGURE:
+            figure_objects += 1
+            continue
+        if kind == TABLE:
+            table_objects += 1
+            continue
 
-        if _is_heading(paragraph):
+        words = len(text.split())
+        total_words += words
+        if kind == HEADING:
             if current_title is not None:
                 sections.append(
                     SectionSummary(
@@ -89,22 +313,101 @@ def parse_docx_sections(path: Path) -> List[SectionSummary]:
                     )
                 )
             current_title = text
+            in_references = bool(_REFERENCE_HEADING.match(text))
             word_count = 0
-        else:
-            word_count += len(text.split())
+            continue
+
+        word_count += words
+        if kind == TITLE and title is None:
+            title = text
+        if in_references:
+            references += 1
+            continue
+        caption = _CAPTION.match(text)
+        if caption:
+            (figure_captions if caption.group(1) else table_captions).add(caption.group(2))
+        figure_numbers.update(_FIGURE_MENTION.findall(text))
+        table_numbers.update(_TABLE_MENTION.findall(text))
 
     if current_title is None:
-        total_words = sum(len(p.text.split()) for p in document.paragraphs if p.text.strip())
-        return [SectionSummary(title="Document", word_count=total_words, category="Other")]
-
-    sections.append(
-        SectionSummary(
-            title=current_title,
-            word_count=word_count,
-            category=categorize_section(current_title),
+        sections = [SectionSummary(title="Document", word_count=total_words, category="Other")]
+    else:
+        sections.append(
+            SectionSummary(
+                title=current_title,
+                word_count=word_count,
+                category=categorize_section(current_title),
+            )
         )
+
+    return ManuscriptMetrics(
+        sections=sections,
+        total_words=total_words if current_title is None else sum(s.word_count for s in sections),
+        title=title,
+        figures=max(len(figure_numbers | figure_captions), figure_objects),
+        figure_captions=len(figure_captions),
+        tables=max(len(table_numbers | table_captions), table_objects),
+        table_captions=len(table_captions),
+        references=references,
     )
-    return sections
+
+
+def parse_metrics(
+    path: Path,
+    fmt: Optional[str] = None,
+    use_cache: bool = True,
+    blocks: Optional[Iterable[Block]] = None,
+) -> ManuscriptMetrics:
+    """Measure a manuscript in a single streamed pass.
+
+    The format is taken from ``fmt``, the file suffix or the file content (see
+    :data:`PARSERS`). Results are looked up in and stored to the on-disk
+    analysis cache unless ``use_cache`` is false. ``blocks`` already read
+    from ``path`` are measured on a cache miss instead of reading it again.
+    """
+
+    fmt = fmt or detect_format(path)
+    cache = key = None
+    if use_cache:
+        from .cache import default_cache
+
+        cache = default_cache()
+        key = cache.key_for(Path(path), f"{analysis_version()}:{fmt}")
+        cached = cache.get(key)
+        if cached is not None:
+            return ManuscriptMetrics.from_dict(cached)
+
+    metrics = collect_metrics(blocks if blocks is not None else iter_blocks(path, fmt))
+
+    if cache is not None and key is not None:
+        cache.put(key, metrics.to_dict())
+    return metrics
+
+
+def parse_sections(
+    path: Path, fmt: Optional[str] = None, use_cache: bool = True
+) -> List[SectionSummary]:
+    """Parse a manuscript into section summaries.
+
+    Sections are defined as the text between headings; see
+    :func:`parse_metrics` for format detection and caching.
+    """
+
+    return parse_metrics(path, fmt, use_cache).sections
+
+
+def parse_docx_sections(
+    path: Path, streaming: bool = True, use_cache: bool = True
+) -> List[SectionSummary]:
+    """Parse a ``.docx`` file into section summaries.
+
+    By default the document XML is streamed via :func:`parse_sections`; pass
+    ``streaming=False`` to go through the python-docx object model instead.
+    """
+
+    if streaming:
+        return parse_sections(path, fmt="docx", use_cache=use_cache)
+    return collect_metrics(_iter_python_docx_blocks(path)).sections
 
 
 def _parse_word_limit(limit: Optional[str]) -> Optional[int]:
@@ -116,84 +419,356 @@ def _parse_word_limit(limit: Optional[str]) -> Optional[int]:
     return int(match.group(1).replace(",", ""))
 
 
-def _required_categories(structure: Optional[str]) -> Set[str]:
-    if not structure:
-        return set()
-    lower = structure.lower()
-    categories: Set[str] = set()
-    for key, category in SECTION_KEYWORDS.items():
-        if key in lower:
-            categories.add(category)
-    return categories
+_COUNT = re.compile(
+    r"(?P<below>\b(?:less|fewer) than\s+)?(?P<n>\d[\d,]*)(?:\s*[-–]\s*(?P<upper>\d[\d,]*))?",
+    re.IGNORECASE,
+)
 
 
-def _journal_fit(
-    guideline: Guideline,
-    sections: Sequence[SectionSummary],
-    categories: Set[str],
-    total_words: int,
-) -> tuple[bool, List[str]]:
-    changes: List[str] = []
-    required_sections = _required_categories(guideline.structure)
-    missing = sorted(required_sections - categories)
-    if missing:
-        changes.append(
-            "Add sections covering: " + ", ".join(missing)
-        )
+def _parse_count_limit(limit: Optional[str]) -> Optional[int]:
+    """Return the first count in ``limit`` as an inclusive maximum.
+
+    Like :func:`_parse_word_limit` the first number is the limit, so later
+    clauses ("... more than 250 total references") are ignored. A range
+    gives its upper bound ("3–5 display items" -> 5) and "less than N"
+    gives ``N - 1``.
+    """
+    if not limit:
+        return None
+    match = _COUNT.search(limit)
+    if not match:
+        return None
+    value = int((match.group("upper") or match.group("n")).replace(",", ""))
+    if match.group("below"):
+        value -= 1
+    return value
+
+
+# "display items", "figures or tables", "figures and/or tables": one limit
+# shared by figures and tables.
+_COMBINED = re.compile(
+    r"display\s+items?|figures?\s+(?:and/)?or\s+tables?|tables?\s+(?:and/)?or\s+figures?",
+    re.IGNORECASE,
+)
+# A count of tables on its own, e.g. the "3 tables" in "8 figures and 3 tables".
+_TABLE_COUNT = re.compile(r"(\d[\d,]*)\s+(?:[\w-]+\s+)?tables?\b", re.IGNORECASE)
 
-    limit = _parse_word_limit(guideline.word_limit)
-    if limit is not None and total_words > limit:
-        changes.append(
-            f"Reduce word count by {total_words - limit} to meet {limit}-word limit"
-        )
 
-    abstract_limit = _parse_word_limit(guideline.abstract_limit)
-    if abstract_limit is not None:
-        abstract_words = next(
-            (section.word_count for section in sections if section.category == "Abstract"),
-            0,
+def _parse_display_limit(limit: Optional[str]) -> Tuple[Optional[int], Optional[int], bool]:
+    """Split a figure limit into ``(figures, tables, combined)``.
+
+    With ``combined`` the first count covers figures and tables together
+    ("Up to 8 display items"); otherwise it covers figures only and a
+    separate table count, if any, is returned as ``tables``
+    ("Up to 8 figures and 3 tables" -> ``(8, 3, False)``).
+    """
+    if not limit:
+        return None, None, False
+    if _COMBINED.search(limit):
+        return _parse_count_limit(limit), None, True
+    tables = _TABLE_COUNT.search(limit)
+    return (
+        _parse_count_limit(limit),
+        int(tables.group(1).replace(",", "")) if tables else None,
+        False,
+    )
+
+
+# Sentinel stored in limit arrays for guidelines without that limit.
+NO_LIMIT = -1
+
+# Edit-cost weights, in words, used to rank guidelines by closeness.
+SECTION_EDIT_COST = 300
+FIGURE_EDIT_COST = 250
+REFERENCE_EDIT_COST = 20
+
+
+def _category_mask(categories: Iterable[str]) -> int:
+    mask = 0
+    for category in categories:
+        mask |= SECTION_MATCHER.bit(category)
+    return mask
+
+
+class CompiledGuidelineSet:
+    """A guideline catalog with limits and required sections parsed once.
+
+    Word, abstract, title, figure, table and reference limits are stored as
+    integer arrays (``NO_LIMIT`` when a guideline has none) and required
+    section categories as bitmasks, so a manuscript is checked against the
+    whole catalog with a handful of passes over flat arrays instead of
+    re-parsing the free-text fields per guideline.
+    """
+
+    def __init__(self, guidelines: Iterable[Guideline]):
+        self.guidelines: List[Guideline] = list(guidelines)
+        self.word_limits = array(
+            "q", (_limit_or_sentinel(g.word_limit) for g in self.guidelines)
+        )
+        self.abstract_limits = array(
+            "q", (_limit_or_sentinel(g.abstract_limit) for g in self.guidelines)
+        )
+        self.title_limits = array(
+            "q", (_limit_or_sentinel(g.title_limit) for g in self.guidelines)
+        )
+        display = [_parse_display_limit(g.figure_limit) for g in self.guidelines]
+        self.figure_limits = array(
+            "q", (NO_LIMIT if figures is None else figures for figures, _, _ in display)
+        )
+        self.table_limits = array(
+            "q", (NO_LIMIT if tables is None else tables for _, tables, _ in display)
+        )
+        # Whether the figure limit covers tables too ("display items").
+        self.figure_limit_includes_tables = [combined for _, _, combined in display]
+        self.reference_limits = array(
+            "q",
+            (_limit_or_sentinel(g.reference_limit, _parse_count_limit) for g in self.guidelines),
         )
-        if abstract_words > abstract_limit:
+        self.required_masks: List[int] = [
+            SECTION_MATCHER.mask(g.structure or "") for g in self.guidelines
+        ]
+        # Section keywords the masks were computed with.
+        self.keywords = SECTION_MATCHER.fingerprint
+        self._missing_messages: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.guidelines)
+
+    def _missing_message(self, mask: int) -> str:
+        message = self._missing_messages.get(mask)
+        if message is None:
+            missing = sorted(SECTION_MATCHER.names(mask))
+            message = "Add sections covering: " + ", ".join(missing)
+            self._missing_messages[mask] = message
+        return message
+
+    def _changes(self, index: int, m: "_Measures") -> List[str]:
+        changes: List[str] = []
+        missing = self.required_masks[index] & ~m.present
+        if missing:
+            changes.append(self._missing_message(missing))
+        limit = self.word_limits[index]
+        over = _over(m.total_words, limit)
+        if over:
+            changes.append(f"Reduce word count by {over} to meet {limit}-word limit")
+        limit = self.abstract_limits[index]
+        over = _over(m.abstract_words, limit)
+        if over:
             changes.append(
-                (
-                    "Abstract exceeds limit: "
-                    f"{abstract_words}/{abstract_limit} words (reduce by {abstract_words - abstract_limit})"
-                )
+                f"Abstract exceeds limit: {m.abstract_words}/{limit} words (reduce by {over})"
+            )
+        limit = self.title_limits[index]
+        over = _over(m.title_chars, limit)
+        if over:
+            changes.append(f"Shorten title by {over} characters to meet {limit}-character limit")
+        limit = self.figure_limits[index]
+        with_tables = self.figure_limit_includes_tables[index]
+        over = _over(m.display_items if with_tables else m.figures, limit)
+        if over:
+            items = "display items (figures and tables)" if with_tables else "figures"
+            changes.append(f"Reduce {items} by {over} to meet limit of {limit}")
+        limit = self.table_limits[index]
+        over = _over(m.tables, limit)
+        if over:
+            changes.append(f"Reduce tables by {over} to meet limit of {limit}")
+        limit = self.reference_limits[index]
+        over = _over(m.references, limit)
+        if over:
+            changes.append(f"Reduce references by {over} to meet {limit}-reference limit")
+        return changes
+
+    def edit_cost(self, index: int, m: "_Measures") -> int:
+        """Estimate the work, in words, to fit guideline ``index``.
+
+        Words, abstract words and title characters over the limit count one
+        each; missing sections, surplus figures and surplus references are
+        weighted by :data:`SECTION_EDIT_COST`, :data:`FIGURE_EDIT_COST` (also
+        used for tables) and :data:`REFERENCE_EDIT_COST`.
+        """
+
+        figures = m.display_items if self.figure_limit_includes_tables[index] else m.figures
+        return (
+            bin(self.required_masks[index] & ~m.present).count("1") * SECTION_EDIT_COST
+            + _over(m.total_words, self.word_limits[index])
+            + _over(m.abstract_words, self.abstract_limits[index])
+            + _over(m.title_chars, self.title_limits[index])
+            + _over(figures, self.figure_limits[index]) * FIGURE_EDIT_COST
+            + _over(m.tables, self.table_limits[index]) * FIGURE_EDIT_COST
+            + _over(m.references, self.reference_limits[index]) * REFERENCE_EDIT_COST
+        )
+
+    def evaluate(
+        self, manuscript: Union[ManuscriptMetrics, Sequence[SectionSummary]]
+    ) -> List[List[str]]:
+        """Return the change requests for every guideline, in catalog order.
+
+        ``manuscript`` is a :class:`ManuscriptMetrics` record or, for word and
+        section checks only, a list of section summaries.
+        """
+
+        measures = _Measures.of(manuscript)
+        return [self._changes(index, measures) for index in range(len(self.guidelines))]
+
+    def rank(
+        self,
+        manuscript: Union[ManuscriptMetrics, Sequence[SectionSummary]],
+        k: int = 10,
+        journal_prefix: Optional[str] = None,
+        article_type: Optional[str] = None,
+    ) -> List["JournalMatch"]:
+        """Return the ``k`` guidelines with the lowest :meth:`edit_cost`.
+
+        ``journal_prefix`` (case-insensitive prefix of the journal name) and
+        ``article_type`` (case-insensitive substring) filter the catalog before
+        scoring. Only costs are computed for the whole catalog; change
+        messages are built for the ``k`` matches returned. Ties keep catalog
+        order.
+        """
+
+        measures = _Measures.of(manuscript)
+        prefix = journal_prefix.casefold() if journal_prefix else None
+        kind = article_type.casefold() if article_type else None
+        candidates = (
+            index
+            for index, g in enumerate(self.guidelines)
+            if (prefix is None or g.journal.casefold().startswith(prefix))
+            and (kind is None or kind in g.article_type.casefold())
+        )
+        best = heapq.nsmallest(
+            k, ((self.edit_cost(index, measures), index) for index in candidates)
+        )
+        return [
+            JournalMatch(
+                guideline=self.guidelines[index],
+                cost=cost,
+                changes=self._changes(index, measures),
             )
+            for cost, index in best
+        ]
+
+
+def _over(value: int, limit: int) -> int:
+    return value - limit if limit != NO_LIMIT and value > limit else 0
+
+
+@dataclass(frozen=True)
+class _Measures:
+    """The manuscript quantities compared against compiled limits."""
+
+    present: int
+    total_words: int
+    abstract_words: int
+    title_chars: int
+    figures: int
+    tables: int
+    display_items: int
+    references: int
+
+    @classmethod
+    def of(cls, manuscript: Union[ManuscriptMetrics, Sequence[SectionSummary]]) -> "_Measures":
+        metrics = (
+            manuscript
+            if isinstance(manuscript, ManuscriptMetrics)
+            else ManuscriptMetrics.from_sections(manuscript)
+        )
+        sections = metrics.sections
+        return cls(
+            present=_category_mask(
+                {section.category for section in sections if section.category != "Other"}
+            ),
+            total_words=metrics.total_words,
+            abstract_words=next(
+                (section.word_count for section in sections if section.category == "Abstract"),
+                0,
+            ),
+            title_chars=metrics.title_chars or 0,
+            figures=metrics.figures,
+            tables=metrics.tables,
+            display_items=metrics.display_items,
+            references=metrics.references,
+        )
+
+
+def _limit_or_sentinel(
+    limit: Optional[str], parse: Callable[[Optional[str]], Optional[int]] = _parse_word_limit
+) -> int:
+    value = parse(limit)
+    return NO_LIMIT if value is None else value
+
+
+def _compiled(
+    guidelines: Union[Iterable[Guideline], CompiledGuidelineSet, None]
+) -> CompiledGuidelineSet:
+    """Compile ``guidelines``; the default catalog is compiled once per change."""
+
+    if isinstance(guidelines, CompiledGuidelineSet):
+        if guidelines.keywords == SECTION_MATCHER.fingerprint:
+            return guidelines
+        # Section keywords were registered since it was compiled.
+        return CompiledGuidelineSet(guidelines.guidelines)
+    if guidelines is None:
+        return compiled_catalog(guideline_registry())
+    return CompiledGuidelineSet(guidelines)
 
-    return not changes, changes
+
+def compiled_catalog(registry: GuidelineRegistry) -> CompiledGuidelineSet:
+    """Return the registry's catalog compiled for the current section keywords."""
+
+    return registry.derived(f"compiled:{SECTION_MATCHER.fingerprint}", CompiledGuidelineSet)
 
 
 def journal_change_requests(
-    guideline: Guideline, sections: Sequence[SectionSummary]
+    guideline: Guideline,
+    sections: Union[ManuscriptMetrics, Sequence[SectionSummary]],
 ) -> List[str]:
-    """Return change requests for ``guideline`` based on manuscript ``sections``."""
+    """Return change requests for ``guideline`` based on manuscript ``sections``.
 
-    categories = {section.category for section in sections if section.category != "Other"}
-    total_words = sum(section.word_count for section in sections)
-    _, changes = _journal_fit(guideline, sections, categories, total_words)
-    return changes
+    Pass :class:`ManuscriptMetrics` to include title, figure and reference
+    checks.
+    """
+
+    return CompiledGuidelineSet([guideline]).evaluate(sections)[0]
 
 
 def analyze_manuscript(
-    path: Path, guidelines: Optional[Iterable[Guideline]] = None
+    path: Path,
+    guidelines: Union[Iterable[Guideline], CompiledGuidelineSet, None] = None,
+    use_cache: bool = True,
 ) -> AnalysisResult:
-    """Analyse a manuscript file and compare it with journal guidelines."""
+    """Analyse a manuscript file and compare it with journal guidelines.
+
+    ``guidelines`` may be a pre-built :class:`CompiledGuidelineSet` so that
+    repeated analyses reuse the parsed catalog.
+    """
+
+    metrics = parse_metrics(path, use_cache=use_cache)
+    return match_guidelines(metrics, guidelines)
+
 
-    sections = parse_docx_sections(path)
+def match_guidelines(
+    manuscript: Union[ManuscriptMetrics, Sequence[SectionSummary]],
+    guidelines: Union[Iterable[Guideline], CompiledGuidelineSet, None] = None,
+) -> AnalysisResult:
+    """Compare an already parsed manuscript with journal guidelines."""
+
+    metrics = (
+        manuscript
+        if isinstance(manuscript, ManuscriptMetrics)
+        else ManuscriptMetrics.from_sections(manuscript)
+    )
+    sections = metrics.sections
     categories = {section.category for section in sections if section.category != "Other"}
-    total_words = sum(section.word_count for section in sections)
+    total_words = metrics.total_words
 
-    all_guidelines = list(guidelines) if guidelines is not None else load_guidelines()
+    compiled = _compiled(guidelines)
     accepted: List[str] = []
     changes_needed: Dict[str, List[str]] = {}
 
-    for guideline in all_guidelines:
-        fits, changes = _journal_fit(guideline, sections, categories, total_words)
-        if fits:
-            accepted.append(guideline.journal)
-        elif changes:
+    for guideline, changes in zip(compiled.guidelines, compiled.evaluate(metrics)):
+        if changes:
             changes_needed[guideline.journal] = changes
+        else:
+            accepted.append(guideline.journal)
 
     return AnalysisResult(
         sections=sections,
@@ -201,14 +776,43 @@ def analyze_manuscript(
         categories=categories,
         accepted_journals=accepted,
         required_changes=changes_needed,
+        metrics=metrics,
     )
 
 
+def rank_journals(
+    manuscript: Union[ManuscriptMetrics, Sequence[SectionSummary]],
+    guidelines: Union[Iterable[Guideline], CompiledGuidelineSet, None] = None,
+    k: int = 10,
+    journal_prefix: Optional[str] = None,
+    article_type: Optional[str] = None,
+) -> List[JournalMatch]:
+    """Return the ``k`` closest guidelines; see :meth:`CompiledGuidelineSet.rank`."""
+
+    compiled = _compiled(guidelines)
+    return compiled.rank(manuscript, k, journal_prefix=journal_prefix, article_type=article_type)
+
+
 __all__ = [
     "SectionSummary",
     "AnalysisResult",
+    "JournalMatch",
+    "ManuscriptMetrics",
+    "CompiledGuidelineSet",
     "categorize_section",
+    "analysis_version",
+    "compiled_catalog",
+    "register_section_keywords",
+    "PARSERS",
+    "register_parser",
+    "detect_format",
+    "iter_blocks",
+    "collect_metrics",
+    "parse_metrics",
+    "parse_sections",
     "parse_docx_sections",
     "analyze_manuscript",
+    "match_guidelines",
+    "rank_journals",
     "journal_change_requests",
 ]
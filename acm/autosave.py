@@ -0,0 +1,154 @@
+"""Debounced background saving for the manuscript editors.
+
+:class:`Autosaver` owns a sections mapping (as used by
+:func:`acm.manuscript.load_sections`) and a save callback. Editors report
+edits with :meth:`Autosaver.update`; unchanged text is ignored, changed
+sections are marked dirty and one background thread writes them once
+edits pause for ``delay`` seconds (or at least every ``max_delay`` seconds
+during continuous typing). With nothing dirty the thread sleeps and no
+I/O happens. :meth:`Autosaver.close` writes anything outstanding and stops
+the thread.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, MutableMapping, Optional, Set
+
+SAVE_DELAY = 2.0
+MAX_SAVE_DELAY = 10.0
+
+# save(sections, dirty_names) writes the given snapshot of the sections.
+SaveCallback = Callable[[Dict[str, dict], Set[str]], None]
+
+
+class Autosaver:
+    """Track dirty sections and save them from a background thread."""
+
+    def __init__(
+        self,
+        sections: MutableMapping[str, dict],
+        save: SaveCallback,
+        delay: float = SAVE_DELAY,
+        max_delay: float = MAX_SAVE_DELAY,
+    ):
+        self.sections = sections
+        self._save = save
+        self.delay = delay
+        self.max_delay = max(max_delay, delay)
+        self._dirty: Set[str] = set()
+        self._first_edit = 0.0
+        self._last_edit = 0.0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._writing = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="acm-autosave", daemon=True)
+        self._thread.start()
+
+    @property
+    def dirty(self) -> Set[str]:
+        with self._cond:
+            return set(self._dirty)
+
+    def update(self, name: str, text: str) -> bool:
+        """Record the text of section ``name``; return whether it changed."""
+        with self._cond:
+            section = self.sections.setdefault(name, {"text": "", "limit": None})
+            if section.get("text", "") == text:
+                return False
+            section["text"] = text
+            self._mark(name)
+            return True
+
+    def add(self, name: str, limit: Optional[int] = None) -> bool:
+        """Add an empty section unless it exists; return whether it was added."""
+        with self._cond:
+            if name in self.sections:
+                return False
+            self.sections[name] = {"text": "", "limit": limit}
+            self._mark(name)
+            return True
+
+    def mark_dirty(self, name: str) -> None:
+        """Schedule ``name`` for saving after a change made outside :meth:`update`."""
+        with self._cond:
+            self._mark(name)
+
+    def _mark(self, name: str) -> None:
+        now = time.monotonic()
+        if not self._dirty:
+            self._first_edit = now
+        self._last_edit = now
+        self._dirty.add(name)
+        self._cond.notify()
+
+    def flush(self) -> bool:
+        """Save the dirty sections now; return ``False`` if nothing was dirty."""
+        # Writes are serialized so an older snapshot never lands last.
+        with self._writing:
+            with self._cond:
+                if not self._dirty:
+                    return False
+                dirty, self._dirty = self._dirty, set()
+                snapshot = self._snapshot(dirty)
+            try:
+                self._save(snapshot, dirty)
+            except BaseException:
+                with self._cond:
+                    # Keep the sections dirty so the next flush retries them.
+                    self._dirty |= dirty
+                raise
+        return True
+
+    def _snapshot(self, dirty: Set[str]) -> Dict[str, dict]:
+        # Lazily loaded sections (acm.sections.SectionStore) copy only what
+        # is in memory instead of reading every section.
+        snapshot = getattr(self.sections, "snapshot", None)
+        if snapshot is not None:
+            return snapshot(dirty)
+        return {name: dict(data) for name, data in self.sections.items()}
+
+    def _due(self) -> Optional[float]:
+        # Seconds until the pending edits should be written (<= 0: now).
+        if not self._dirty:
+            return None
+        quiet = self._last_edit + self.delay
+        latest = self._first_edit + self.max_delay
+        return min(quiet, latest) - time.monotonic()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    due = self._due()
+                    if due is not None and due <= 0:
+                        break
+                    self._cond.wait(due)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                # A failed write stays dirty and is retried after another delay.
+                with self._cond:
+                    self._first_edit = self._last_edit = time.monotonic()
+
+    def close(self) -> None:
+        """Stop the background thread and save anything still dirty."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+
+    def __enter__(self) -> "Autosaver":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+__all__ = ["Autosaver", "MAX_SAVE_DELAY", "SAVE_DELAY"]
@@ -0,0 +1,108 @@
+"""Parallel analysis of many manuscripts with a process pool."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+import glob
+from pathlib import Path
+import time
+from typing import Iterable, Iterator, List, Optional
+
+from .analysis import PARSERS, CompiledGuidelineSet, analyze_manuscript, compiled_catalog
+from .journal import guideline_registry
+
+# Guideline catalog loaded and compiled once per worker by ``_init_worker``.
+_GUIDELINES: Optional[CompiledGuidelineSet] = None
+
+
+def collect_manuscripts(targets: Iterable[str]) -> List[Path]:
+    """Expand files, directories and glob patterns into manuscript paths.
+
+    Directories are searched recursively for every registered manuscript
+    format. Word lock files (``~$*.docx``) are skipped and each manuscript is
+    listed once, in a stable order.
+    """
+
+    found: List[Path] = []
+    for target in targets:
+        path = Path(target)
+        if path.is_dir():
+            candidates: Iterable[Path] = sorted(
+                p for suffix in PARSERS for p in path.rglob(f"*.{suffix}")
+            )
+        elif glob.has_magic(target):
+            candidates = sorted(Path(p) for p in glob.glob(target, recursive=True))
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            if candidate.name.startswith("~$") or candidate.is_dir():
+                continue
+            found.append(candidate)
+    return list(dict.fromkeys(found))
+
+
+def _init_worker(guidelines_path: Optional[str]) -> None:
+    global _GUIDELINES
+    registry = guideline_registry(Path(guidelines_path) if guidelines_path else None)
+    _GUIDELINES = compiled_catalog(registry)
+
+
+def _analyze_one(path: str, use_cache: bool) -> dict:
+    start = time.perf_counter()
+    result = analyze_manuscript(Path(path), _GUIDELINES, use_cache=use_cache)
+    metrics = result.metrics
+    assert metrics is not None
+    return {
+        "file": path,
+        "ok": True,
+        "total_words": result.total_words,
+        "sections": [asdict(section) for section in result.sections],
+        "accepted_journals": sorted(set(result.accepted_journals)),
+        "required_changes": result.required_changes,
+        "metrics": {
+            "title_chars": metrics.title_chars,
+            "figures": metrics.figures,
+            "tables": metrics.tables,
+            "references": metrics.references,
+        },
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+def analyze_batch(
+    paths: Iterable[Path],
+    workers: Optional[int] = None,
+    guidelines_path: Optional[Path] = None,
+    use_cache: bool = True,
+) -> Iterator[dict]:
+    """Analyse ``paths`` in parallel and yield one record per manuscript.
+
+    Records are yielded as soon as each manuscript finishes, so the order
+    follows completion rather than input order. A manuscript that fails to
+    parse produces a record with ``ok`` set to ``False`` and an ``error``
+    message instead of aborting the run.
+    """
+
+    paths = list(paths)
+    if not paths:
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(str(guidelines_path) if guidelines_path else None,),
+    ) as pool:
+        futures = {pool.submit(_analyze_one, str(path), use_cache): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as exc:  # noqa: BLE001 - report and keep going
+                yield {
+                    "file": str(futures[future]),
+                    "ok": False,
+                    "error": f"{type(exc).__name__}: {exc}",
+                }
+
+
+__all__ = ["collect_manuscripts", "analyze_batch"]
@@ -0,0 +1,187 @@
+"""Content-addressed on-disk cache for manuscript analysis results."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import sqlite3
+import time
+import warnings
+from typing import Dict, Iterator, Optional
+
+CACHE_ENV = "ACM_CACHE_DIR"
+MAX_BYTES_ENV = "ACM_CACHE_MAX_BYTES"
+CACHE_FILE = "analysis.sqlite3"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_CHUNK = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+def cache_dir() -> Path:
+    """Return the cache directory (``$ACM_CACHE_DIR`` or the user cache dir)."""
+    override = os.environ.get(CACHE_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "acm"
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of the bytes of ``path``."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    path: Path
+    entries: int
+    size: int
+    max_bytes: int
+    hits: int
+
+
+class AnalysisCache:
+    """SQLite-backed store of JSON payloads with size-bounded LRU eviction.
+
+    Entries are keyed by the digest of a manuscript's bytes plus the parser
+    version, so edits or parser changes simply miss. The cache is
+    best-effort: database errors are swallowed and treated as misses.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or cache_dir()
+        self.path = self.directory / CACHE_FILE
+        self.max_bytes = max_bytes
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                conn.execute(_SCHEMA)
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def key_for(path: Path, version: str) -> str:
+        return f"{file_digest(path)}:{version}"
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the payload stored under ``key`` and mark it recently used."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT payload FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE entries SET last_used = ?, hits = hits + 1 WHERE key = ?",
+                    (time.time(), key),
+                )
+            return json.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError):
+            return None
+
+    def put(self, key: str, payload: Dict) -> None:
+        """Store ``payload`` under ``key`` and evict old entries past the limit."""
+        text = json.dumps(payload)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, payload, size, created, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, text, len(text.encode("utf-8")), now, now),
+                )
+                self._evict(conn, self.max_bytes)
+        except (sqlite3.Error, OSError):
+            pass
+
+    @staticmethod
+    def _evict(conn: sqlite3.Connection, max_bytes: int) -> int:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= max_bytes:
+            return 0
+        removed = 0
+        rows = conn.execute("SELECT key, size FROM entries ORDER BY last_used ASC").fetchall()
+        for key, size in rows:
+            if total <= max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            removed += 1
+        return removed
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """Evict least recently used entries until under ``max_bytes``.
+
+        Returns the number of removed entries. ``max_bytes=0`` clears the cache.
+        """
+        if not self.path.exists():
+            return 0
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        with self._connect() as conn:
+            removed = self._evict(conn, limit)
+        if removed:
+            with self._connect() as conn:
+                conn.execute("VACUUM")
+        return removed
+
+    def stats(self) -> CacheStats:
+        entries = size = hits = 0
+        if self.path.exists():
+            with self._connect() as conn:
+                entries, size, hits = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM entries"
+                ).fetchone()
+        return CacheStats(
+            path=self.path, entries=entries, size=size, max_bytes=self.max_bytes, hits=hits
+        )
+
+
+def default_cache() -> AnalysisCache:
+    """Return the cache stored in :func:`cache_dir`.
+
+    The size bound defaults to 64 MiB and can be set with
+    ``$ACM_CACHE_MAX_BYTES``; a value that is not a byte count is ignored
+    with a warning.
+    """
+    raw = os.environ.get(MAX_BYTES_ENV)
+    max_bytes = DEFAULT_MAX_BYTES
+    if raw:
+        try:
+            max_bytes = int(raw)
+            if max_bytes < 0:
+                raise ValueError(raw)
+        except ValueError:
+            warnings.warn(
+                f"Ignoring ${MAX_BYTES_ENV}={raw!r}: not a byte count; "
+                f"using {DEFAULT_MAX_BYTES} bytes",
+                stacklevel=2,
+            )
+            max_bytes = DEFAULT_MAX_BYTES
+    return AnalysisCache(cache_dir(), max_bytes=max_bytes)
+
+
+__all__ = ["AnalysisCache", "CacheStats", "cache_dir", "default_cache", "file_digest"]
@@ -1,82 +1,90 @@
+import json
 from pathlib import Path
+import shutil
 import subprocess
 import sys
+import time
+import warnings
+from typing import Iterable, List, Tuple
 
 import typer
 from .domain import ArticleProject, TaskNode
-from .progress import render_tree
+from .oplog import LogReplayWarning, OpError, ProjectJournal
+from .storage import FORMATS, save_data
 
 app = typer.Typer(help="Article Checklist Manager CLI")
+cache_app = typer.Typer(help="Inspect and prune the manuscript analysis cache.")
+app.add_typer(cache_app, name="cache")
+guidelines_app = typer.Typer(help="Compile and query the journal guideline catalog.")
+app.add_typer(guidelines_app, name="guidelines")
+manuscript_app = typer.Typer(help="Manage how manuscript sections are stored.")
+app.add_typer(manuscript_app, name="manuscript")
 
 PROJECT_FILE = "acm.yaml"
+# Project file for each on-disk format, in lookup order (see ``acm convert``).
+PROJECT_FILES = {"yaml": PROJECT_FILE, "json": "acm.json", "msgpack": "acm.msgpack"}
 
 
-def load_project(path: Path = Path('.')) -> ArticleProject:
-    file = path / PROJECT_FILE
+def project_file(path: Path = Path('.')) -> Path:
+    """Return the project file in ``path``, whichever format it uses."""
+    for name in PROJECT_FILES.values():
+        file = path / name
+        if file.exists():
+            return file
+    return path / PROJECT_FILE
+
+
+def open_project(path: Path = Path('.')) -> Tuple[ProjectJournal, ArticleProject]:
+    """Return the project's operation journal and its replayed state."""
+    file = project_file(path)
     if not file.exists():
         raise typer.BadParameter(f"Project not initialised: {file} not found")
-    return ArticleProject.from_yaml(file.read_text())
+    journal = ProjectJournal(file)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", LogReplayWarning)
+        project = journal.load()
+    for warning in caught:
+        typer.echo(f"Warning: {warning.message}", err=True)
+    return journal, project
+
+
+def load_project(path: Path = Path('.')) -> ArticleProject:
+    return open_project(path)[1]
 
 
 def save_project(project: ArticleProject, path: Path = Path('.')) -> None:
-    file = path / PROJECT_FILE
-    file.write_text(project.to_yaml())
+    """Write a full snapshot of ``project`` and reset its operation log."""
+    ProjectJournal(project_file(path)).compact(project)
+
+
+def _page(lines: Iterable[str]) -> None:
+    """Show ``lines`` through the user's pager."""
+    try:
+        from click import echo_via_pager
+    except ImportError:  # typer releases that bundle their own copy of click
+        import pydoc
+
+        pydoc.pager("\n".join(lines))
+        return
+    echo_via_pager(f"{line}\n" for line in lines)
 
 
 def ensure_task(project: ArticleProject, path: str) -> TaskNode:
-    parts = [p for p in path.split('/') if p]
-    tasks = project.checklist.tasks
-    node: TaskNode | None = None
-    for part in parts:
-        for t in tasks:
-            if t.item == part:
-                node = t
-                break
-        else:
-            node = TaskNode(item=part)
-            tasks.append(node)
-        tasks = node.subtasks
-    assert node is not None
-    return node
+    return project.checklist.ensure(path)
 
 
 def find_task(project: ArticleProject, path: str) -> TaskNode:
-    parts = [p for p in path.split('/') if p]
-    tasks = project.checklist.tasks
-    node: TaskNode | None = None
-    for part in parts:
-        for t in tasks:
-            if t.item == part:
-                node = t
-                tasks = t.subtasks
-                break
-        else:
-            raise typer.BadParameter(f"Task path not found: {'/'.join(parts)}")
-    assert node is not None
-    return node
-
-
-def find_parent(tasks, parts):
-    parent = None
-    idx = None
-    current = tasks
-    for part in parts:
-        for i, t in enumerate(current):
-            if t.item == part:
-                parent = current
-                idx = i
-                current = t.subtasks
-                break
-        else:
-            raise typer.BadParameter(f"Task path not found: {'/'.join(parts)}")
-    return parent, idx
+    try:
+        return project.checklist.find(path)
+    except KeyError as e:
+        raise typer.BadParameter(e.args[0]) from None
 
 
 @app.command()
 def init(project_name: str = typer.Option(None, help="Name of the project. Defaults to the current directory name.")):
     """Initialize a new article project in the current folder."""
     path = Path('.')
-    if (path / PROJECT_FILE).exists():
+    if project_file(path).exists():
         raise typer.BadParameter(f"Project already initialised at {path.resolve()}")
 
     if project_name is None:
@@ -96,71 +104,257 @@ def init(project_name: str = typer.Option(None, help="Name of the project. Defau
         TaskNode(item="Figures & Tables"),
         TaskNode(item="References"),
     ]
-    (path / PROJECT_FILE).write_text(project.to_yaml())
+    save_project(project, path)
     typer.echo(f"Initialised project '{project_name}' at {path.resolve()}")
 
 
 @app.command()
-def status():
+def status(
+    max_depth: int = typer.Option(
+        None, "--max-depth", min=0, help="Hide tasks below this depth (0 = project only)."
+    ),
+    collapse_done: bool = typer.Option(
+        False, "--collapse-done", help="Hide the subtasks of finished tasks."
+    ),
+    width: int = typer.Option(
+        None, "--width", min=20, help="Truncate lines to this width; defaults to the terminal's."
+    ),
+    page: bool = typer.Option(False, "--page", help="Show the tree through a pager."),
+    watch: bool = typer.Option(
+        False, "--watch", "-w", help="Keep the status on screen and update it as files change."
+    ),
+    interval: float = typer.Option(
+        1.0, "--interval", min=0.1, help="Seconds between checks for changes with --watch."
+    ),
+):
     """Show current checklist status."""
-    project = load_project()
-    root = TaskNode(item=project.name, subtasks=project.checklist.tasks)
-    typer.echo(render_tree(root.to_progress_node()))
+    from .render import iter_lines
+
+    tty = sys.stdout.isatty()
+
+    def lines(columns=width):
+        project = load_project()
+        return iter_lines(
+            project.checklist,
+            name=project.name,
+            max_depth=max_depth,
+            collapse_done=collapse_done,
+            width=columns,
+        )
+
+    if watch:
+        from .manuscript import SECTIONS_FILE
+        from .sections import SECTIONS_DIR
+        from .watch import Screen, fit_screen, manuscript_lines, watch as run_watch
+
+        def frame() -> List[str]:
+            columns, rows = shutil.get_terminal_size() if tty else (width, None)
+            columns = width or columns
+            return fit_screen(
+                list(lines(columns)) + manuscript_lines(Path('.'), width=columns), rows
+            )
+
+        file = project_file()
+        # Section files are replaced by rename, which updates the directory.
+        paths = [file, ProjectJournal(file).log_path, Path(SECTIONS_FILE), Path(SECTIONS_DIR)]
+        # A resized terminal redraws at the next poll.
+        size = shutil.get_terminal_size if tty else None
+        run_watch(frame, paths, Screen(), interval=interval, size=size)
+        return
+
+    if width is None and tty:
+        width = shutil.get_terminal_size().columns
+    if page:
+        _page(lines(width))
+        return
+    for line in lines(width):
+        typer.echo(line)
+
+
+@app.command()
+def query(
+    pattern: str = typer.Argument(
+        None, help="Shell-style pattern for task names, or for paths if it contains '/'."
+    ),
+    leaves: bool = typer.Option(False, "--leaves", help="Only tasks without subtasks."),
+    incomplete: bool = typer.Option(
+        False, "--incomplete", help="Only unfinished tasks; finished subtrees are skipped."
+    ),
+    below: float = typer.Option(
+        None, "--below", min=0, max=100, help="Only tasks under this percent."
+    ),
+    breadth: bool = typer.Option(False, "--breadth", help="List level by level."),
+    max_depth: int = typer.Option(
+        None, "--max-depth", min=0, help="Do not descend below this depth (0 = top level)."
+    ),
+    limit: int = typer.Option(None, "--limit", "-n", min=1, help="Stop after N results."),
+    as_json: bool = typer.Option(False, "--json", help="Print one JSON object per line."),
+):
+    """List tasks matching filters, streaming results as they are found."""
+    q = load_project().checklist.query()
+    if breadth:
+        q = q.breadth_first()
+    if max_depth is not None:
+        q = q.max_depth(max_depth)
+    if incomplete:
+        q = q.incomplete()
+    if leaves:
+        q = q.leaves()
+    if below is not None:
+        q = q.below(below)
+    if pattern:
+        q = q.matching(pattern)
+    if limit is not None:
+        q = q.limit(limit)
+    for entry in q:
+        pct = entry.percent()
+        if as_json:
+            typer.echo(json.dumps({"path": entry.path_str, "percent": pct, "done": entry.node.done}))
+        else:
+            typer.echo(f"{pct:6.2f}%  {entry.path_str}")
 
 
 @app.command()
 def check(task: str, percent: int = typer.Option(None, "--percent", min=0, max=100), done: bool = typer.Option(False, "--done")):
     """Mark a task as done or update percentage."""
-    project = load_project()
+    journal, project = open_project()
+    op: dict = {"op": "set", "path": task}
+    if done:
+        op["done"] = True
+    if percent is not None:
+        op["percent"] = percent
     try:
-        node = find_task(project, task)
-    except typer.BadParameter as e:
+        journal.record(project, op)
+    except OpError as e:
         typer.echo(e)
         return
-    if done:
-        node.done = True
-    if percent is not None:
-        node.percent = percent
-    save_project(project)
     typer.echo(f"Updated {task}")
 
 
 @app.command()
 def uncheck(task: str):
     """Mark a task as not done."""
-    project = load_project()
+    journal, project = open_project()
     try:
-        node = find_task(project, task)
-        node.done = False
-        node.percent = None
-        save_project(project)
+        journal.record(project, {"op": "set", "path": task, "done": False, "percent": None})
         typer.echo(f"Unchecked {task}")
-    except typer.BadParameter as e:
+    except OpError as e:
         typer.echo(e)
 
 
 @app.command()
 def rename(task: str, new_name: str):
     """Rename a task."""
-    project = load_project()
-    node = find_task(project, task)
-    node.item = new_name
-    save_project(project)
+    journal, project = open_project()
+    try:
+        journal.record(project, {"op": "rename", "path": task, "item": new_name})
+    except OpError as e:
+        raise typer.BadParameter(str(e)) from None
     typer.echo(f"Renamed {task} -> {new_name}")
 
 
 @app.command()
 def delete(task: str):
     """Delete a task."""
-    project = load_project()
-    parts = [p for p in task.split('/') if p]
+    journal, project = open_project()
     if typer.confirm(f"Are you sure you want to delete '{task}'?"):
-        parent, idx = find_parent(project.checklist.tasks, parts)
-        parent.pop(idx)
-        save_project(project)
+        try:
+            journal.record(project, {"op": "delete", "path": task})
+        except OpError as e:
+            raise typer.BadParameter(str(e)) from None
         typer.echo(f"Deleted '{task}'")
 
 
+@app.command("apply")
+def apply_ops(
+    file: str = typer.Argument("-", help="JSON Lines file of operations; '-' reads stdin."),
+):
+    """Apply many task operations in one load and save.
+
+    Each line is an object such as {"op": "check", "path": "Methods/Stats"}.
+    Operations: check (optionally with "percent"), uncheck, percent, rename
+    (with "item"), delete and add. Failing lines are reported and skipped.
+    """
+    if file != "-" and not Path(file).exists():
+        raise typer.BadParameter(f"File not found: {file}")
+    journal, project = open_project()
+    stream = sys.stdin if file == "-" else open(file, encoding="utf-8")
+    ops: List[dict] = []
+    lines: List[int] = []
+    failures = 0
+    with stream:
+        for lineno, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                ops.append(json.loads(line))
+            except ValueError as e:
+                failures += 1
+                typer.echo(f"line {lineno}: invalid JSON: {e}", err=True)
+                continue
+            lines.append(lineno)
+    errors = journal.record_many(project, ops)
+    for index, error in errors:
+        typer.echo(f"line {lines[index]}: {error}", err=True)
+    failures += len(errors)
+    typer.echo(f"Applied {len(ops) - len(errors)} operations ({failures} failed)")
+    if failures:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def convert(fmt: str = typer.Argument(..., help="Target format: yaml, json or msgpack.")):
+    """Convert the project file to another on-disk format.
+
+    JSON and msgpack load faster than YAML for large checklists; YAML stays
+    the format for hand editing.
+    """
+    fmt = fmt.lower()
+    if fmt not in FORMATS:
+        raise typer.BadParameter(f"Unknown format {fmt!r}; choose from {', '.join(FORMATS)}")
+    source = project_file()
+    if not source.exists():
+        raise typer.BadParameter(f"Project not initialised: {source} not found")
+    target = source.with_name(PROJECT_FILES[fmt])
+    if target == source:
+        typer.echo(f"{source} is already {fmt}")
+        return
+    journal, project = open_project()
+    try:
+        save_data(project.to_dict(), target, fmt)
+    except RuntimeError as e:
+        raise typer.BadParameter(str(e)) from None
+    source.unlink()
+    journal.log_path.unlink(missing_ok=True)
+    typer.echo(f"Converted {source} -> {target}")
+
+
+@app.command()
+def diff(
+    old: Path = typer.Argument(..., help="Earlier project or checklist file."),
+    new: Path = typer.Argument(..., help="Later project or checklist file."),
+    as_json: bool = typer.Option(False, "--json", help="Print the changes as JSON."),
+):
+    """Show added, removed, renamed, moved and updated tasks between two files.
+
+    Exits with status 1 when the checklists differ.
+    """
+    from .diff import diff_checklists, load_checklist
+
+    for file in (old, new):
+        if not file.exists():
+            raise typer.BadParameter(f"File not found: {file}")
+    result = diff_checklists(load_checklist(old), load_checklist(new))
+    if as_json:
+        typer.echo(json.dumps(result.to_dict(), indent=2))
+    else:
+        for change in result.changes:
+            typer.echo(str(change))
+        typer.echo(f"Overall: {result.old_percent:.2f}% -> {result.new_percent:.2f}%")
+    if result:
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def template(journal: str, article_type: str = typer.Option(None)):
     """Generate a journal checklist template."""
@@ -179,31 +373,216 @@ def edit():
 
 
 @app.command("analyze-docx")
-def analyze_docx(file: Path):
-    """Analyse a .docx manuscript and report journal fit."""
+def analyze_docx(
+    file: Path,
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the analysis cache."),
+    snapshot: Path = typer.Option(
+        None,
+        "--snapshot",
+        help="Revision snapshot to compare against; updated after the analysis.",
+    ),
+    top: int = typer.Option(
+        None, "--top", min=1, help="Only list the N journals closest to fitting."
+    ),
+    journal: str = typer.Option(
+        None, "--journal", help="Only consider journals whose name starts with this."
+    ),
+    article_type: str = typer.Option(
+        None, "--article-type", help="Only consider article types containing this."
+    ),
+):
+    """Analyse a manuscript (.docx, .odt, .md, .txt, .tex) and report journal fit."""
 
     if not file.exists():
         raise typer.BadParameter(f"File not found: {file}")
 
-    from .analysis import analyze_manuscript
+    from .analysis import iter_blocks, match_guidelines, parse_metrics, rank_journals
+
+    ranking = top is not None or bool(journal) or bool(article_type)
+    revision = None
+    tracker = None
+    blocks = None
+    if snapshot is not None:
+        from .revisions import RevisionSnapshot, RevisionTracker, analyze_revision
 
-    result = analyze_manuscript(file)
+        previous = RevisionSnapshot.load(snapshot) if snapshot.exists() else None
+        if no_cache or previous is None or not previous.describes(file):
+            # Hash the paragraphs as the metrics stream past: one read for both.
+            tracker = RevisionTracker(file, previous)
+            blocks = tracker.track(iter_blocks(file))
+        else:
+            revision = analyze_revision(file, previous)
+    metrics = parse_metrics(file, use_cache=not no_cache, blocks=blocks)
+    if tracker is not None:
+        revision = tracker.result()
+    if revision is not None:
+        assert snapshot is not None
+        revision.snapshot.save(snapshot)
     typer.echo("Sections:")
-    for section in result.sections:
+    for section in metrics.sections:
         typer.echo(
             f"- {section.title} ({section.category}): {section.word_count} words"
         )
 
-    typer.echo(f"Total words: {result.total_words}")
+    typer.echo(f"Total words: {metrics.total_words}")
+    if metrics.title_chars is not None:
+        typer.echo(f"Title: {metrics.title_chars} characters")
+    typer.echo(
+        f"Figures: {metrics.figures}, tables: {metrics.tables}, "
+        f"references: {metrics.references}"
+    )
+    changed = [d for d in revision.diff if d.status != "unchanged"] if revision else []
+    if changed:
+        typer.echo("Changes since previous version:")
+        for delta in changed:
+            typer.echo(f"- {delta.title} ({delta.status}): +{delta.added}/-{delta.removed} words")
+    if ranking:
+        # Only the k closest guidelines get a change list.
+        matches = rank_journals(
+            metrics,
+            k=top or 10,
+            journal_prefix=journal,
+            article_type=article_type,
+        )
+        typer.echo("Closest journals:")
+        for rank, match in enumerate(matches, start=1):
+            g = match.guideline
+            status = "ready" if not match.changes else f"edit cost {match.cost}"
+            typer.echo(f"{rank}. {g.journal} — {g.article_type} ({status})")
+            for change in match.changes:
+                typer.echo(f"   - {change}")
+        return
+    result = match_guidelines(metrics)
     if result.accepted_journals:
         typer.echo("Journals ready for submission:")
-        for journal in sorted(set(result.accepted_journals)):
-            typer.echo(f"- {journal}")
+        for name in sorted(set(result.accepted_journals)):
+            typer.echo(f"- {name}")
     if result.required_changes:
         typer.echo("Journals needing adjustments:")
-        for journal, changes in result.required_changes.items():
+        for name, changes in result.required_changes.items():
             for change in changes:
-                typer.echo(f"- {journal}: {change}")
+                typer.echo(f"- {name}: {change}")
+
+
+@app.command("analyze-batch")
+def analyze_batch(
+    targets: List[str] = typer.Argument(..., help="Manuscript files, directories or glob patterns."),
+    workers: int = typer.Option(None, "--workers", min=1, help="Worker processes. Defaults to the CPU count."),
+    guidelines: Path = typer.Option(None, "--guidelines", help="Alternative journal guidelines JSON file."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the analysis cache."),
+):
+    """Analyse many manuscripts in parallel, printing one JSON record per line."""
+
+    from .batch import analyze_batch as run_batch, collect_manuscripts
+
+    paths = collect_manuscripts(targets)
+    if not paths:
+        raise typer.BadParameter("No manuscripts found")
+
+    start = time.perf_counter()
+    failures = 0
+    for record in run_batch(
+        paths, workers=workers, guidelines_path=guidelines, use_cache=not no_cache
+    ):
+        typer.echo(json.dumps(record))
+        if not record["ok"]:
+            failures += 1
+            typer.echo(f"Failed: {record['file']}: {record['error']}", err=True)
+
+    elapsed = time.perf_counter() - start
+    rate = len(paths) / elapsed if elapsed else float(len(paths))
+    typer.echo(
+        f"Analysed {len(paths)} manuscripts ({failures} failed) in {elapsed:.2f}s "
+        f"({rate:.1f} files/s)",
+        err=True,
+    )
+    if failures:
+        raise typer.Exit(code=1)
+
+
+@cache_app.command("stats")
+def cache_stats():
+    """Show the location, size and hit count of the analysis cache."""
+    from .cache import default_cache
+
+    stats = default_cache().stats()
+    typer.echo(f"Cache: {stats.path}")
+    typer.echo(f"Entries: {stats.entries}")
+    typer.echo(f"Size: {stats.size} / {stats.max_bytes} bytes")
+    typer.echo(f"Hits: {stats.hits}")
+
+
+@cache_app.command("prune")
+def cache_prune(
+    max_bytes: int = typer.Option(None, "--max-bytes", min=0, help="Target size; defaults to the cache limit."),
+    clear: bool = typer.Option(False, "--all", help="Remove every entry."),
+):
+    """Evict least recently used analyses from the cache."""
+    from .cache import default_cache
+
+    removed = default_cache().prune(0 if clear else max_bytes)
+    typer.echo(f"Removed {removed} cached analyses")
+
+
+@guidelines_app.command("compile")
+def guidelines_compile(
+    source: Path = typer.Argument(None, help="Guideline JSON; defaults to the bundled catalog."),
+    output: Path = typer.Option(
+        None, "--output", "-o", help="Store to write; defaults to SOURCE with a .sqlite3 suffix."
+    ),
+):
+    """Compile a guideline catalog into an indexed SQLite store."""
+    from .guideline_store import compile_guidelines
+    from .journal import GUIDELINES_FILE
+
+    source = source or GUIDELINES_FILE
+    if not source.exists():
+        raise typer.BadParameter(f"File not found: {source}")
+    output = output or source.with_suffix(".sqlite3")
+    count = compile_guidelines(source, output)
+    typer.echo(f"Compiled {count} guidelines to {output}")
+
+
+@guidelines_app.command("search")
+def guidelines_search(
+    query: List[str] = typer.Argument(..., help="Words to look for; prefixes and typos match."),
+    limit: int = typer.Option(10, "--limit", "-n", min=1, help="Maximum results."),
+    guidelines: Path = typer.Option(None, "--guidelines", help="Guideline JSON or compiled store."),
+):
+    """Search journal names, article types and requirements."""
+    from .search import guideline_index
+
+    hits = guideline_index(guidelines).search(" ".join(query), limit=limit)
+    if not hits:
+        typer.echo("No matching guidelines")
+        raise typer.Exit(code=1)
+    for hit in hits:
+        typer.echo(f"{hit.guideline.journal} — {hit.guideline.article_type}")
+
+
+@manuscript_app.command("migrate")
+def manuscript_migrate(
+    to: str = typer.Option(
+        "split", "--to", help="'split' for one file per section, 'single' for manuscript.yaml."
+    ),
+):
+    """Convert manuscript.yaml to per-section files, or back."""
+    from .manuscript import SECTIONS_FILE, join_sections, split_sections
+    from .sections import SECTIONS_DIR
+
+    path = Path('.')
+    if to == "split":
+        convert_sections = split_sections
+    elif to == "single":
+        convert_sections = join_sections
+    else:
+        raise typer.BadParameter(f"Unknown layout {to!r}; choose 'split' or 'single'")
+    try:
+        count = convert_sections(path)
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from None
+    target = f"{SECTIONS_DIR}/" if to == "split" else SECTIONS_FILE
+    typer.echo(f"Moved {count} sections to {target}")
 
 
 @app.command()
@@ -0,0 +1,254 @@
+"""Array-backed checklists for analytics over very large task trees.
+
+:class:`CompactChecklist` stores a checklist as parallel columns, one row
+per task in depth-first (pre-)order: item text, done flag, percent
+(``NaN`` when unset), parent row (``-1`` for top-level tasks) and depth.
+Because a parent always precedes its children, every node's roll-up can be
+computed in one bottom-up pass. With NumPy installed the columns are
+NumPy arrays and the pass is vectorized per tree level; otherwise they are
+stdlib :mod:`array` columns and the pass is a single loop.
+
+The dict/JSON/YAML forms are those of :class:`acm.domain.Checklist` and
+:class:`acm.domain.ArticleProject`, so files round-trip between both
+representations.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+import json
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+from .domain import Checklist
+from .storage import yaml_dump, yaml_load
+
+try:  # optional: vectorized columns and roll-up
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None  # type: ignore[assignment]
+
+NO_PARENT = -1
+
+
+def _columns(done, percent, parent, depth, use_numpy: bool):
+    if use_numpy:
+        return (
+            np.asarray(done, dtype=bool),
+            np.asarray(percent, dtype=np.float64),
+            np.asarray(parent, dtype=np.int64),
+            np.asarray(depth, dtype=np.int32),
+        )
+    return array("b", done), array("d", percent), array("q", parent), array("l", depth)
+
+
+class CompactChecklist:
+    """A checklist held as struct-of-arrays columns in pre-order."""
+
+    def __init__(
+        self,
+        items: Sequence[str] = (),
+        done: Sequence[bool] = (),
+        percent: Sequence[float] = (),
+        parent: Sequence[int] = (),
+        depth: Sequence[int] = (),
+        use_numpy: Optional[bool] = None,
+    ):
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise ImportError("NumPy is required for use_numpy=True")
+        self.use_numpy = use_numpy
+        self.items: List[str] = list(items)
+        self.done, self.percent, self.parent, self.depth = _columns(
+            done, percent, parent, depth, use_numpy
+        )
+        lengths = {len(self.items), len(self.done), len(self.percent), len(self.parent), len(self.depth)}
+        if len(lengths) != 1:
+            raise ValueError("CompactChecklist columns must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    # -- conversion -----------------------------------------------------
+
+    @classmethod
+    def from_dict(cls, data: dict, use_numpy: Optional[bool] = None) -> "CompactChecklist":
+        """Build from :meth:`Checklist.to_dict` data without creating nodes."""
+        if "tasks" not in data:
+            # Legacy section-keyed layout; let Checklist interpret it.
+            return cls.from_checklist(Checklist.from_dict(data), use_numpy)
+        items: List[str] = []
+        done: List[bool] = []
+        percent: List[float] = []
+        parent: List[int] = []
+        depth: List[int] = []
+        stack = [(task, NO_PARENT, 0) for task in reversed(data.get("tasks") or [])]
+        while stack:
+            task, up, level = stack.pop()
+            row = len(items)
+            items.append(task.get("item", ""))
+            done.append(bool(task.get("done", False)))
+            value = task.get("percent")
+            percent.append(math.nan if value is None else float(value))
+            parent.append(up)
+            depth.append(level)
+            child_key = "tasks" if "tasks" in task else "subtasks"
+            stack.extend((sub, row, level + 1) for sub in reversed(task.get(child_key) or []))
+        return cls(items, done, percent, parent, depth, use_numpy)
+
+    @classmethod
+    def from_checklist(
+        cls, checklist: Checklist, use_numpy: Optional[bool] = None
+    ) -> "CompactChecklist":
+        return cls.from_dict(checklist.to_dict(), use_numpy)
+
+    def _percent_value(self, row: int) -> Optional[float]:
+        value = float(self.percent[row])
+        if math.isnan(value):
+            return None
+        return int(value) if value.is_integer() else value
+
+    def to_dict(self) -> dict:
+        """Return the same structure as :meth:`Checklist.to_dict`."""
+        tasks: List[dict] = []
+        rows: List[dict] = []
+        for row, item in enumerate(self.items):
+            data: Dict[str, Any] = {"item": item}
+            if self.done[row]:
+                data["done"] = True
+            value = self._percent_value(row)
+            if value is not None:
+                data["percent"] = value
+            rows.append(data)
+            up = int(self.parent[row])
+            if up == NO_PARENT:
+                tasks.append(data)
+            else:
+                rows[up].setdefault("subtasks", []).append(data)
+        return {"tasks": tasks}
+
+    def to_checklist(self) -> Checklist:
+        return Checklist.from_dict(self.to_dict())
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    @classmethod
+    def from_json(cls, text: str, use_numpy: Optional[bool] = None) -> "CompactChecklist":
+        return cls.from_dict(json.loads(text), use_numpy)
+
+    def to_yaml(self) -> str:
+        return yaml_dump(self.to_dict())
+
+    @classmethod
+    def from_yaml(cls, text: str, use_numpy: Optional[bool] = None) -> "CompactChecklist":
+        return cls.from_dict(yaml_load(text), use_numpy)
+
+    # -- roll-up --------------------------------------------------------
+
+    def rollup(self):
+        """Return every node's effective percent, indexed by row.
+
+        Matches :meth:`acm.domain.TaskNode.computed_percent`: 100 when done,
+        else the explicit percent, else the mean of the children (0 for a
+        leaf).
+        """
+        if self.use_numpy:
+            return self._rollup_numpy()
+        return self._rollup_python()
+
+    def _rollup_numpy(self):
+        n = len(self)
+        own = np.where(self.done, 100.0, self.percent)
+        values = np.where(np.isnan(own), 0.0, own)
+        if n == 0:
+            return values
+        sums = np.zeros(n)
+        counts = np.zeros(n)
+        has_parent = self.parent != NO_PARENT
+        # Group the child rows by depth with one sort instead of scanning
+        # every row once per level.
+        children = np.flatnonzero(has_parent)
+        children = children[np.argsort(self.depth[children], kind="stable")]
+        bounds = np.flatnonzero(np.diff(self.depth[children])) + 1
+        # Deepest level first: a level's values are final once all of its
+        # children have been folded into it.
+        for rows in reversed(np.split(children, bounds)):
+            finished = rows[np.isnan(own[rows])]
+            counted = counts[finished] > 0
+            values[finished[counted]] = sums[finished[counted]] / counts[finished[counted]]
+            parents = self.parent[rows]
+            sums += np.bincount(parents, weights=values[rows], minlength=n)
+            counts += np.bincount(parents, minlength=n)
+        roots = np.flatnonzero(~has_parent)
+        roots = roots[np.isnan(own[roots]) & (counts[roots] > 0)]
+        values[roots] = sums[roots] / counts[roots]
+        return values
+
+    def _rollup_python(self) -> array:
+        n = len(self)
+        values = array("d", bytes(8 * n))
+        sums = [0.0] * n
+        counts = [0] * n
+        # Children follow their parent in pre-order, so walking backwards
+        # finishes every child before its parent.
+        for row in range(n - 1, -1, -1):
+            if self.done[row]:
+                value = 100.0
+            elif not math.isnan(self.percent[row]):
+                value = self.percent[row]
+            elif counts[row]:
+                value = sums[row] / counts[row]
+            else:
+                value = 0.0
+            values[row] = value
+            up = self.parent[row]
+            if up != NO_PARENT:
+                sums[up] += value
+                counts[up] += 1
+        return values
+
+    def computed_percent(self) -> float:
+        """Return the overall percent, the mean of the top-level tasks."""
+        values = self.rollup()
+        roots = [row for row in range(len(self)) if self.parent[row] == NO_PARENT]
+        if not roots:
+            return 0.0
+        return float(sum(values[row] for row in roots) / len(roots))
+
+
+@dataclass
+class CompactProject:
+    """:class:`acm.domain.ArticleProject` with a :class:`CompactChecklist`."""
+
+    name: str
+    checklist: CompactChecklist = field(default_factory=CompactChecklist)
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "checklist": self.checklist.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: dict, use_numpy: Optional[bool] = None) -> "CompactProject":
+        return cls(
+            name=data.get("name", ""),
+            checklist=CompactChecklist.from_dict(data.get("checklist", {}), use_numpy),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    @classmethod
+    def from_json(cls, text: str, use_numpy: Optional[bool] = None) -> "CompactProject":
+        return cls.from_dict(json.loads(text), use_numpy)
+
+    def to_yaml(self) -> str:
+        return yaml_dump(self.to_dict())
+
+    @classmethod
+    def from_yaml(cls, text: str, use_numpy: Optional[bool] = None) -> "CompactProject":
+        return cls.from_dict(yaml_load(text), use_numpy)
+
+
+__all__ = ["CompactChecklist", "CompactProject", "NO_PARENT"]
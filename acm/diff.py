@@ -0,0 +1,224 @@
+"""Structural diff between two checklist snapshots.
+
+Every subtree is summarised by a Merkle digest: a hash of the task's own
+fields and the digests of its subtasks. Two subtrees with equal digests are
+identical, so :func:`diff_checklists` only descends where the digests
+differ and the comparison costs time proportional to what changed (plus
+one linear hashing pass per tree).
+
+Subtasks of matched tasks are paired by item. Unpaired tasks under the
+same parent whose contents (everything but the item) hash the same are
+reported as renamed; unpaired subtrees that reappear identically under a
+different parent are reported as moved. A task that was both renamed and
+edited shows up as removed plus added.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .domain import Checklist, TaskNode
+from .oplog import ProjectJournal
+from .storage import load_data
+
+ADDED, REMOVED, RENAMED, MOVED, CHANGED = "added", "removed", "renamed", "moved", "changed"
+
+Parts = Tuple[str, ...]
+
+
+def _hash(*parts: bytes) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part)
+    return h.digest()
+
+
+def subtree_digests(root: TaskNode) -> Dict[int, Tuple[bytes, bytes]]:
+    """Return ``id(node) -> (digest, body digest)`` for every node under ``root``.
+
+    The body digest covers ``done``, ``percent`` and the subtasks; the digest
+    also covers the item.
+    """
+    digests: Dict[int, Tuple[bytes, bytes]] = {}
+    stack: List[Tuple[TaskNode, bool]] = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if node.subtasks and not expanded:
+            stack.append((node, True))
+            stack.extend((sub, False) for sub in node.subtasks)
+            continue
+        fields = json.dumps([node.done, node.percent]).encode("utf-8")
+        body = _hash(fields, *(digests[id(sub)][0] for sub in node.subtasks))
+        digests[id(node)] = (_hash(node.item.encode("utf-8"), b"\0", body), body)
+    return digests
+
+
+@dataclass
+class Change:
+    """One difference between two checklists.
+
+    ``path`` is the task's path in the old checklist (the new one for
+    additions); ``new_path`` is set for renames and moves. ``old`` and
+    ``new`` hold ``done``/``percent`` for changed tasks.
+    """
+
+    kind: str
+    path: str
+    new_path: Optional[str] = None
+    old: Optional[dict] = None
+    new: Optional[dict] = None
+
+    def to_dict(self) -> dict:
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+    def __str__(self) -> str:
+        if self.kind == ADDED:
+            return f"+ {self.path}"
+        if self.kind == REMOVED:
+            return f"- {self.path}"
+        if self.kind == RENAMED:
+            return f"~ {self.path} -> {self.new_path} (renamed)"
+        if self.kind == MOVED:
+            return f"> {self.path} -> {self.new_path} (moved)"
+        old, new = self.old or {}, self.new or {}
+        parts = [
+            f"{key}: {json.dumps(old.get(key))} -> {json.dumps(new.get(key))}"
+            for key in ("done", "percent")
+            if old.get(key) != new.get(key)
+        ]
+        return f"* {self.path}: {', '.join(parts)}"
+
+
+@dataclass
+class ChecklistDiff:
+    changes: List[Change]
+    old_percent: float
+    new_percent: float
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def to_dict(self) -> dict:
+        return {
+            "changes": [change.to_dict() for change in self.changes],
+            "percent": {"old": self.old_percent, "new": self.new_percent},
+        }
+
+
+def _join(path: Parts) -> str:
+    return "/".join(path)
+
+
+def _fields(node: TaskNode) -> dict:
+    return {"done": node.done, "percent": node.percent}
+
+
+def diff_checklists(old: Checklist, new: Checklist) -> ChecklistDiff:
+    """Return the structural differences from ``old`` to ``new``."""
+    old_digests = subtree_digests(old.root)
+    new_digests = subtree_digests(new.root)
+    edits: List[Change] = []
+    removed: List[Tuple[bytes, Parts]] = []
+    added: List[Tuple[bytes, Parts]] = []
+
+    stack: List[Tuple[TaskNode, TaskNode, Parts, Parts]] = [(old.root, new.root, (), ())]
+    while stack:
+        a, b, a_path, b_path = stack.pop()
+        if old_digests[id(a)][0] == new_digests[id(b)][0]:
+            continue
+        if a_path and _fields(a) != _fields(b):
+            edits.append(Change(CHANGED, _join(a_path), old=_fields(a), new=_fields(b)))
+
+        by_item: Dict[str, List[TaskNode]] = {}
+        for sub in a.subtasks:
+            by_item.setdefault(sub.item, []).append(sub)
+        for same_item in by_item.values():
+            same_item.reverse()
+        pairs: List[Tuple[TaskNode, TaskNode]] = []
+        unmatched_new: List[Tuple[int, TaskNode]] = []
+        for position, sub in enumerate(b.subtasks):
+            matches = by_item.get(sub.item)
+            if matches:
+                pairs.append((matches.pop(), sub))
+            else:
+                unmatched_new.append((position, sub))
+        leftover = {id(sub) for subs in by_item.values() for sub in subs}
+        unmatched_old = [
+            (position, sub) for position, sub in enumerate(a.subtasks) if id(sub) in leftover
+        ]
+
+        # Same contents under a new item: a rename. Empty leaves all look
+        # alike, so prefer the candidate closest to the new position.
+        by_body: Dict[bytes, List[Tuple[int, TaskNode]]] = {}
+        for position, sub in unmatched_old:
+            by_body.setdefault(old_digests[id(sub)][1], []).append((position, sub))
+        for position, sub in unmatched_new:
+            same_body = by_body.get(new_digests[id(sub)][1])
+            if same_body:
+                best = min(same_body, key=lambda c: abs(c[0] - position))
+                same_body.remove(best)
+                renamed = best[1]
+                leftover.discard(id(renamed))
+                edits.append(
+                    Change(RENAMED, _join(a_path + (renamed.item,)), _join(b_path + (sub.item,)))
+                )
+            else:
+                added.append((new_digests[id(sub)][0], b_path + (sub.item,)))
+        removed.extend(
+            (old_digests[id(sub)][0], a_path + (sub.item,))
+            for _, sub in unmatched_old
+            if id(sub) in leftover
+        )
+
+        stack.extend(
+            (x, y, a_path + (x.item,), b_path + (y.item,)) for x, y in reversed(pairs)
+        )
+
+    # Identical subtrees that left one parent and appeared under another.
+    gone: Dict[bytes, List[int]] = {}
+    for index in range(len(removed) - 1, -1, -1):
+        gone.setdefault(removed[index][0], []).append(index)
+    moves: List[Change] = []
+    additions: List[Change] = []
+    moved_from = set()
+    for digest, path in added:
+        sources = gone.get(digest)
+        if sources:
+            source = sources.pop()
+            moved_from.add(source)
+            moves.append(Change(MOVED, _join(removed[source][1]), _join(path)))
+        else:
+            additions.append(Change(ADDED, _join(path)))
+    removals = [
+        Change(REMOVED, _join(path))
+        for index, (_, path) in enumerate(removed)
+        if index not in moved_from
+    ]
+
+    return ChecklistDiff(
+        edits + moves + removals + additions,
+        old.computed_percent(),
+        new.computed_percent(),
+    )
+
+
+def load_checklist(path: Path) -> Checklist:
+    """Load the checklist of a project file (with its operation log) or a bare checklist file."""
+    path = Path(path)
+    data = load_data(path) or {}
+    if "checklist" in data:
+        return ProjectJournal(path).load().checklist
+    return Checklist.from_dict(data)
+
+
+__all__ = [
+    "Change",
+    "ChecklistDiff",
+    "diff_checklists",
+    "load_checklist",
+    "subtree_digests",
+]
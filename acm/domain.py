@@ -1,16 +1,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Sequence, Tuple, Union
 
-from .progress import TaskNode as ProgressTaskNode
+from .progress import RollupNode, TaskNode as ProgressTaskNode
 import json
-import yaml
+
+from .storage import yaml_dump, yaml_load
+
+if TYPE_CHECKING:
+    from .query import Query
 
 
 @dataclass
-class TaskNode:
-    """Represents a checklist item which can contain nested subtasks."""
+class TaskNode(RollupNode):
+    """Represents a checklist item which can contain nested subtasks.
+
+    The roll-up of :meth:`computed_percent` is cached and invalidated along
+    the parent path when ``done``, ``percent`` or ``subtasks`` change.
+    """
+
+    _CHILDREN = "subtasks"
+    _INPUTS = ("done", "percent")
+    # item -> position of the first subtask with that item, built on demand
+    # (a class attribute rather than a dataclass field).
+    _child_index = None
 
     item: str
     done: bool = False
@@ -26,51 +40,189 @@ class TaskNode:
     def get_subtask(self, index: int) -> 'TaskNode':
         return self.subtasks[index]
 
-    def computed_percent(self) -> float:
-        """Return the effective progress percentage for this node."""
+    def __setattr__(self, name, value) -> None:
+        super().__setattr__(name, value)
+        if name == "item" and self._parent is not None:
+            object.__setattr__(self._parent, "_child_index", None)
+
+    def _children_changed(self) -> None:
+        object.__setattr__(self, "_child_index", None)
+        super()._children_changed()
+
+    def child_position(self, item: str) -> Optional[int]:
+        """Return the position of the first subtask named ``item``."""
+        index: Optional[Dict[str, int]] = self._child_index
+        if index is None:
+            index = {}
+            for position, sub in enumerate(self.subtasks):
+                index.setdefault(sub.item, position)
+            object.__setattr__(self, "_child_index", index)
+        return index.get(item)
+
+    def child(self, item: str) -> Optional['TaskNode']:
+        """Return the first subtask named ``item``, if any."""
+        position = self.child_position(item)
+        return None if position is None else self.subtasks[position]
+
+    def _own_percent(self) -> Optional[float]:
         if self.done:
             return 100.0
-        if self.percent is not None:
-            return float(self.percent)
-        if not self.subtasks:
-            return 0.0
-        return sum(s.computed_percent() for s in self.subtasks) / len(self.subtasks)
+        return self.percent
+
+    # The tree walks below use explicit stacks so that arbitrarily deep
+    # checklists never hit the recursion limit. Only subtasks that have
+    # subtasks of their own are pushed; leaves, most of a wide tree, are
+    # finished in place.
 
     def to_progress_node(self) -> "ProgressTaskNode":
         """Convert to :class:`acm.progress.TaskNode` for rendering."""
-        pct = 100 if self.done else self.percent
-        node = ProgressTaskNode(name=self.item, percent=pct)
-        node.children = [s.to_progress_node() for s in self.subtasks]
-        return node
+        root = self._progress_leaf()
+        stack = [(self, root)]
+        while stack:
+            node, converted = stack.pop()
+            children = []
+            for sub in node.subtasks:
+                child = sub._progress_leaf()
+                children.append(child)
+                if sub.subtasks:
+                    stack.append((sub, child))
+            converted.children.extend(children)
+        return root
+
+    def _progress_leaf(self) -> "ProgressTaskNode":
+        return ProgressTaskNode(name=self.item, percent=100 if self.done else self.percent)
 
     def to_dict(self) -> dict:
+        root = self._fields_dict()
+        stack = [(self, root)] if self.subtasks else []
+        while stack:
+            node, data = stack.pop()
+            children = data["subtasks"] = []
+            for sub in node.subtasks:
+                fields = sub._fields_dict()
+                children.append(fields)
+                if sub.subtasks:
+                    stack.append((sub, fields))
+        return root
+
+    def _fields_dict(self) -> dict:
         data: dict[str, Any] = {"item": self.item}
         if self.done:
             data["done"] = self.done
         if self.percent is not None:
             data["percent"] = self.percent
-        if self.subtasks:
-            data["subtasks"] = [s.to_dict() for s in self.subtasks]
         return data
 
     @classmethod
     def from_dict(cls, data: dict) -> 'TaskNode':
-        node = cls(
+        root = cls._from_fields(data)
+        stack = [(root, data)]
+        while stack:
+            node, fields = stack.pop()
+            children = []
+            for sub in _subtask_dicts(fields):
+                child = cls._from_fields(sub)
+                children.append(child)
+                if _subtask_dicts(sub):
+                    stack.append((child, sub))
+            if children:
+                node.subtasks.extend(children)
+        return root
+
+    @classmethod
+    def _from_fields(cls, data: dict) -> 'TaskNode':
+        return cls(
             item=data.get("item", ""),
             done=data.get("done", False),
             percent=data.get("percent"),
         )
-        child_key = "tasks" if "tasks" in data else "subtasks"
-        for sub in data.get(child_key, []):
-            node.add_subtask(cls.from_dict(sub))
-        return node
+
+
+def _subtask_dicts(data: dict) -> list:
+    return data.get("tasks" if "tasks" in data else "subtasks") or []
+
+
+TaskPath = Union[str, Sequence[str]]
+
+
+def split_path(path: TaskPath) -> Tuple[str, ...]:
+    """Return the items of a slash-separated task path (or sequence)."""
+    parts = path.split('/') if isinstance(path, str) else path
+    return tuple(p for p in parts if p)
 
 
 @dataclass
 class Checklist:
-    """Container for the top-level tasks of a project."""
+    """Container for the top-level tasks of a project.
+
+    The top-level tasks are the subtasks of an unnamed root node, so task
+    paths are resolved with one indexed child lookup per level
+    (:meth:`find`, :meth:`ensure`, :meth:`locate`) and the overall progress
+    is the root's cached roll-up.
+    """
 
     tasks: List[TaskNode] = field(default_factory=list)
+    # Unnamed node whose subtasks are ``tasks``; set by ``__setattr__``.
+    _root: TaskNode = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value) -> None:
+        if name == "tasks":
+            root = self.__dict__.get("_root")
+            if root is None:
+                root = TaskNode(item="")
+                object.__setattr__(self, "_root", root)
+            root.subtasks = value
+            value = root.subtasks
+        object.__setattr__(self, name, value)
+
+    @property
+    def root(self) -> TaskNode:
+        return self._root
+
+    def find(self, path: TaskPath) -> TaskNode:
+        """Return the task at ``path``; raise ``KeyError`` if it is missing."""
+        parent, position = self.locate(path)
+        return parent.subtasks[position]
+
+    def locate(self, path: TaskPath) -> Tuple[TaskNode, int]:
+        """Return the parent node and position of the task at ``path``."""
+        parts = split_path(path)
+        if not parts:
+            raise KeyError("Empty task path")
+        node = self._root
+        for depth, part in enumerate(parts):
+            position = node.child_position(part)
+            if position is None:
+                raise KeyError(f"Task path not found: {'/'.join(parts)}")
+            if depth == len(parts) - 1:
+                return node, position
+            node = node.subtasks[position]
+        raise AssertionError("unreachable")
+
+    def ensure(self, path: TaskPath) -> TaskNode:
+        """Return the task at ``path``, creating missing tasks on the way."""
+        parts = split_path(path)
+        if not parts:
+            raise KeyError("Empty task path")
+        node = self._root
+        for part in parts:
+            child = node.child(part)
+            if child is None:
+                child = TaskNode(item=part)
+                node.add_subtask(child)
+            node = child
+        return node
+
+    def remove(self, path: TaskPath) -> TaskNode:
+        """Remove and return the task at ``path``."""
+        parent, position = self.locate(path)
+        return parent.subtasks.pop(position)
+
+    def query(self) -> "Query":
+        """Return a lazy :class:`acm.query.Query` over every task."""
+        from .query import Query
+
+        return Query(self)
 
     def add_task(self, task: TaskNode) -> None:
         self.tasks.append(task)
@@ -82,9 +234,13 @@ class Checklist:
         return self.tasks[index]
 
     def computed_percent(self) -> float:
-        if not self.tasks:
-            return 0.0
-        return sum(t.computed_percent() for t in self.tasks) / len(self.tasks)
+        return self._root.computed_percent()
+
+    def to_progress_node(self, name: str) -> "ProgressTaskNode":
+        """Return the checklist as a progress tree under a root called ``name``."""
+        node = ProgressTaskNode(name=name)
+        node.children.extend(t.to_progress_node() for t in self.tasks)
+        return node
 
     def to_dict(self) -> dict:
         return {'tasks': [t.to_dict() for t in self.tasks]}
@@ -120,11 +276,11 @@ class Checklist:
         return cls.from_dict(json.loads(text))
 
     def to_yaml(self) -> str:
-        return yaml.dump(self.to_dict(), sort_keys=False)
+        return yaml_dump(self.to_dict())
 
     @classmethod
     def from_yaml(cls, text: str) -> 'Checklist':
-        return cls.from_dict(yaml.safe_load(text))
+        return cls.from_dict(yaml_load(text))
 
 
 @dataclass
@@ -161,8 +317,8 @@ class ArticleProject:
         return cls.from_dict(json.loads(text))
 
     def to_yaml(self) -> str:
-        return yaml.dump(self.to_dict(), sort_keys=False)
+        return yaml_dump(self.to_dict())
 
     @classmethod
     def from_yaml(cls, text: str) -> 'ArticleProject':
-        return cls.from_dict(yaml.safe_load(text))
+        return cls.from_dict(yaml_load(text))
@@ -5,17 +5,20 @@ from __future__ import annotations
 from pathlib import Path
 
 from .domain import Checklist
+from .storage import load_data, save_data
 
 
 def save(project: Checklist, path: Path) -> None:
-    """Save ``project`` to ``path`` in YAML format."""
-    with path.open("w", encoding="utf-8") as f:
-        f.write(project.to_yaml())
+    """Save ``project`` to ``path``.
+
+    The format follows the extension (``.json``, ``.msgpack``); anything
+    else is written as YAML.
+    """
+    save_data(project.to_dict(), path)
 
 
 def load(path: Path) -> Checklist:
-    """Return a :class:`Checklist` loaded from ``path``."""
-    with path.open("r", encoding="utf-8") as f:
-        return Checklist.from_yaml(f.read())
+    """Return a :class:`Checklist` loaded from ``path`` (YAML, JSON or msgpack)."""
+    return Checklist.from_dict(load_data(path))
 
 __all__ = ["save", "load"]
@@ -7,19 +7,22 @@ from dataclasses import dataclass
 from pathlib import Path
 import re
 import tempfile
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence
 
 import streamlit as st
 from PIL import Image, UnidentifiedImageError
 
 from .analysis import (
+    PARSERS,
+    ManuscriptMetrics,
     SectionSummary,
     journal_change_requests,
-    parse_docx_sections,
+    parse_metrics,
 )
 from .journal import Guideline, load_guidelines
+from .search import guideline_index
 
-SUPPORTED_MANUSCRIPTS: Sequence[str] = ("docx",)
+SUPPORTED_MANUSCRIPTS: Sequence[str] = tuple(PARSERS)
 SUPPORTED_FIGURES: Sequence[str] = ("jpg", "jpeg", "png", "svg", "pdf")
 MIN_DPI = 300
 MIN_PIXELS = 1500
@@ -120,11 +123,11 @@ def analyze_figures(files: Iterable[Path]) -> List[FigureReport]:
     return reports
 
 
-async def run_async_checks(docx_path: Path, figure_paths: List[Path]):
-    sections_task = asyncio.create_task(asyncio.to_thread(parse_docx_sections, docx_path))
+async def run_async_checks(manuscript_path: Path, figure_paths: List[Path]):
+    metrics_task = asyncio.create_task(asyncio.to_thread(parse_metrics, manuscript_path))
     figures_task = asyncio.create_task(asyncio.to_thread(analyze_figures, figure_paths))
-    sections, figures = await asyncio.gather(sections_task, figures_task)
-    return sections, figures
+    metrics, figures = await asyncio.gather(metrics_task, figures_task)
+    return metrics, figures
 
 
 def _render_sections(sections: List[SectionSummary]) -> None:
@@ -177,7 +180,7 @@ def _render_figures(figures: List[FigureReport]) -> None:
 
 
 def _render_journal_checks(
-    sections: List[SectionSummary], guidelines: List[Guideline]
+    metrics: ManuscriptMetrics, guidelines: List[Guideline]
 ) -> None:
     st.subheader("Journal guideline fit")
 
@@ -185,19 +188,29 @@ def _render_journal_checks(
         st.info("No guidelines found. Ensure `journal_guidelines.json` is available.")
         return
 
-    journal_names = sorted({g.journal for g in guidelines})
-    journal = st.selectbox("Select a journal", journal_names)
+    query = st.text_input(
+        "Search guidelines",
+        help="Filter by journal, article type or requirement text, e.g. 'significance statement'",
+    )
+    if query.strip():
+        candidates = [hit.guideline for hit in guideline_index().search(query, limit=None)]
+        if not candidates:
+            st.info("No guidelines match this search.")
+            return
+    else:
+        candidates = guidelines
 
-    article_types = [g.article_type for g in guidelines if g.journal == journal]
-    if not article_types:
-        st.info("No article types available for this journal.")
-        return
-    article_type = st.selectbox("Article type", article_types)
+    by_journal: Dict[str, List[Guideline]] = {}
+    for g in candidates:
+        by_journal.setdefault(g.journal, []).append(g)
+    journal_names = list(by_journal) if query.strip() else sorted(by_journal)
+    journal = st.selectbox("Select a journal", journal_names)
 
-    guideline = next(
-        g for g in guidelines if g.journal == journal and g.article_type == article_type
+    options = by_journal[journal]
+    guideline = st.selectbox(
+        "Article type", options, format_func=lambda g: g.article_type
     )
-    changes = journal_change_requests(guideline, sections)
+    changes = journal_change_requests(guideline, metrics)
 
     if not changes:
         st.success(
@@ -221,10 +234,10 @@ def launch() -> None:
     guidelines = _load_guidelines()
 
     manuscript = st.file_uploader(
-        "Manuscript (.docx)",
+        "Manuscript (.docx, .odt, .md, .txt, .tex)",
         type=list(SUPPORTED_MANUSCRIPTS),
         accept_multiple_files=False,
-        help="Upload a .docx manuscript to extract sections and word counts",
+        help="Upload a manuscript to extract sections and word counts",
     )
     figures = st.file_uploader(
         "Figures (JPEG, PNG, SVG, PDF)",
@@ -234,18 +247,18 @@ def launch() -> None:
     )
 
     if manuscript is None:
-        st.warning("Upload a .docx manuscript to begin analysis.")
+        st.warning("Upload a manuscript to begin analysis.")
         return
 
     manuscript_path = _save_upload(manuscript)
     figure_paths = [_save_upload(fig) for fig in figures] if figures else []
 
     with st.spinner("Running automated routines asynchronously..."):
-        sections, figure_reports = asyncio.run(run_async_checks(manuscript_path, figure_paths))
+        metrics, figure_reports = asyncio.run(run_async_checks(manuscript_path, figure_paths))
 
-    _render_sections(sections)
+    _render_sections(metrics.sections)
     _render_figures(figure_reports)
-    _render_journal_checks(sections, guidelines)
+    _render_journal_checks(metrics, guidelines)
 
 
 def main() -> None:
@@ -0,0 +1,240 @@
+"""Compiled SQLite store for large journal guideline catalogs.
+
+``compile_guidelines`` turns a ``journal_guidelines.json`` catalog into an
+indexed SQLite file. :class:`GuidelineStore` reads it back as lightweight
+:class:`GuidelineRecord` objects: names and limits are loaded with the
+record, while the long ``structure`` and ``other_requirements`` prose is only
+fetched from disk when accessed.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sqlite3
+from typing import Iterator, List, Optional, Sequence
+
+from .journal import Guideline
+
+STORE_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+STORE_VERSION = "1"
+
+# Short fields loaded with every record.
+SHORT_FIELDS = (
+    "journal",
+    "article_type",
+    "title_limit",
+    "abstract_limit",
+    "word_limit",
+    "figure_limit",
+    "reference_limit",
+    "last_accessed",
+)
+# Long prose (a string or a list of strings), stored as JSON and decoded on
+# access.
+TEXT_FIELDS = ("structure", "other_requirements")
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE guidelines (
+    id INTEGER PRIMARY KEY,
+    journal_key TEXT NOT NULL,
+    article_key TEXT NOT NULL,
+    journal TEXT NOT NULL,
+    article_type TEXT NOT NULL,
+    title_limit TEXT,
+    abstract_limit TEXT,
+    word_limit TEXT,
+    figure_limit TEXT,
+    reference_limit TEXT,
+    last_accessed TEXT,
+    structure TEXT,
+    other_requirements TEXT
+);
+CREATE INDEX guidelines_journal_article ON guidelines (journal_key, article_key);
+"""
+
+
+def is_store(path: Path) -> bool:
+    """Return whether ``path`` names a compiled guideline store."""
+    return Path(path).suffix.lower() in STORE_SUFFIXES
+
+
+def _short(value) -> Optional[str]:
+    return value if value is None or isinstance(value, str) else json.dumps(value)
+
+
+def compile_guidelines(source: Path, target: Path) -> int:
+    """Write the JSON catalog ``source`` to the SQLite store ``target``.
+
+    The store is built next to ``target`` and moved into place, so readers
+    never see a half-written file. Returns the number of guidelines written.
+    """
+
+    data = json.loads(Path(source).read_text())
+    columns = SHORT_FIELDS + TEXT_FIELDS
+    rows = (
+        (d["journal"].casefold(), d["article_type"].casefold())
+        + tuple(_short(d.get(name)) for name in SHORT_FIELDS)
+        + tuple(json.dumps(d.get(name)) for name in TEXT_FIELDS)
+        for d in data
+    )
+
+    target = Path(target)
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp)
+    try:
+        with conn:
+            conn.executescript(_SCHEMA)
+            conn.executemany(
+                f"INSERT INTO guidelines (journal_key, article_key, {', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * (len(columns) + 2))})",
+                rows,
+            )
+            conn.execute("INSERT INTO meta VALUES ('version', ?)", (STORE_VERSION,))
+            count = conn.execute("SELECT COUNT(*) FROM guidelines").fetchone()[0]
+    finally:
+        conn.close()
+    tmp.replace(target)
+    return count
+
+
+class GuidelineRecord:
+    """A guideline row whose long text fields are read on first access.
+
+    Records have the same attributes as :class:`~acm.journal.Guideline`, so
+    they can be passed anywhere a guideline is expected.
+    """
+
+    __slots__ = SHORT_FIELDS + ("_store", "_id", "_raw", "_text")
+
+    journal: str
+    article_type: str
+    title_limit: Optional[str]
+    abstract_limit: Optional[str]
+    word_limit: Optional[str]
+    figure_limit: Optional[str]
+    reference_limit: Optional[str]
+    last_accessed: Optional[str]
+
+    def __init__(self, store: "GuidelineStore", row_id: int, values: Sequence, raw=None):
+        self._store = store
+        self._id = row_id
+        self._raw = raw
+        self._text: Optional[tuple] = None
+        for name, value in zip(SHORT_FIELDS, values):
+            setattr(self, name, value)
+
+    def _field(self, index: int):
+        if self._text is None:
+            raw = self._raw if self._raw is not None else self._store._text(self._id)
+            self._text = tuple(json.loads(value) for value in raw)
+            self._raw = None
+        return self._text[index]
+
+    @property
+    def structure(self):
+        return self._field(0)
+
+    @property
+    def other_requirements(self):
+        return self._field(1)
+
+    def to_guideline(self) -> Guideline:
+        fields = {name: getattr(self, name) for name in SHORT_FIELDS + TEXT_FIELDS}
+        return Guideline(**fields)
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in SHORT_FIELDS + TEXT_FIELDS)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (GuidelineRecord, Guideline)):
+            return NotImplemented
+        return self._values() == tuple(
+            getattr(other, name) for name in SHORT_FIELDS + TEXT_FIELDS
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"GuidelineRecord(journal={self.journal!r}, article_type={self.article_type!r})"
+
+
+class GuidelineStore:
+    """Read-only access to a catalog written by :func:`compile_guidelines`."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(self.path)
+        self._conn = sqlite3.connect(
+            f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+        )
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != STORE_VERSION:
+            self._conn.close()
+            raise ValueError(f"{self.path} was compiled by an incompatible version")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "GuidelineStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM guidelines").fetchone()[0]
+
+    def __iter__(self) -> Iterator[GuidelineRecord]:
+        return self.records()
+
+    def _text(self, row_id: int) -> tuple:
+        return self._conn.execute(
+            "SELECT structure, other_requirements FROM guidelines WHERE id = ?", (row_id,)
+        ).fetchone()
+
+    def _query(self, where: str = "", params: Sequence = (), text: bool = False):
+        columns = SHORT_FIELDS + (TEXT_FIELDS if text else ())
+        cursor = self._conn.execute(
+            f"SELECT id, {', '.join(columns)} FROM guidelines {where} ORDER BY id", params
+        )
+        width = len(SHORT_FIELDS) + 1
+        for row in cursor:
+            yield GuidelineRecord(self, row[0], row[1:width], row[width:] or None)
+
+    def records(self, text: bool = False) -> Iterator[GuidelineRecord]:
+        """Stream every record in catalog order.
+
+        With ``text`` the long fields are read in the same query, which is
+        cheaper when every record's text will be used.
+        """
+        return self._query(text=text)
+
+    def find(self, journal: str, article_type: str | None = None) -> GuidelineRecord:
+        """Return the first record for ``journal`` (and ``article_type``)."""
+        if article_type:
+            where = "WHERE journal_key = ? AND article_key = ?"
+            params: Sequence = (journal.casefold(), article_type.casefold())
+        else:
+            where, params = "WHERE journal_key = ?", (journal.casefold(),)
+        for record in self._query(where, params):
+            return record
+        raise ValueError(f"Guideline not found for {journal} {article_type or ''}")
+
+    def journals(self) -> List[str]:
+        """Return the distinct journal names in catalog order."""
+        rows = self._conn.execute(
+            "SELECT journal FROM guidelines GROUP BY journal_key ORDER BY MIN(id)"
+        )
+        return [journal for (journal,) in rows]
+
+
+__all__ = [
+    "GuidelineRecord",
+    "GuidelineStore",
+    "compile_guidelines",
+    "is_store",
+]
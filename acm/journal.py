@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar, cast
 
 from .domain import Checklist, TaskNode
 
@@ -27,23 +27,108 @@ class Guideline:
     last_accessed: Optional[str] = None
 
 
-def load_guidelines(path: Path | None = None) -> List[Guideline]:
-    """Return all guidelines from ``journal_guidelines.json``."""
-    file = path or GUIDELINES_FILE
+T = TypeVar("T")
+
+
+def _read_guidelines(file: Path) -> List[Guideline]:
+    from .guideline_store import GuidelineStore, is_store
+
+    if is_store(file):
+        # Fetch the raw text in the same query so the connection can be
+        # closed; each record only decodes it when a text field is read.
+        with GuidelineStore(file) as store:
+            records = list(store.records(text=True))
+        # Records stand in for guidelines (same attributes, equal by value).
+        return cast(List[Guideline], records)
     data = json.loads(file.read_text())
     allowed = set(Guideline.__annotations__)
     cleaned = [{k: v for k, v in d.items() if k in allowed} for d in data]
     return [Guideline(**item) for item in cleaned]
 
 
+class GuidelineRegistry:
+    """A guideline catalog loaded once and indexed for O(1) lookups.
+
+    The file is re-read only when its modification time or size changes.
+    Lookups are case-insensitive and, like a scan of the file, return the
+    first matching entry.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._signature: Optional[Tuple[int, int]] = None
+        self._guidelines: List[Guideline] = []
+        self._by_key: Dict[Tuple[str, str], Guideline] = {}
+        self._by_journal: Dict[str, Guideline] = {}
+        self._derived: Dict[str, object] = {}
+
+    def refresh(self) -> bool:
+        """Reload the catalog if the file changed; return whether it did."""
+        stat = self.path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return False
+        guidelines = _read_guidelines(self.path)
+        by_key: Dict[Tuple[str, str], Guideline] = {}
+        by_journal: Dict[str, Guideline] = {}
+        for g in guidelines:
+            journal = g.journal.casefold()
+            by_key.setdefault((journal, g.article_type.casefold()), g)
+            by_journal.setdefault(journal, g)
+        self._guidelines = guidelines
+        self._by_key = by_key
+        self._by_journal = by_journal
+        self._derived = {}
+        self._signature = signature
+        return True
+
+    @property
+    def guidelines(self) -> List[Guideline]:
+        self.refresh()
+        return self._guidelines
+
+    def find(self, journal: str, article_type: str | None = None) -> Guideline:
+        """Return the guideline for ``journal`` and, if given, ``article_type``."""
+        self.refresh()
+        if article_type:
+            g = self._by_key.get((journal.casefold(), article_type.casefold()))
+        else:
+            g = self._by_journal.get(journal.casefold())
+        if g is None:
+            raise ValueError(f"Guideline not found for {journal} {article_type or ''}")
+        return g
+
+    def derived(self, name: str, build: Callable[[List[Guideline]], T]) -> T:
+        """Return ``build(guidelines)``, memoized until the catalog changes."""
+        self.refresh()
+        if name not in self._derived:
+            self._derived[name] = build(self._guidelines)
+        return self._derived[name]  # type: ignore[return-value]
+
+
+_REGISTRIES: Dict[Path, GuidelineRegistry] = {}
+
+
+def guideline_registry(path: Path | None = None) -> GuidelineRegistry:
+    """Return the shared registry for ``path`` (default catalog if omitted)."""
+    file = Path(path or GUIDELINES_FILE).resolve()
+    registry = _REGISTRIES.get(file)
+    if registry is None:
+        registry = _REGISTRIES[file] = GuidelineRegistry(file)
+    return registry
+
+
+def load_guidelines(path: Path | None = None) -> List[Guideline]:
+    """Return all guidelines from ``journal_guidelines.json``.
+
+    ``path`` may also be a store written by ``acm guidelines compile``.
+    """
+    return list(guideline_registry(path).guidelines)
+
+
 def find_guideline(journal: str, article_type: str | None = None) -> Guideline:
     """Return the guideline entry matching ``journal`` and ``article_type``."""
-    journal = journal.lower()
-    art = article_type.lower() if article_type else None
-    for g in load_guidelines():
-        if g.journal.lower() == journal and (art is None or g.article_type.lower() == art):
-            return g
-    raise ValueError(f"Guideline not found for {journal} {article_type or ''}")
+    return guideline_registry().find(journal, article_type)
 
 
 def generate_template(journal: str, article_type: str | None = None) -> Checklist:
@@ -69,4 +154,11 @@ def generate_template(journal: str, article_type: str | None = None) -> Checklis
     return Checklist(tasks=tasks)
 
 
-__all__ = ["Guideline", "load_guidelines", "find_guideline", "generate_template"]
+__all__ = [
+    "Guideline",
+    "GuidelineRegistry",
+    "guideline_registry",
+    "load_guidelines",
+    "find_guideline",
+    "generate_template",
+]
@@ -0,0 +1,175 @@
+"""Compiled keyword matching for section categorisation."""
+
+from __future__ import annotations
+
+from collections import deque
+import hashlib
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+
+class KeywordMatcher:
+    """Aho–Corasick automaton mapping keywords to section categories.
+
+    All keywords are matched in a single scan of the text, so the cost of a
+    lookup depends on the length of the text rather than on the size of the
+    keyword table. Matching is case-insensitive (``str.casefold``) and, like
+    the original substring test, ignores word boundaries.
+
+    Ambiguous titles are resolved by category priority: categories listed in
+    ``priorities`` win in that order, followed by any other category in the
+    order it was first added.
+
+    >>> matcher = KeywordMatcher({"result": "Results", "discussion": "Discussion"})
+    >>> matcher.categorize("Results and Discussion")
+    'Results'
+    >>> sorted(matcher.categories("Results and Discussion"))
+    ['Discussion', 'Results']
+    """
+
+    def __init__(
+        self,
+        table: Optional[Mapping[str, str]] = None,
+        priorities: Sequence[str] = (),
+    ):
+        self._keywords: Dict[str, str] = {}
+        self._priorities: List[str] = list(dict.fromkeys(priorities))
+        self.category_names: List[str] = list(self._priorities)
+        self._goto: List[Dict[str, int]] = []
+        self._fail: List[int] = []
+        self._ranked: List[str] = []
+        self._outputs: List[Tuple[int, ...]] = []
+        self._root_chars: frozenset = frozenset()
+        self._compiled = False
+        self._fingerprint: Optional[str] = None
+        if table:
+            self.extend(table)
+
+    def extend(self, table: Mapping[str, str], priorities: Sequence[str] = ()) -> None:
+        """Add ``table`` (keyword -> category) and optional extra priorities.
+
+        Keywords already present keep their original category.
+        """
+
+        for category in priorities:
+            if category not in self._priorities:
+                self._priorities.append(category)
+        for keyword, category in table.items():
+            key = keyword.casefold()
+            if not key or key in self._keywords:
+                continue
+            self._keywords[key] = category
+            if category not in self.category_names:
+                self.category_names.append(category)
+        self._compiled = False
+        self._fingerprint = None
+
+    @property
+    def fingerprint(self) -> str:
+        """Return a short digest of the keywords and priorities.
+
+        It changes whenever :meth:`extend` changes what text is categorised
+        as, so results derived from categories can be keyed on it.
+        """
+
+        if self._fingerprint is None:
+            state = (sorted(self._keywords.items()), self._priorities, self.category_names)
+            digest = hashlib.blake2b(repr(state).encode("utf-8"), digest_size=8)
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def bit(self, category: str) -> int:
+        """Return the bitmask flag for ``category`` (``0`` if unknown)."""
+
+        try:
+            return 1 << self.category_names.index(category)
+        except ValueError:
+            return 0
+
+    def _rank(self, category: str) -> int:
+        if category in self._priorities:
+            return self._priorities.index(category)
+        return len(self._priorities) + self.category_names.index(category)
+
+    def _compile(self) -> None:
+        # Outputs hold each keyword's category *rank*, so the best match is
+        # simply the smallest output seen while scanning.
+        self._ranked = sorted(set(self._keywords.values()), key=self._rank)
+        rank_of = {category: rank for rank, category in enumerate(self._ranked)}
+
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for keyword, category in self._keywords.items():
+            state = 0
+            for char in keyword:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(rank_of[category])
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                fail[nxt] = goto[link].get(char, 0) if state else 0
+                outputs[nxt].extend(outputs[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(sorted(set(out))) for out in outputs]
+        self._root_chars = frozenset(goto[0])
+        self._compiled = True
+
+    def _matched_ranks(self, text: str) -> Iterator[int]:
+        if not self._compiled:
+            self._compile()
+        goto, fail, outputs, root_chars = self._goto, self._fail, self._outputs, self._root_chars
+        state = 0
+        for char in text.casefold():
+            if state == 0 and char not in root_chars:
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                yield from outputs[state]
+
+    def categories(self, text: str) -> Set[str]:
+        """Return every category with a keyword occurring in ``text``."""
+
+        ranks = set(self._matched_ranks(text))
+        return {self._ranked[rank] for rank in ranks}
+
+    def mask(self, text: str) -> int:
+        """Return the bitmask of :meth:`categories` for ``text``."""
+
+        mask = 0
+        for category in self.categories(text):
+            mask |= self.bit(category)
+        return mask
+
+    def categorize(self, text: str, default: str = "Other") -> str:
+        """Return the highest-priority category matched in ``text``."""
+
+        best = min(self._matched_ranks(text), default=None)
+        if best is None:
+            return default
+        return self._ranked[best]
+
+    def names(self, mask: int) -> Iterator[str]:
+        """Yield the category names whose bits are set in ``mask``."""
+
+        for index, category in enumerate(self.category_names):
+            if mask & (1 << index):
+                yield category
+
+
+__all__ = ["KeywordMatcher"]
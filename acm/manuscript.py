@@ -3,22 +3,28 @@ from __future__ import annotations
 """Utilities for editing manuscript sections via CLI or Colab."""
 
 from pathlib import Path
-from typing import Dict, Optional
-import threading
-import time
+import shutil
+from typing import Collection, Dict, Mapping, MutableMapping, Optional, Set
 import curses
 from curses import textpad
 import yaml
 
+from .autosave import SAVE_DELAY, Autosaver
 from .progress import progress_bar
+from .sections import SECTIONS_DIR, SectionStore, is_split, write_sections
+from .storage import atomic_write, yaml_dump
 
 SECTIONS_FILE = "manuscript.yaml"
-SAVE_INTERVAL = 2.0
+SAVE_INTERVAL = SAVE_DELAY
 
 
-def load_sections(path: Path) -> Dict[str, dict]:
+def load_sections(path: Path) -> MutableMapping[str, dict]:
     """Load manuscript sections from ``manuscript.yaml``.
 
+    When the manuscript was split into per-section files (see
+    :func:`split_sections`), a lazily loading
+    :class:`~acm.sections.SectionStore` is returned instead.
+
     Parameters
     ----------
     path:
@@ -29,6 +35,8 @@ def load_sections(path: Path) -> Dict[str, dict]:
     dict
         Mapping of section names to ``{"text": str, "limit": int | None}``.
     """
+    if is_split(path):
+        return SectionStore(path / SECTIONS_DIR)
     file = path / SECTIONS_FILE
     if not file.exists():
         return {}
@@ -36,10 +44,52 @@ def load_sections(path: Path) -> Dict[str, dict]:
     return data.get("sections", {})
 
 
-def save_sections(sections: Dict[str, dict], path: Path) -> None:
-    """Persist sections to ``manuscript.yaml``."""
+def save_sections(
+    sections: Mapping[str, dict], path: Path, only: Optional[Collection[str]] = None
+) -> None:
+    """Persist sections to ``manuscript.yaml``.
+
+    The file is replaced atomically, so a crash leaves the previous version.
+    With per-section files only the changed sections (or those in ``only``)
+    are written.
+    """
+    if isinstance(sections, SectionStore) or is_split(path):
+        write_sections(path / SECTIONS_DIR, sections, only)
+        return
     file = path / SECTIONS_FILE
-    file.write_text(yaml.dump({"sections": sections}, sort_keys=False))
+    atomic_write(file, yaml_dump({"sections": dict(sections)}).encode("utf-8"))
+
+
+def split_sections(path: Path) -> int:
+    """Move ``manuscript.yaml`` to one file per section; return the section count."""
+    if is_split(path):
+        raise ValueError(f"{path / SECTIONS_DIR} already holds the manuscript")
+    if not (path / SECTIONS_FILE).exists():
+        raise ValueError(f"{path / SECTIONS_FILE} not found")
+    sections = load_sections(path)
+    write_sections(path / SECTIONS_DIR, sections)
+    (path / SECTIONS_FILE).unlink()
+    return len(sections)
+
+
+def join_sections(path: Path) -> int:
+    """Move per-section files back into ``manuscript.yaml``; return the section count."""
+    if not is_split(path):
+        raise ValueError(f"{path / SECTIONS_DIR} does not hold a manuscript")
+    directory = path / SECTIONS_DIR
+    sections = {name: dict(data) for name, data in load_sections(path).items()}
+    atomic_write(path / SECTIONS_FILE, yaml_dump({"sections": sections}).encode("utf-8"))
+    shutil.rmtree(directory)
+    return len(sections)
+
+
+def autosaver(sections: MutableMapping[str, dict], path: Path) -> Autosaver:
+    """Return an :class:`~acm.autosave.Autosaver` writing ``sections`` under ``path``."""
+
+    def save(snapshot: Dict[str, dict], dirty: Set[str]) -> None:
+        save_sections(snapshot, path, only=dirty)
+
+    return Autosaver(sections, save, delay=SAVE_INTERVAL)
 
 
 def _update_status(win, text: str, limit: Optional[int]) -> None:
@@ -56,32 +106,22 @@ def _update_status(win, text: str, limit: Optional[int]) -> None:
     win.refresh()
 
 
-def _edit_section(stdscr, name: str, data: dict, save_cb) -> None:
+def _edit_section(stdscr, name: str, data: dict, saver: Autosaver) -> None:
     height, width = stdscr.getmaxyx()
     edit_win = curses.newwin(height - 2, width, 0, 0)
     status_win = curses.newwin(2, width, height - 2, 0)
 
     edit_win.addstr(0, 0, data.get("text", ""))
     box = textpad.Textbox(edit_win)
-    running = True
-
-    def autosave_loop() -> None:
-        while running:
-            data["text"] = box.gather()
-            save_cb()
-            time.sleep(SAVE_INTERVAL)
-
-    t = threading.Thread(target=autosave_loop, daemon=True)
-    t.start()
 
     def validator(ch):
-        _update_status(status_win, box.gather(), data.get("limit"))
+        text = box.gather()
+        _update_status(status_win, text, data.get("limit"))
+        saver.update(name, text)
         return ch
 
     box.edit(validator)
-    running = False
-    data["text"] = box.gather()
-    save_cb()
+    saver.update(name, box.gather())
 
 
 def cli_editor(path: Path = Path(".")) -> None:
@@ -92,9 +132,7 @@ def cli_editor(path: Path = Path(".")) -> None:
 
     current = 0
     names = list(sections.keys())
-
-    def save_all():
-        save_sections(sections, path)
+    saver = autosaver(sections, path)
 
     def menu(stdscr):
         nonlocal current, names
@@ -112,7 +150,7 @@ def cli_editor(path: Path = Path(".")) -> None:
                 current = min(len(names) - 1, current + 1)
             elif ch in (10, 13):
                 curses.curs_set(1)
-                _edit_section(stdscr, names[current], sections[names[current]], save_all)
+                _edit_section(stdscr, names[current], sections[names[current]], saver)
                 curses.curs_set(0)
             elif ch == ord("n"):
                 stdscr.addstr(len(names) + 2, 0, "New section name: ")
@@ -120,15 +158,17 @@ def cli_editor(path: Path = Path(".")) -> None:
                 name = stdscr.getstr().decode("utf-8").strip()
                 curses.noecho()
                 if name:
-                    sections[name] = {"text": "", "limit": None}
+                    saver.add(name)
                     names = list(sections.keys())
                     current = names.index(name)
-                    save_all()
             elif ch in (ord("q"), 27):
                 break
             stdscr.refresh()
 
-    curses.wrapper(menu)
+    try:
+        curses.wrapper(menu)
+    finally:
+        saver.close()
 
 
 def colab_editor(path: Path = Path(".")):
@@ -148,19 +188,10 @@ def colab_editor(path: Path = Path(".")):
     add_btn = widgets.Button(description="Add")
 
     current = {"name": dropdown.value}
+    saver = autosaver(sections, path)
 
     def save_current(*args):
-        sections[current["name"]]["text"] = textarea.value
-        save_sections(sections, path)
-
-    save_timer: Optional[threading.Timer] = None
-
-    def schedule_save(*args):
-        nonlocal save_timer
-        if save_timer:
-            save_timer.cancel()
-        save_timer = threading.Timer(SAVE_INTERVAL, save_current)
-        save_timer.start()
+        saver.update(current["name"], textarea.value)
 
     def update_counts(*args):
         text = textarea.value
@@ -175,6 +206,7 @@ def colab_editor(path: Path = Path(".")):
 
     def on_dropdown(change):
         save_current()
+        saver.flush()
         current["name"] = change.new
         textarea.value = sections[current["name"]].get("text", "")
         update_counts()
@@ -183,29 +215,33 @@ def colab_editor(path: Path = Path(".")):
         name = new_name.value.strip()
         if not name:
             return
-        sections[name] = {"text": "", "limit": None}
+        saver.add(name)
         dropdown.options = list(sections.keys())
         dropdown.value = name
         new_name.value = ""
-        save_sections(sections, path)
 
     dropdown.observe(on_dropdown, "value")
     textarea.observe(update_counts, "value")
-    textarea.observe(schedule_save, "value")
+    textarea.observe(save_current, "value")
     add_btn.on_click(on_add)
     textarea.value = sections[current["name"]].get("text", "")
     update_counts()
 
-    return widgets.VBox([
+    editor = widgets.VBox([
         widgets.HBox([dropdown, new_name, add_btn]),
         textarea,
         info,
         progress,
     ])
+    # Call ``editor.autosaver.close()`` to write pending edits and stop saving.
+    editor.autosaver = saver
+    return editor
 
 __all__ = [
     "load_sections",
     "save_sections",
+    "split_sections",
+    "join_sections",
     "cli_editor",
     "colab_editor",
 ]
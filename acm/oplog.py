@@ -0,0 +1,294 @@
+"""Append-only journal of checklist mutations.
+
+Instead of rewriting the whole project file for every change, mutations
+are appended as one JSON record per line to ``<project file>.log`` and
+replayed on top of the snapshot when the project is loaded. Once the log
+grows past a threshold it is compacted: the snapshot is rewritten
+atomically and the log starts over.
+
+The first line of the log names the SHA-256 digest of the snapshot it
+applies to. Before compaction replaces the snapshot, the header is
+updated with the digest of the new snapshot as well, so a log left over
+by a crash mid-compaction is recognised and ignored: its operations are
+already in the snapshot. If the snapshot matches neither digest it was
+edited by hand (the file is meant to be hand-editable). The logged
+operations are then replayed on top of the edited file with a
+:class:`LogReplayWarning`, and the next write compacts. Operations that no
+longer apply are skipped and named in the warning. A torn last line left
+by a crash during an append is skipped.
+
+Operations are dicts with an ``op`` key:
+
+``{"op": "set", "path": "A/B", "done": true, "percent": 40}``
+    Update ``done`` and/or ``percent`` (only the keys present).
+``{"op": "rename", "path": "A/B", "item": "C"}``
+    Rename a task.
+``{"op": "delete", "path": "A/B"}``
+    Remove a task and its subtasks.
+``{"op": "ensure", "path": "A/B"}``
+    Create a task (and missing parents) unless it exists.
+
+``check``, ``uncheck``, ``percent`` and ``add`` are accepted as shorthands
+(see :func:`normalize_op`) and logged in their canonical form.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import warnings
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from .domain import ArticleProject, Checklist
+from .storage import atomic_write, detect_format, dumps, loads
+
+LOG_SUFFIX = ".log"
+COMPACT_BYTES = 256 * 1024
+OPS = ("set", "rename", "delete", "ensure")
+ALIASES = ("check", "uncheck", "percent", "add")
+
+
+class OpError(ValueError):
+    """An operation that cannot be applied to the checklist."""
+
+
+class LogReplayWarning(UserWarning):
+    """The project file changed behind the operation log's back."""
+
+
+def normalize_op(op: dict) -> dict:
+    """Return ``op`` with shorthand operations rewritten to canonical ones.
+
+    ``check`` marks a task done (or sets ``percent`` when given), ``uncheck``
+    clears both, ``percent`` sets the percentage and ``add`` is ``ensure``.
+    """
+    if not isinstance(op, dict):
+        raise OpError(f"Operation must be an object, not {type(op).__name__}")
+    kind = op.get("op")
+    if kind not in ALIASES:
+        return op
+    op = dict(op)
+    if kind == "check":
+        op["op"] = "set"
+        if "percent" not in op:
+            op.setdefault("done", True)
+    elif kind == "uncheck":
+        op.update(op="set", done=False, percent=None)
+    elif kind == "percent":
+        if "percent" not in op:
+            raise OpError("Operation 'percent' needs a percent value")
+        op["op"] = "set"
+    else:
+        op["op"] = "ensure"
+    return op
+
+
+def apply_op(checklist: Checklist, op: dict) -> None:
+    """Apply one operation to ``checklist``; raise :class:`OpError` if invalid."""
+    kind = op.get("op")
+    path = op.get("path")
+    if kind not in OPS:
+        raise OpError(f"Unknown operation: {kind!r}")
+    if not isinstance(path, str) or not path.strip("/"):
+        raise OpError(f"Operation {kind!r} needs a task path")
+    try:
+        if kind == "ensure":
+            checklist.ensure(path)
+            return
+        if kind == "delete":
+            checklist.remove(path)
+            return
+        node = checklist.find(path)
+    except KeyError as e:
+        raise OpError(e.args[0]) from None
+    if kind == "rename":
+        item = op.get("item")
+        if not isinstance(item, str) or not item or "/" in item:
+            raise OpError(f"Invalid new name: {item!r}")
+        node.item = item
+        return
+    # Validate every field before changing any, so a rejected operation
+    # leaves the task untouched.
+    percent = op.get("percent")
+    if "percent" in op and percent is not None:
+        if isinstance(percent, bool) or not (
+            isinstance(percent, (int, float)) and 0 <= percent <= 100
+        ):
+            raise OpError(f"Invalid percent: {percent!r}")
+    if "done" in op:
+        node.done = bool(op["done"])
+    if "percent" in op:
+        node.percent = percent
+
+
+def _digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+class ProjectJournal:
+    """A project file plus its operation log."""
+
+    def __init__(self, file: Path, compact_bytes: int = COMPACT_BYTES):
+        self.file = Path(file)
+        self.log_path = self.file.with_name(self.file.name + LOG_SUFFIX)
+        self.compact_bytes = compact_bytes
+        self._base: Optional[str] = None
+        self._log_current = False
+        # Set when the log cannot simply be appended to (torn tail, or
+        # operations replayed onto a hand-edited snapshot): compact instead.
+        self._must_compact = False
+
+    def _read_log(self) -> Tuple[dict, List[dict], bool]:
+        try:
+            raw = self.log_path.read_bytes()
+        except FileNotFoundError:
+            return {}, [], False
+        lines = raw.splitlines()
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, ValueError):
+            return {}, [], False
+        if not isinstance(header, dict):
+            return {}, [], False
+        ops: List[dict] = []
+        for line in lines[1:]:
+            try:
+                ops.append(json.loads(line))
+            except ValueError:
+                # Torn write: nothing after it was acknowledged.
+                return header, ops, True
+        return header, ops, not raw.endswith(b"\n")
+
+    def pending(self) -> List[dict]:
+        """Return the logged operations not yet in the snapshot."""
+        header, ops, torn = self._read_log()
+        base = header.get("base")
+        self._log_current = base is not None and base == self._base
+        self._must_compact = self._log_current and torn
+        if self._log_current:
+            return ops
+        if base is None or header.get("next") == self._base:
+            # No log, or one whose compaction finished writing the snapshot.
+            return []
+        if ops:
+            self._must_compact = True
+        return ops
+
+    def load(self) -> ArticleProject:
+        """Return the snapshot with every logged operation replayed."""
+        raw = self.file.read_bytes()
+        self._base = _digest(raw)
+        project = ArticleProject.from_dict(loads(raw, detect_format(self.file)) or {})
+        ops = self.pending()
+        if self._log_current:
+            for op in ops:
+                apply_op(project.checklist, op)
+            return project
+        skipped = []
+        for op in ops:
+            try:
+                apply_op(project.checklist, op)
+            except OpError as e:
+                skipped.append(f"{json.dumps(op)} ({e})")
+        if ops:
+            message = (
+                f"{self.file} was edited after {len(ops)} operations were logged in "
+                f"{self.log_path}; they were replayed on top of the edited file"
+            )
+            if skipped:
+                message += "; skipped: " + "; ".join(skipped)
+            warnings.warn(message, LogReplayWarning, stacklevel=2)
+        return project
+
+    def record(self, project: ArticleProject, op: dict) -> None:
+        """Apply ``op`` to ``project`` and append it to the log.
+
+        ``project`` must be the result of :meth:`load`. The log is compacted
+        once it grows past ``compact_bytes``.
+        """
+        apply_op(project.checklist, op)
+        if self._must_compact:
+            # Appending after a torn line would glue records together, and a
+            # log replayed onto an edited snapshot must be folded into it.
+            self.compact(project)
+            return
+        self._append(op)
+        if self.log_path.stat().st_size > self.compact_bytes:
+            self.compact(project)
+
+    def record_many(
+        self, project: ArticleProject, ops: Iterable[dict]
+    ) -> List[Tuple[int, OpError]]:
+        """Apply every operation in ``ops`` and log them in one write.
+
+        Invalid operations are skipped rather than aborting the batch; their
+        (zero-based) position and error are returned. Shorthand operations are
+        logged in canonical form.
+        """
+        applied: List[dict] = []
+        failures: List[Tuple[int, OpError]] = []
+        for index, op in enumerate(ops):
+            try:
+                op = normalize_op(op)
+                apply_op(project.checklist, op)
+            except OpError as e:
+                failures.append((index, e))
+                continue
+            applied.append(op)
+        if not applied:
+            return failures
+        if self._must_compact:
+            self.compact(project)
+            return failures
+        self._append(*applied)
+        if self.log_path.stat().st_size > self.compact_bytes:
+            self.compact(project)
+        return failures
+
+    def _append(self, *ops: dict) -> None:
+        if self._base is None:
+            raise RuntimeError("load() the project before recording operations")
+        lines = [json.dumps(op, separators=(",", ":")) for op in ops]
+        if not self._log_current:
+            # Missing or stale log: start a new one for the current snapshot.
+            header = json.dumps({"base": self._base})
+            atomic_write(self.log_path, "\n".join([header, *lines, ""]).encode("utf-8"))
+            self._log_current = True
+            return
+        with self.log_path.open("ab") as f:
+            f.write(("\n".join(lines) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def compact(self, project: ArticleProject) -> None:
+        """Write ``project`` as the new snapshot and start an empty log."""
+        raw = dumps(project.to_dict(), detect_format(self.file))
+        digest = _digest(raw)
+        self._mark_compacting(digest)
+        atomic_write(self.file, raw)
+        self._base = digest
+        atomic_write(self.log_path, (json.dumps({"base": self._base}) + "\n").encode("utf-8"))
+        self._log_current = True
+        self._must_compact = False
+
+    def _mark_compacting(self, digest: str) -> None:
+        # Record the digest of the snapshot about to replace the log's base,
+        # so a crash before the log is reset is not mistaken for a hand edit.
+        header, ops, _ = self._read_log()
+        if not ops:
+            return
+        header["next"] = digest
+        lines = [json.dumps(header)] + [json.dumps(op, separators=(",", ":")) for op in ops]
+        atomic_write(self.log_path, ("\n".join(lines) + "\n").encode("utf-8"))
+
+
+__all__ = [
+    "COMPACT_BYTES",
+    "LogReplayWarning",
+    "OpError",
+    "ProjectJournal",
+    "apply_op",
+    "normalize_op",
+]
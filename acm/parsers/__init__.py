@@ -0,0 +1,32 @@
+"""Streaming manuscript parsers.
+
+Each format module exposes ``iter_blocks(path)``, a generator of
+``(kind, text)`` blocks where ``kind`` is :data:`HEADING`,
+:data:`PARAGRAPH`, :data:`TITLE` (the manuscript title, counted as text),
+:data:`TABLE` or :data:`FIGURE` (a table or figure float, with empty
+text). :mod:`acm.analysis` imports a format module only when a file of that
+format is parsed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, Tuple
+
+HEADING = "heading"
+PARAGRAPH = "paragraph"
+TITLE = "title"
+TABLE = "table"
+FIGURE = "figure"
+
+Block = Tuple[str, str]
+
+
+def read_lines(path: Path) -> Iterator[str]:
+    """Yield the lines of a UTF-8 text file without reading it all at once."""
+    with Path(path).open("r", encoding="utf-8-sig", errors="replace") as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+__all__ = ["HEADING", "PARAGRAPH", "TITLE", "TABLE", "FIGURE", "Block", "read_lines"]
@@ -0,0 +1,115 @@
+"""Word (``.docx``) manuscripts read straight from the WordprocessingML XML.
+
+Headings are paragraphs whose style name starts with "Heading" and the title
+uses the "Title" style. Only top-level body paragraphs are reported, matching
+``Document.paragraphs`` in python-docx, plus one block per top-level table.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+import zipfile
+
+from . import HEADING, PARAGRAPH, TABLE, TITLE, Block
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _style_kind(name: str) -> str:
+    name = name.lower()
+    if name.startswith("heading"):
+        return HEADING
+    return TITLE if name == "title" else PARAGRAPH
+
+
+def _paragraph_styles(archive: zipfile.ZipFile) -> Tuple[Dict[str, str], str]:
+    """Map paragraph style ids to block kinds.
+
+    The second item is the kind of the default paragraph style; it applies to
+    paragraphs without a (known) style reference.
+    """
+
+    styles: Dict[str, str] = {}
+    default_kind = PARAGRAPH
+    try:
+        stream = archive.open("word/styles.xml")
+    except KeyError:
+        return styles, default_kind
+
+    with stream:
+        for _, element in ElementTree.iterparse(stream):
+            if element.tag != _W + "style":
+                continue
+            if element.get(_W + "type") == "paragraph":
+                name = element.find(_W + "name")
+                style_name = (name.get(_W + "val") or "") if name is not None else ""
+                kind = _style_kind(style_name)
+                styles[element.get(_W + "styleId", "")] = kind
+                if element.get(_W + "default") in ("1", "true", "on"):
+                    default_kind = kind
+            element.clear()
+    return styles, default_kind
+
+
+def _run_text(run: ElementTree.Element) -> str:
+    parts: List[str] = []
+    for child in run:
+        tag = child.tag
+        if tag == _W + "t":
+            parts.append(child.text or "")
+        elif tag in (_W + "tab", _W + "ptab"):
+            parts.append("\t")
+        elif tag == _W + "cr":
+            parts.append("\n")
+        elif tag == _W + "br":
+            if child.get(_W + "type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag == _W + "noBreakHyphen":
+            parts.append("-")
+    return "".join(parts)
+
+
+def _paragraph_text(paragraph: ElementTree.Element) -> str:
+    parts: List[str] = []
+    for child in paragraph:
+        if child.tag == _W + "r":
+            parts.append(_run_text(child))
+        elif child.tag == _W + "hyperlink":
+            parts.extend(_run_text(run) for run in child.findall(_W + "r"))
+    return "".join(parts)
+
+
+def iter_blocks(path: Path) -> Iterator[Block]:
+    """Stream ``(kind, text)`` blocks from the body of a ``.docx`` file.
+
+    ``word/document.xml`` is read incrementally straight from the archive and
+    each top-level paragraph is discarded once processed, so memory stays
+    bounded by the largest paragraph rather than the document size.
+    """
+
+    with zipfile.ZipFile(path) as archive:
+        styles, default_kind = _paragraph_styles(archive)
+        with archive.open("word/document.xml") as stream:
+            depth = 0
+            body: Optional[ElementTree.Element] = None
+            for event, element in ElementTree.iterparse(stream, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if depth == 2 and element.tag == _W + "body":
+                        body = element
+                    continue
+
+                depth -= 1
+                if depth != 2 or body is None:
+                    continue
+                if element.tag == _W + "p":
+                    text = _paragraph_text(element).strip()
+                    if text:
+                        style = element.find(f"{_W}pPr/{_W}pStyle")
+                        style_id = style.get(_W + "val") if style is not None else None
+                        yield styles.get(style_id or "", default_kind), text
+                elif element.tag == _W + "tbl":
+                    yield TABLE, ""
+                body.clear()
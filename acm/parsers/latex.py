@@ -0,0 +1,89 @@
+"""LaTeX manuscripts: sectioning commands and the abstract become headings.
+
+Commands, comments and inline math are stripped so that only prose is
+counted; the preamble before ``\\begin{document}`` is skipped except for
+``\\title``. Figure and table environments yield figure and table blocks and a
+``thebibliography``
+environment becomes a "References" section with one block per ``\\bibitem``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import re
+from typing import Iterator, List, Optional
+
+from . import FIGURE, HEADING, PARAGRAPH, TABLE, TITLE, Block, read_lines
+
+_SECTION = re.compile(
+    r"^\s*\\(?:part|chapter|section|subsection|subsubsection|paragraph)\*?"
+    r"(?:\[[^\]]*\])?\{(.*)\}\s*$"
+)
+_BEGIN_ABSTRACT = re.compile(r"^\s*\\begin\{abstract\}")
+_BEGIN_BIBLIOGRAPHY = re.compile(r"^\s*\\begin\{thebibliography\}")
+_BEGIN_FLOAT = re.compile(r"\\begin\{(figure|table)\*?\}")
+_BIBITEM = re.compile(r"^\s*\\bibitem\b")
+_TITLE = re.compile(r"^\s*\\title(?:\[[^\]]*\])?\{(.*)\}\s*$")
+_COMMENT = re.compile(r"(?<!\\)%.*$")
+_MATH = re.compile(r"\$[^$]*\$")
+_ENVIRONMENT = re.compile(r"\\(?:begin|end)\{[^}]*\}")
+_KEY_ARGUMENT = re.compile(
+    r"\\(?:cite[a-zA-Z]*|[a-z]*ref|label|bibitem|includegraphics|url|input|include)\*?"
+    r"(?:\[[^\]]*\])*\{[^}]*\}"
+)
+_COMMAND = re.compile(r"\\[a-zA-Z@]+\*?(?:\[[^\]]*\])?")
+_SYMBOLS = re.compile(r"[{}~]|\\\\")
+
+
+def _prose(line: str) -> str:
+    line = _MATH.sub(" ", line)
+    line = _ENVIRONMENT.sub(" ", line)
+    line = _KEY_ARGUMENT.sub(" ", line)
+    line = _COMMAND.sub(" ", line)
+    return " ".join(_SYMBOLS.sub(" ", line).split())
+
+
+def iter_blocks(path: Path) -> Iterator[Block]:
+    # A file starting with \documentclass has a preamble to skip; fragments
+    # without one are body text from the first line.
+    in_preamble: Optional[bool] = None
+    buffer: List[str] = []
+    for raw in read_lines(path):
+        line = _COMMENT.sub("", raw)
+        if in_preamble is None and line.strip():
+            in_preamble = line.lstrip().startswith("\\documentclass")
+        if in_preamble:
+            title = _TITLE.match(line)
+            if title and _prose(title.group(1)):
+                yield TITLE, _prose(title.group(1))
+            if "\\begin{document}" in line:
+                in_preamble = False
+            continue
+        if "\\end{document}" in line:
+            break
+
+        section = _SECTION.match(line)
+        if section or _BEGIN_ABSTRACT.match(line) or _BEGIN_BIBLIOGRAPHY.match(line):
+            if buffer:
+                yield PARAGRAPH, " ".join(buffer)
+                buffer = []
+            if section:
+                title = _prose(section.group(1))
+            else:
+                title = "Abstract" if _BEGIN_ABSTRACT.match(line) else "References"
+            if title:
+                yield HEADING, title
+            continue
+        for float_kind in _BEGIN_FLOAT.findall(line):
+            yield (FIGURE if float_kind == "figure" else TABLE), ""
+        if _BIBITEM.match(line) and buffer:
+            yield PARAGRAPH, " ".join(buffer)
+            buffer = []
+        text = _prose(line)
+        if text:
+            buffer.append(text)
+        elif not raw.strip() and buffer:
+            yield PARAGRAPH, " ".join(buffer)
+            buffer = []
+    if buffer:
+        yield PARAGRAPH, " ".join(buffer)
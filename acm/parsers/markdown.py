@@ -0,0 +1,57 @@
+"""Markdown manuscripts with ATX (``# Title``) and setext headings.
+
+Paragraphs are separated by blank lines; each list item starts a new one so
+that reference lists yield one block per entry.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import re
+from typing import Iterator, List
+
+from . import HEADING, PARAGRAPH, Block, read_lines
+
+_ATX = re.compile(r"^ {0,3}#{1,6}\s+(.*?)(?:\s+#+)?\s*$")
+_SETEXT = re.compile(r"^ {0,3}(=+|-+)\s*$")
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+")
+
+
+def iter_blocks(path: Path) -> Iterator[Block]:
+    buffer: List[str] = []
+    fence = ""
+    for line in read_lines(path):
+        stripped = line.strip()
+        if fence:
+            if stripped.startswith(fence):
+                fence = ""
+            elif stripped:
+                buffer.append(stripped)
+            continue
+
+        opening = _FENCE.match(line)
+        if opening:
+            fence = opening.group(1)
+            continue
+
+        heading = _ATX.match(line)
+        if heading:
+            if buffer:
+                yield PARAGRAPH, " ".join(buffer)
+                buffer = []
+            if heading.group(1):
+                yield HEADING, heading.group(1)
+        elif buffer and _SETEXT.match(line):
+            yield HEADING, " ".join(buffer)
+            buffer = []
+        elif stripped:
+            if buffer and _LIST_ITEM.match(line):
+                yield PARAGRAPH, " ".join(buffer)
+                buffer = []
+            buffer.append(stripped)
+        elif buffer:
+            yield PARAGRAPH, " ".join(buffer)
+            buffer = []
+    if buffer:
+        yield PARAGRAPH, " ".join(buffer)
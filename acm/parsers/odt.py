@@ -0,0 +1,69 @@
+"""OpenDocument text (``.odt``) manuscripts read from ``content.xml``.
+
+``text:h`` elements are headings and ``text:p`` elements paragraphs (or the
+title, when styled "Title"), at any nesting level (lists, sections) except
+inside tables, footnotes and frames. Each table yields one table block.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, List
+from xml.etree import ElementTree
+import zipfile
+
+from . import HEADING, PARAGRAPH, TABLE, TITLE, Block
+
+_TEXT = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+_TABLE = "{urn:oasis:names:tc:opendocument:xmlns:table:1.0}"
+_DRAW = "{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}"
+
+_BLOCKS = {_TEXT + "h": HEADING, _TEXT + "p": PARAGRAPH}
+_SKIPPED = {_TABLE + "table", _TEXT + "note", _DRAW + "frame"}
+_SPACES = {_TEXT + "s": " ", _TEXT + "tab": "\t", _TEXT + "line-break": "\n"}
+
+
+def _text(element: ElementTree.Element, parts: List[str]) -> None:
+    if element.text:
+        parts.append(element.text)
+    for child in element:
+        if child.tag in _SPACES:
+            parts.append(_SPACES[child.tag])
+        elif child.tag not in _SKIPPED:
+            _text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+
+
+def iter_blocks(path: Path) -> Iterator[Block]:
+    with zipfile.ZipFile(path) as archive, archive.open("content.xml") as stream:
+        stack: List[ElementTree.Element] = []
+        in_block = skipped = 0
+        for event, element in ElementTree.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                stack.append(element)
+                if element.tag in _SKIPPED:
+                    skipped += 1
+                elif element.tag in _BLOCKS:
+                    in_block += 1
+                continue
+
+            stack.pop()
+            if element.tag in _SKIPPED:
+                skipped -= 1
+                if element.tag == _TABLE + "table" and not skipped and not in_block:
+                    yield TABLE, ""
+            elif element.tag in _BLOCKS:
+                in_block -= 1
+                if not in_block and not skipped:
+                    parts: List[str] = []
+                    _text(element, parts)
+                    text = "".join(parts).strip()
+                    if text:
+                        kind = _BLOCKS[element.tag]
+                        if kind == PARAGRAPH and element.get(_TEXT + "style-name") == "Title":
+                            kind = TITLE
+                        yield kind, text
+            # Drop finished structural elements so memory stays bounded.
+            if not in_block and stack:
+                stack[-1].remove(element)
@@ -0,0 +1,20 @@
+"""Plain-text manuscripts: paragraphs separated by blank lines, no headings."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, List
+
+from . import PARAGRAPH, Block, read_lines
+
+
+def iter_blocks(path: Path) -> Iterator[Block]:
+    buffer: List[str] = []
+    for line in read_lines(path):
+        if line.strip():
+            buffer.append(line.strip())
+        elif buffer:
+            yield PARAGRAPH, " ".join(buffer)
+            buffer = []
+    if buffer:
+        yield PARAGRAPH, " ".join(buffer)
@@ -1,21 +1,198 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
+
+
+class ChildList(list):
+    """A node's list of children that keeps parent links and caches in sync.
+
+    Every mutation sets the parent link of added children, clears it on
+    removed ones and invalidates the owner's cached roll-up.
+    """
+
+    _owner: Optional["RollupNode"] = None
+
+    def __init__(self, owner: Optional["RollupNode"] = None, items: Iterable = ()):
+        super().__init__()
+        self._owner = owner
+        self.extend(items)
+
+    def _adopt(self, children: Iterable["RollupNode"]) -> None:
+        # Unowned lists (e.g. mid-unpickling) leave restored links alone.
+        if self._owner is None:
+            return
+        for child in children:
+            object.__setattr__(child, "_parent", self._owner)
+
+    def _orphan(self, children: Iterable["RollupNode"]) -> None:
+        for child in children:
+            if child._parent is self._owner:
+                object.__setattr__(child, "_parent", None)
+
+    def _changed(self) -> None:
+        if self._owner is not None:
+            self._owner._children_changed()
+
+    def append(self, child) -> None:
+        super().append(child)
+        self._adopt((child,))
+        self._changed()
+
+    def extend(self, children) -> None:
+        children = list(children)
+        super().extend(children)
+        self._adopt(children)
+        self._changed()
+
+    def __iadd__(self, children):  # type: ignore[misc]
+        self.extend(children)
+        return self
+
+    def __imul__(self, count):  # type: ignore[misc]
+        old = list(self)
+        super().__imul__(count)
+        if self:
+            self._adopt(self)
+        else:
+            self._orphan(old)
+        self._changed()
+        return self
+
+    def insert(self, index, child) -> None:
+        super().insert(index, child)
+        self._adopt((child,))
+        self._changed()
+
+    def __setitem__(self, index, value) -> None:
+        old = self[index]
+        super().__setitem__(index, value)
+        self._orphan(old if isinstance(index, slice) else (old,))
+        self._adopt(value if isinstance(index, slice) else (value,))
+        self._changed()
+
+    def __delitem__(self, index) -> None:
+        old = self[index]
+        super().__delitem__(index)
+        self._orphan(old if isinstance(index, slice) else (old,))
+        self._changed()
+
+    def pop(self, index=-1):
+        child = super().pop(index)
+        self._orphan((child,))
+        self._changed()
+        return child
+
+    def remove(self, child) -> None:
+        super().remove(child)
+        self._orphan((child,))
+        self._changed()
+
+    def clear(self) -> None:
+        old = list(self)
+        super().clear()
+        self._orphan(old)
+        self._changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+
+class RollupNode:
+    """Mixin caching a node's rolled-up progress.
+
+    Nodes keep a link to their parent. Assigning one of ``_INPUTS`` or
+    changing the children drops the cached value of the node and of its
+    ancestors, so repeated queries are O(1) and an update costs O(depth).
+    A clean node only has clean descendants, so invalidation stops at the
+    first ancestor that is already dirty.
+    """
+
+    _CHILDREN = "children"
+    _INPUTS: Tuple[str, ...] = ("percent",)
+    _parent: Optional["RollupNode"] = None
+    _cached: Optional[float] = None
+
+    def __setattr__(self, name, value) -> None:
+        if name == self._CHILDREN:
+            old = self.__dict__.get(name)
+            if isinstance(old, ChildList):
+                old._orphan(old)
+            value = ChildList(self, value)
+        object.__setattr__(self, name, value)
+        if name == self._CHILDREN:
+            self._children_changed()
+        elif name in self._INPUTS:
+            self._invalidate()
+
+    @property
+    def parent(self) -> Optional["RollupNode"]:
+        return self._parent
+
+    def _children_changed(self) -> None:
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        node: Optional[RollupNode] = self
+        while node is not None and node._cached is not None:
+            object.__setattr__(node, "_cached", None)
+            node = node._parent
+
+    def _own_percent(self) -> Optional[float]:
+        raise NotImplementedError
+
+    def computed_percent(self) -> float:
+        """Return this node's progress percent, averaging children if needed."""
+        if self._cached is None:
+            self._roll_up()
+        return self._cached  # type: ignore[return-value]
+
+    def _roll_up(self) -> None:
+        # Post-order walk over the dirty part of the subtree with an explicit
+        # stack, so deep trees do not hit the recursion limit. Children that
+        # do not depend on their own children (leaves and nodes with a
+        # percent of their own) are settled in place rather than pushed.
+        setattr_ = object.__setattr__
+        stack: List[RollupNode] = [self]
+        while stack:
+            node = stack[-1]
+            own = node._own_percent()
+            children = getattr(node, node._CHILDREN)
+            if own is None and children:
+                pending = []
+                for child in children:
+                    if child._cached is not None:
+                        continue
+                    value = child._own_percent()
+                    if value is None and getattr(child, child._CHILDREN):
+                        pending.append(child)
+                    else:
+                        setattr_(child, "_cached", 0.0 if value is None else float(value))
+                if pending:
+                    # Revisited once these are done; the scan above then
+                    # finds every child settled.
+                    stack.extend(pending)
+                    continue
+                value = sum(c._cached for c in children) / len(children)
+            else:
+                value = 0.0 if own is None else float(own)
+            setattr_(node, "_cached", value)
+            stack.pop()
+
 
 @dataclass
-class TaskNode:
+class TaskNode(RollupNode):
     """Represents a checklist item with an optional percentage and subtasks."""
 
     name: str
     percent: Optional[float] = None  # 0-100
     children: List['TaskNode'] = field(default_factory=list)
 
-    def computed_percent(self) -> float:
-        """Return this node's progress percent, averaging children if needed."""
-        if self.percent is not None:
-            return float(self.percent)
-        if not self.children:
-            return 0.0
-        return sum(child.computed_percent() for child in self.children) / len(self.children)
+    def _own_percent(self) -> Optional[float]:
+        return self.percent
 
 
 def progress_bar(percent: float, width: int = 20, filled: str = "█", empty: str = "░") -> str:
@@ -25,13 +202,27 @@ def progress_bar(percent: float, width: int = 20, filled: str = "█", empty: st
     return filled * filled_len + empty * (width - filled_len)
 
 
+_RENDER_BLOCK = 256
+
+
 def render_tree(node: TaskNode, indent: int = 0, bar_width: int = 20) -> str:
     """Render the task tree with progress bars using indentation."""
-    pct = node.computed_percent()
-    bar = progress_bar(pct, bar_width)
-    lines = [f"{'  '*indent}{node.name}: [{bar}] {pct:6.2f}%"]
-    for child in node.children:
-        lines.append(render_tree(child, indent + 1, bar_width))
-    return "\n".join(lines)
-
-__all__ = ["TaskNode", "progress_bar", "render_tree"]
+    # Lines are joined in blocks as they are produced: thousands of small
+    # line strings cost more memory than the text they hold.
+    blocks: List[str] = []
+    lines: List[str] = []
+    stack = [(node, indent)]
+    while stack:
+        if len(lines) == _RENDER_BLOCK:
+            blocks.append("\n".join(lines))
+            lines = []
+        current, depth = stack.pop()
+        pct = current.computed_percent()
+        bar = progress_bar(pct, bar_width)
+        lines.append(f"{'  '*depth}{current.name}: [{bar}] {pct:6.2f}%")
+        if current.children:
+            stack.extend([(child, depth + 1) for child in reversed(current.children)])
+    blocks.append("\n".join(lines))
+    return "\n".join(blocks)
+
+__all__ = ["ChildList", "RollupNode", "TaskNode", "progress_bar", "render_tree"]
@@ -0,0 +1,206 @@
+"""Lazy, composable queries over checklist trees.
+
+A :class:`Query` describes a traversal (depth- or breadth-first, optionally
+bounded in depth or pruned), filters and a limit. Nothing is visited until
+the query is iterated, and iteration stops as soon as the limit is reached,
+so ``Query(checklist).incomplete().leaves().first()`` only walks as far as
+the first unfinished leaf.
+
+>>> from acm.domain import Checklist, TaskNode
+>>> checklist = Checklist(tasks=[TaskNode(item="Methods", subtasks=[
+...     TaskNode(item="Stats", done=True), TaskNode(item="Code")])])
+>>> [entry.path_str for entry in Query(checklist).leaves().incomplete()]
+['Methods/Code']
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, replace
+from fnmatch import fnmatchcase
+from itertools import islice
+from typing import Callable, Iterator, Optional, Tuple, Union
+
+from .domain import Checklist, TaskNode
+
+ORDERS = ("depth", "breadth")
+
+
+@dataclass(frozen=True)
+class TaskEntry:
+    """A task reached by a traversal, with its path from the root."""
+
+    path: Tuple[str, ...]
+    node: TaskNode
+
+    @property
+    def path_str(self) -> str:
+        return "/".join(self.path)
+
+    @property
+    def depth(self) -> int:
+        """Zero for top-level tasks."""
+        return len(self.path) - 1
+
+    @property
+    def is_leaf(self) -> bool:
+        return not self.node.subtasks
+
+    def percent(self) -> float:
+        return self.node.computed_percent()
+
+
+Predicate = Callable[[TaskEntry], bool]
+
+
+def _roots(source: Union[Checklist, TaskNode]) -> Tuple[Tuple[str, ...], TaskNode]:
+    # A checklist's top-level tasks are the subtasks of its unnamed root.
+    if isinstance(source, Checklist):
+        return (), source.root
+    return (source.item,), source
+
+
+def walk(
+    source: Union[Checklist, TaskNode],
+    order: str = "depth",
+    max_depth: Optional[int] = None,
+    prune: Optional[Predicate] = None,
+) -> Iterator[TaskEntry]:
+    """Yield the tasks under ``source`` lazily, in pre-order or level order.
+
+    For a :class:`Checklist` every task is yielded; for a :class:`TaskNode`
+    the node itself comes first. Tasks deeper than ``max_depth`` are not
+    visited, and the subtasks of entries for which ``prune`` is true are
+    skipped (the entry itself is still yielded).
+    """
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order {order!r}; choose from {', '.join(ORDERS)}")
+    path, node = _roots(source)
+    if path:
+        pending = deque([TaskEntry(path, node)])
+    else:
+        pending = deque(TaskEntry((sub.item,), sub) for sub in node.subtasks)
+    take = pending.popleft if order == "breadth" else pending.pop
+    if order == "depth":
+        pending.reverse()
+    while pending:
+        entry = take()
+        yield entry
+        subtasks = entry.node.subtasks
+        if not subtasks or (max_depth is not None and entry.depth >= max_depth):
+            continue
+        if prune is not None and prune(entry):
+            continue
+        children = (TaskEntry(entry.path + (sub.item,), sub) for sub in subtasks)
+        if order == "depth":
+            pending.extend(reversed(list(children)))
+        else:
+            pending.extend(children)
+
+
+# -- predicates ---------------------------------------------------------
+
+
+def is_leaf(entry: TaskEntry) -> bool:
+    return entry.is_leaf
+
+
+def is_incomplete(entry: TaskEntry) -> bool:
+    return entry.percent() < 100
+
+
+def is_done(entry: TaskEntry) -> bool:
+    return entry.node.done or entry.percent() >= 100
+
+
+def below(percent: float) -> Predicate:
+    """Match tasks whose rolled-up progress is under ``percent``."""
+    return lambda entry: entry.percent() < percent
+
+
+def matching(pattern: str) -> Predicate:
+    """Match tasks by a case-insensitive shell-style pattern.
+
+    Patterns containing ``/`` are matched against the full path, others
+    against the task's own item.
+    """
+    pattern = pattern.casefold()
+    if "/" in pattern:
+        return lambda entry: fnmatchcase(entry.path_str.casefold(), pattern)
+    return lambda entry: fnmatchcase(entry.node.item.casefold(), pattern)
+
+
+@dataclass(frozen=True)
+class Query:
+    """An immutable, lazily evaluated query; every method returns a new one."""
+
+    source: Union[Checklist, TaskNode]
+    order: str = "depth"
+    depth_limit: Optional[int] = None
+    predicates: Tuple[Predicate, ...] = ()
+    pruners: Tuple[Predicate, ...] = ()
+    count_limit: Optional[int] = None
+
+    def depth_first(self) -> "Query":
+        return replace(self, order="depth")
+
+    def breadth_first(self) -> "Query":
+        return replace(self, order="breadth")
+
+    def max_depth(self, depth: int) -> "Query":
+        """Do not descend below ``depth`` (0 keeps only top-level tasks)."""
+        return replace(self, depth_limit=depth)
+
+    def where(self, predicate: Predicate) -> "Query":
+        """Keep only entries matching ``predicate`` (in addition to earlier filters)."""
+        return replace(self, predicates=self.predicates + (predicate,))
+
+    def prune(self, predicate: Predicate) -> "Query":
+        """Do not descend into the subtasks of entries matching ``predicate``."""
+        return replace(self, pruners=self.pruners + (predicate,))
+
+    def leaves(self) -> "Query":
+        return self.where(is_leaf)
+
+    def incomplete(self) -> "Query":
+        """Keep unfinished tasks and skip finished subtrees entirely."""
+        return self.where(is_incomplete).prune(is_done)
+
+    def below(self, percent: float) -> "Query":
+        return self.where(below(percent))
+
+    def matching(self, pattern: str) -> "Query":
+        return self.where(matching(pattern))
+
+    def limit(self, count: int) -> "Query":
+        return replace(self, count_limit=count)
+
+    def __iter__(self) -> Iterator[TaskEntry]:
+        pruners = self.pruners
+        prune = (lambda entry: any(p(entry) for p in pruners)) if pruners else None
+        entries = walk(self.source, self.order, self.depth_limit, prune)
+        predicates = self.predicates
+        if predicates:
+            entries = (e for e in entries if all(p(e) for p in predicates))
+        if self.count_limit is not None:
+            entries = islice(entries, self.count_limit)
+        return entries
+
+    def first(self) -> Optional[TaskEntry]:
+        return next(iter(self), None)
+
+    def count(self) -> int:
+        return sum(1 for _ in self)
+
+
+__all__ = [
+    "ORDERS",
+    "Query",
+    "TaskEntry",
+    "below",
+    "is_done",
+    "is_incomplete",
+    "is_leaf",
+    "matching",
+    "walk",
+]
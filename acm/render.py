@@ -0,0 +1,82 @@
+"""Streaming text rendering of checklist trees.
+
+:func:`iter_lines` renders straight from :class:`acm.domain.TaskNode` and
+yields one line per task as it walks the tree, so callers can print or page
+the first screen before the rest of a large checklist has been visited.
+Lines have the same layout as :func:`acm.progress.render_tree`.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, List, Optional, Tuple, Union
+
+from .domain import Checklist, TaskNode
+from .progress import progress_bar
+
+ELLIPSIS = "…"
+# Shortest name kept before the progress bar is dropped to make room.
+MIN_NAME = 8
+
+
+def fit_line(indent: str, name: str, suffixes: Tuple[str, ...], width: Optional[int]) -> str:
+    """Return ``indent + name + suffixes[0]`` shortened to ``width`` columns.
+
+    The name is shortened first; if even that leaves too little room, the
+    next (shorter) suffix is tried, and finally the line is cut.
+    """
+    line = f"{indent}{name}{suffixes[0]}"
+    if width is None:
+        return line
+    for suffix in suffixes:
+        line = f"{indent}{name}{suffix}"
+        if len(line) <= width:
+            return line
+        room = width - len(indent) - len(suffix)
+        if room >= min(len(name), MIN_NAME):
+            return f"{indent}{name[: room - len(ELLIPSIS)]}{ELLIPSIS}{suffix}"
+    return line[: max(width - len(ELLIPSIS), 0)] + ELLIPSIS
+
+
+def iter_lines(
+    source: Union[Checklist, TaskNode],
+    name: Optional[str] = None,
+    max_depth: Optional[int] = None,
+    collapse_done: bool = False,
+    width: Optional[int] = None,
+    bar_width: int = 20,
+) -> Iterator[str]:
+    """Yield the progress tree of ``source`` line by line.
+
+    A :class:`Checklist` is rendered under a root line called ``name``.
+    Subtasks deeper than ``max_depth`` (the root is depth 0) are hidden, and
+    with ``collapse_done`` the subtasks of finished tasks are too. Hidden
+    subtasks are counted as ``[+N]`` after the parent. Task names are
+    shortened, and then progress bars dropped, so lines fit in ``width``
+    columns.
+    """
+    root = source.root if isinstance(source, Checklist) else source
+    label = name if name is not None else root.item
+    stack: List[Tuple[TaskNode, str, int]] = [(root, label, 0)]
+    while stack:
+        node, text, depth = stack.pop()
+        pct = node.computed_percent()
+        subtasks = node.subtasks
+        expand = bool(subtasks) and (max_depth is None or depth < max_depth)
+        if expand and collapse_done and pct >= 100:
+            expand = False
+        hidden = f" [+{len(subtasks)}]" if subtasks and not expand else ""
+        suffixes = (
+            f": [{progress_bar(pct, bar_width)}] {pct:6.2f}%{hidden}",
+            f": {pct:.0f}%{hidden}",
+        )
+        yield fit_line("  " * depth, text, suffixes, width)
+        if expand:
+            stack.extend((sub, sub.item, depth + 1) for sub in reversed(subtasks))
+
+
+def render(source: Union[Checklist, TaskNode], **options) -> str:
+    """Return :func:`iter_lines` joined into one string."""
+    return "\n".join(iter_lines(source, **options))
+
+
+__all__ = ["fit_line", "iter_lines", "render"]
@@ -0,0 +1,312 @@
+"""Incremental re-analysis of revised manuscripts.
+
+A :class:`RevisionSnapshot` records the digest of an analysed manuscript's
+file and, for every section, the content hash and word count of each
+paragraph. The paragraph hashes give a per-section diff of words added and
+removed against the next version; as they are computed anyway, words are
+only counted in paragraphs whose hash is new. A file whose digest matches
+the snapshot is not parsed again.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .analysis import PARSER_VERSION, SectionSummary, categorize_section, iter_blocks
+from .cache import file_digest
+from .parsers import FIGURE, HEADING, TABLE, Block
+
+# (paragraph digest, word count)
+Paragraph = Tuple[str, int]
+
+
+def _digest(*parts: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+@dataclass
+class SectionSnapshot:
+    """Hashes and word counts of the paragraphs of one section."""
+
+    title: str
+    category: str
+    digest: str
+    paragraphs: List[Paragraph] = field(default_factory=list)
+
+    @property
+    def word_count(self) -> int:
+        return sum(words for _, words in self.paragraphs)
+
+    def summary(self) -> SectionSummary:
+        return SectionSummary(title=self.title, word_count=self.word_count, category=self.category)
+
+
+@dataclass
+class RevisionSnapshot:
+    """Per-paragraph hashes and word counts of one manuscript version."""
+
+    sections: List[SectionSnapshot] = field(default_factory=list)
+    version: str = PARSER_VERSION
+    # SHA-256 of the analysed file's bytes (see acm.cache.file_digest).
+    source: str = ""
+
+    def describes(self, path: Path) -> bool:
+        """Return whether the snapshot was taken of ``path`` as it is now."""
+        return bool(self.source) and self.version == PARSER_VERSION and (
+            self.source == file_digest(Path(path))
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "source": self.source,
+            "sections": [
+                {
+                    "title": s.title,
+                    "category": s.category,
+                    "digest": s.digest,
+                    "paragraphs": [list(p) for p in s.paragraphs],
+                }
+                for s in self.sections
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RevisionSnapshot":
+        return cls(
+            version=data.get("version", ""),
+            source=data.get("source", ""),
+            sections=[
+                SectionSnapshot(
+                    title=s["title"],
+                    category=s["category"],
+                    digest=s["digest"],
+                    paragraphs=[(d, int(w)) for d, w in s.get("paragraphs", [])],
+                )
+                for s in data.get("sections", [])
+            ],
+        )
+
+    def save(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_dict()))
+
+    @classmethod
+    def load(cls, path: Path) -> "RevisionSnapshot":
+        return cls.from_dict(json.loads(path.read_text()))
+
+
+@dataclass
+class SectionDelta:
+    """Words added and removed in one section between two versions."""
+
+    title: str
+    words_before: int
+    words_after: int
+    added: int
+    removed: int
+
+    @property
+    def status(self) -> str:
+        if self.words_before == 0 and self.removed == 0 and self.added:
+            return "added"
+        if self.words_after == 0 and self.added == 0 and self.removed:
+            return "removed"
+        return "changed" if self.added or self.removed else "unchanged"
+
+
+@dataclass
+class RevisionResult:
+    sections: List[SectionSummary]
+    snapshot: RevisionSnapshot
+    diff: List[SectionDelta]
+    recounted: int
+    reused: int
+
+
+def _section_diff(old: Optional[SectionSnapshot], new: Optional[SectionSnapshot]) -> SectionDelta:
+    before = Counter(old.paragraphs) if old else Counter()
+    after = Counter(new.paragraphs) if new else Counter()
+    if old is not None and new is not None and old.digest == new.digest:
+        added = removed = 0
+    else:
+        added = sum(words * n for (_, words), n in (after - before).items())
+        removed = sum(words * n for (_, words), n in (before - after).items())
+    section = new if new is not None else old
+    assert section is not None
+    return SectionDelta(
+        title=section.title,
+        words_before=old.word_count if old else 0,
+        words_after=new.word_count if new else 0,
+        added=added,
+        removed=removed,
+    )
+
+
+def diff_snapshots(old: RevisionSnapshot, new: RevisionSnapshot) -> List[SectionDelta]:
+    """Pair sections by title (in order for duplicates) and diff their words."""
+
+    pending: Dict[str, List[SectionSnapshot]] = {}
+    for section in old.sections:
+        pending.setdefault(section.title, []).append(section)
+
+    deltas: List[SectionDelta] = []
+    for section in new.sections:
+        candidates = pending.get(section.title)
+        previous = candidates.pop(0) if candidates else None
+        deltas.append(_section_diff(previous, section))
+    for leftovers in pending.values():
+        deltas.extend(_section_diff(section, None) for section in leftovers)
+    return deltas
+
+
+class RevisionTracker:
+    """Hash the paragraphs of a block stream while another consumer reads it.
+
+    :meth:`track` passes the blocks through unchanged, so a manuscript can be
+    measured and snapshotted with a single read::
+
+        tracker = RevisionTracker(path, previous)
+        metrics = collect_metrics(tracker.track(iter_blocks(path)))
+        revision = tracker.result()
+    """
+
+    def __init__(self, path: Path, previous: Optional[RevisionSnapshot] = None):
+        if previous is not None and previous.version != PARSER_VERSION:
+            previous = None
+        self.previous = previous
+        self.source = file_digest(Path(path))
+        self._groups: List[Tuple[Optional[str], List[Paragraph]]] = [(None, [])]
+        self._recounted = self._reused = 0
+        self._stream: Iterator[Block] = iter(())
+
+    def track(self, blocks: Iterable[Block]) -> Iterator[Block]:
+        """Return ``blocks`` as an iterator that hashes paragraphs on the way."""
+        self._stream = self._hash(blocks)
+        return self._stream
+
+    def _hash(self, blocks: Iterable[Block]) -> Iterator[Block]:
+        known_words: Dict[str, int] = {}
+        if self.previous is not None:
+            for section in self.previous.sections:
+                known_words.update(section.paragraphs)
+
+        # Hashing a paragraph is needed for the diff; once done, looking its
+        # count up is cheaper than splitting it again for paragraphs of more
+        # than a few words.
+        recounted = reused = 0
+        groups = self._groups
+        for block in blocks:
+            kind, text = block
+            if kind == HEADING:
+                groups.append((text, []))
+            elif kind not in (FIGURE, TABLE):
+                digest = _digest(text)
+                words = known_words.get(digest)
+                if words is None:
+                    words = len(text.split())
+                    known_words[digest] = words
+                    recounted += 1
+                else:
+                    reused += 1
+                groups[-1][1].append((digest, words))
+            yield block
+        self._recounted = recounted
+        self._reused = reused
+
+    def result(self) -> RevisionResult:
+        """Finish reading the tracked blocks and return the revision."""
+        # The consumer may have stopped early or not read at all (e.g. on an
+        # analysis cache hit).
+        for _ in self._stream:
+            pass
+
+        # Text before the first heading only counts when there are no headings.
+        groups = list(self._groups)
+        _, preamble = groups.pop(0)
+        fallback = not groups
+        if fallback:
+            groups = [("Document", preamble)]
+
+        snapshots: List[SectionSnapshot] = []
+        for title, paragraphs in groups:
+            assert title is not None
+            digest = _section_digest(fallback, title, paragraphs)
+            category = "Other" if fallback else categorize_section(title)
+            snapshots.append(SectionSnapshot(title, category, digest, paragraphs))
+
+        snapshot = RevisionSnapshot(sections=snapshots, source=self.source)
+        previous = self.previous
+        return RevisionResult(
+            sections=[s.summary() for s in snapshots],
+            snapshot=snapshot,
+            diff=diff_snapshots(previous, snapshot) if previous is not None else [],
+            recounted=self._recounted,
+            reused=self._reused,
+        )
+
+
+def analyze_revision(
+    path: Path,
+    previous: Optional[RevisionSnapshot] = None,
+    blocks: Optional[Iterable[Block]] = None,
+) -> RevisionResult:
+    """Analyse ``path`` reusing work from the ``previous`` version's snapshot.
+
+    Produces the same sections as :func:`acm.analysis.parse_sections`.
+    Word counts are reused for paragraphs whose hash appears in ``previous``.
+    Without ``blocks``, a file that :meth:`RevisionSnapshot.describes`
+    ``previous`` is not read at all. Section categories are always derived
+    from the current section keywords.
+    """
+
+    tracker = RevisionTracker(path, previous)
+    if blocks is None and tracker.previous is not None and tracker.previous.source == tracker.source:
+        return _unchanged(tracker.previous)
+    tracker.track(blocks if blocks is not None else iter_blocks(path))
+    return tracker.result()
+
+
+def _section_digest(fallback: bool, title: str, paragraphs: List[Paragraph]) -> str:
+    return _digest(str(fallback), title, *(d for d, _ in paragraphs))
+
+
+def _unchanged(previous: RevisionSnapshot) -> RevisionResult:
+    # The stored categories may predate keywords registered since.
+    sections = [
+        SectionSnapshot(
+            s.title,
+            "Other"
+            if s.digest == _section_digest(True, s.title, s.paragraphs)
+            else categorize_section(s.title),
+            s.digest,
+            s.paragraphs,
+        )
+        for s in previous.sections
+    ]
+    snapshot = RevisionSnapshot(sections=sections, source=previous.source)
+    return RevisionResult(
+        sections=[s.summary() for s in sections],
+        snapshot=snapshot,
+        diff=diff_snapshots(previous, snapshot),
+        recounted=0,
+        reused=sum(len(s.paragraphs) for s in sections),
+    )
+
+
+__all__ = [
+    "RevisionSnapshot",
+    "SectionDelta",
+    "RevisionResult",
+    "RevisionTracker",
+    "analyze_revision",
+    "diff_snapshots",
+]
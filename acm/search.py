@@ -0,0 +1,191 @@
+"""Full-text search over journal guidelines.
+
+:class:`GuidelineIndex` is an inverted index over the journal name, article
+type and requirement text of every guideline. Query terms match whole words,
+word prefixes (so results update as the user types) and, for words of four
+or more letters, words or prefixes one typo away. A prefix expands to at
+most :data:`MAX_PREFIX_TERMS` words, those found in the most guidelines.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+import heapq
+import re
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .journal import Guideline, guideline_registry
+
+_TOKEN = re.compile(r"\w+")
+
+# Field weights: a hit in the journal name beats one in the requirement text.
+FIELD_WEIGHTS = (
+    ("journal", 3),
+    ("article_type", 2),
+    ("title_limit", 1),
+    ("abstract_limit", 1),
+    ("word_limit", 1),
+    ("figure_limit", 1),
+    ("reference_limit", 1),
+    ("structure", 1),
+    ("other_requirements", 1),
+)
+EXACT, PREFIX, FUZZY = 1.0, 0.8, 0.5
+MIN_FUZZY_LENGTH = 4
+# Words a (possibly misspelt) prefix expands to; rarer words beyond this are
+# not matched by the prefix.
+MAX_PREFIX_TERMS = 64
+_LAST_CHAR = chr(sys.maxunicode)
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.casefold())
+
+
+def _field_text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return " ".join(str(item) for item in value)
+
+
+def _deletions(term: str) -> Iterator[str]:
+    for i in range(len(term)):
+        yield term[:i] + term[i + 1 :]
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Return whether ``a`` and ``b`` differ by at most one edit or swap."""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        substituted = a[i + 1 :] == b[i + 1 :]
+        swapped = a[i : i + 2] == b[i : i + 2][::-1] and a[i + 2 :] == b[i + 2 :]
+        return substituted or swapped
+    return a[i:] == b[i + 1 :]
+
+
+@dataclass
+class SearchHit:
+    guideline: Guideline
+    score: float
+
+
+class GuidelineIndex:
+    """Inverted index with prefix and typo-tolerant matching.
+
+    Every query term must match (in any field); hits are ranked by the sum of
+    their best per-term score and then by catalog order.
+
+    >>> index = GuidelineIndex([Guideline(journal="eLife", article_type="Research Advance")])
+    >>> [hit.guideline.journal for hit in index.search("reserch adv")]
+    ['eLife']
+    """
+
+    def __init__(self, guidelines: Iterable[Guideline]):
+        self.guidelines: List[Guideline] = list(guidelines)
+        # term -> {guideline index: best field weight}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        for doc, g in enumerate(self.guidelines):
+            for name, weight in FIELD_WEIGHTS:
+                for term in tokenize(_field_text(getattr(g, name, None))):
+                    docs = self._postings.setdefault(term, {})
+                    if docs.get(doc, 0) < weight:
+                        docs[doc] = weight
+        self._terms: List[str] = sorted(self._postings)
+        self._deletes: Dict[str, Set[str]] = {}
+        for term in self._terms:
+            if len(term) >= MIN_FUZZY_LENGTH:
+                for variant in _deletions(term):
+                    self._deletes.setdefault(variant, set()).add(term)
+
+    def __len__(self) -> int:
+        return len(self.guidelines)
+
+    def _frequent(self, terms: Iterable[str]) -> List[str]:
+        # The terms in the most guidelines, in vocabulary order among equals.
+        return heapq.nlargest(MAX_PREFIX_TERMS, terms, key=lambda t: len(self._postings[t]))
+
+    def _prefixed(self, prefix: str) -> List[str]:
+        start = bisect_left(self._terms, prefix)
+        end = bisect_left(self._terms, prefix + _LAST_CHAR, start)
+        return self._frequent(self._terms[start:end])
+
+    def _similar_prefixed(self, prefix: str) -> List[str]:
+        # Terms whose start is one edit from ``prefix``; candidates share its
+        # first letter so only a slice of the vocabulary is checked.
+        start = bisect_left(self._terms, prefix[0])
+        end = bisect_left(self._terms, prefix[0] + _LAST_CHAR, start)
+        size = len(prefix)
+        return self._frequent(
+            term
+            for term in self._terms[start:end]
+            if any(_within_one_edit(prefix, term[:n]) for n in (size - 1, size, size + 1))
+        )
+
+    def _similar(self, term: str) -> Set[str]:
+        candidates = set(self._deletes.get(term, ()))
+        for variant in _deletions(term):
+            if variant in self._postings:
+                candidates.add(variant)
+            candidates.update(self._deletes.get(variant, ()))
+        return {c for c in candidates if _within_one_edit(term, c)}
+
+    def expand(self, term: str) -> List[Tuple[str, float]]:
+        """Return the indexed terms matching ``term`` with their match weight."""
+        matches: Dict[str, float] = {}
+        if len(term) >= MIN_FUZZY_LENGTH:
+            for candidate in self._similar(term):
+                matches[candidate] = FUZZY
+            for candidate in self._similar_prefixed(term):
+                matches[candidate] = FUZZY
+        for candidate in self._prefixed(term):
+            matches[candidate] = PREFIX
+        if term in self._postings:
+            matches[term] = EXACT
+        return list(matches.items())
+
+    def search(self, query: str, limit: Optional[int] = 20) -> List[SearchHit]:
+        """Return guidelines matching every term of ``query``, best first."""
+        scores: Optional[Dict[int, float]] = None
+        for term in dict.fromkeys(tokenize(query)):
+            term_scores: Dict[int, float] = {}
+            for candidate, weight in self.expand(term):
+                for doc, field_weight in self._postings[candidate].items():
+                    score = weight * field_weight
+                    if term_scores.get(doc, 0.0) < score:
+                        term_scores[doc] = score
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    doc: score + term_scores[doc]
+                    for doc, score in scores.items()
+                    if doc in term_scores
+                }
+            if not scores:
+                return []
+        if scores is None:
+            return []
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [SearchHit(self.guidelines[doc], score) for doc, score in ranked]
+
+
+def guideline_index(path=None) -> GuidelineIndex:
+    """Return the search index of a catalog, rebuilt only when it changes."""
+    return guideline_registry(path).derived("search", GuidelineIndex)
+
+
+__all__ = ["GuidelineIndex", "SearchHit", "guideline_index", "tokenize"]
@@ -0,0 +1,206 @@
+"""Per-section storage for manuscripts.
+
+Instead of a single ``manuscript.yaml``, a manuscript can live in a
+``manuscript/`` directory holding a small ``manifest.yaml`` (section
+order, names, word limits and file names) and one plain-text file per
+section. :class:`SectionStore` reads the manifest up front and a section's
+text only when that section is accessed. :func:`write_sections` rewrites
+only the section files whose text changed and the manifest only when the
+metadata changed, each through :func:`acm.storage.atomic_write`.
+
+:func:`acm.manuscript.load_sections` and :func:`acm.manuscript.save_sections`
+pick this layout automatically when the manifest exists.
+"""
+
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from pathlib import Path
+import re
+from typing import Collection, Dict, Iterator, List, Mapping, Optional, Set
+
+from .storage import atomic_write, yaml_dump, yaml_load
+
+SECTIONS_DIR = "manuscript"
+MANIFEST = "manifest.yaml"
+MANIFEST_VERSION = 1
+SECTION_SUFFIX = ".md"
+
+_UNSAFE = re.compile(r"[^\w-]+")
+
+
+def manifest_path(path: Path) -> Path:
+    """Return the manifest of the per-section layout under project ``path``."""
+    return Path(path) / SECTIONS_DIR / MANIFEST
+
+
+def is_split(path: Path) -> bool:
+    """Return whether the manuscript under ``path`` uses per-section files."""
+    return manifest_path(path).exists()
+
+
+def _read_manifest(directory: Path) -> List[dict]:
+    file = directory / MANIFEST
+    if not file.exists():
+        return []
+    data = yaml_load(file.read_text(encoding="utf-8")) or {}
+    if data.get("version", MANIFEST_VERSION) != MANIFEST_VERSION:
+        raise ValueError(f"{file} has unsupported version {data.get('version')!r}")
+    return list(data.get("sections") or [])
+
+
+def _file_name(name: str, used: Set[str]) -> str:
+    stem = _UNSAFE.sub("-", name.casefold()).strip("-") or "section"
+    candidate, n = stem, 1
+    while candidate + SECTION_SUFFIX in used:
+        n += 1
+        candidate = f"{stem}-{n}"
+    return candidate + SECTION_SUFFIX
+
+
+class SectionStore(MutableMapping):
+    """Manuscript sections backed by a manifest and one file per section.
+
+    Behaves like the ``{name: {"text": ..., "limit": ...}}`` dict returned
+    by :func:`acm.manuscript.load_sections`; a section's file is read the
+    first time the section is looked up.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        # name -> {"file": ..., "limit": ...} in manuscript order
+        self._entries: Dict[str, dict] = {
+            entry["name"]: {"file": entry.get("file"), "limit": entry.get("limit")}
+            for entry in _read_manifest(self.directory)
+        }
+        self._loaded: Dict[str, dict] = {}
+        # Text of loaded sections as last read from or written to disk.
+        self._saved: Dict[str, str] = {}
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
+
+    def limit(self, name: str) -> Optional[int]:
+        """Return the word limit of ``name`` without reading its text."""
+        if name in self._loaded:
+            return self._loaded[name].get("limit")
+        return self._entries[name]["limit"]
+
+    def __getitem__(self, name: str) -> dict:
+        section = self._loaded.get(name)
+        if section is not None:
+            return section
+        entry = self._entries[name]
+        file = self.directory / entry["file"] if entry["file"] else None
+        text = file.read_text(encoding="utf-8") if file is not None and file.exists() else ""
+        section = {"text": text, "limit": entry["limit"]}
+        self._loaded[name] = section
+        self._saved[name] = text
+        return section
+
+    def __setitem__(self, name: str, section: dict) -> None:
+        if name not in self._entries:
+            self._entries[name] = {"file": None, "limit": section.get("limit")}
+        self._loaded[name] = section
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+        self._loaded.pop(name, None)
+        self._saved.pop(name, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"SectionStore({str(self.directory)!r}, sections={list(self._entries)!r})"
+
+    def snapshot(self, names: Collection[str] = ()) -> Dict[str, dict]:
+        """Return a plain copy holding the text of loaded sections only.
+
+        Sections in ``names`` are loaded first. Unloaded sections carry just
+        their ``limit``; :func:`write_sections` leaves their files alone.
+        """
+        for name in names:
+            if name in self._entries:
+                self[name]
+        return {
+            name: dict(self._loaded[name]) if name in self._loaded else {"limit": entry["limit"]}
+            for name, entry in self._entries.items()
+        }
+
+    def save(self, names: Optional[Collection[str]] = None) -> int:
+        """Write changed sections (or just ``names``); return the files written."""
+        return write_sections(self.directory, self, names)
+
+
+def write_sections(
+    directory: Path,
+    sections: Mapping[str, dict],
+    only: Optional[Collection[str]] = None,
+) -> int:
+    """Write ``sections`` to the per-section layout in ``directory``.
+
+    Sections without a ``"text"`` key (or not yet loaded from a
+    :class:`SectionStore`) keep their file as it is. With ``only``, sections
+    outside it that already have a file are skipped too. Files of sections
+    no longer present are removed after the manifest is updated. Returns
+    the number of files written, including the manifest.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    store = sections if isinstance(sections, SectionStore) else None
+    old = {entry["name"]: entry for entry in _read_manifest(directory)}
+    used = {entry.get("file") for entry in old.values()}
+
+    manifest: List[dict] = []
+    written = 0
+    for name in sections:
+        file = old[name]["file"] if name in old else None
+        if store is not None:
+            file = file or store._entries[name]["file"]
+        if not file:
+            file = _file_name(name, used)
+            used.add(file)
+        if store is not None and not store.is_loaded(name):
+            manifest.append({"name": name, "file": file, "limit": store.limit(name)})
+            continue
+        section = sections[name]
+        manifest.append({"name": name, "file": file, "limit": section.get("limit")})
+        text = section.get("text")
+        if text is None:
+            continue
+        if only is not None and name not in only and name in old:
+            continue
+        if store is not None and name in old and store._saved.get(name) == text:
+            continue
+        atomic_write(directory / file, text.encode("utf-8"))
+        written += 1
+        if store is not None:
+            store._saved[name] = text
+
+    raw = yaml_dump({"version": MANIFEST_VERSION, "sections": manifest}).encode("utf-8")
+    manifest_file = directory / MANIFEST
+    if not manifest_file.exists() or manifest_file.read_bytes() != raw:
+        atomic_write(manifest_file, raw)
+        written += 1
+    kept = {entry["file"] for entry in manifest}
+    for name, entry in old.items():
+        if entry.get("file") and entry["file"] not in kept:
+            (directory / entry["file"]).unlink(missing_ok=True)
+    if store is not None:
+        for entry in manifest:
+            store._entries[entry["name"]]["file"] = entry["file"]
+    return written
+
+
+__all__ = [
+    "MANIFEST",
+    "SECTIONS_DIR",
+    "SectionStore",
+    "is_split",
+    "manifest_path",
+    "write_sections",
+]
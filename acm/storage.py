@@ -0,0 +1,145 @@
+"""Reading and writing project data in YAML, JSON or msgpack.
+
+YAML goes through libyaml's C loader and dumper when PyYAML was built with
+them, falling back to the pure-Python safe implementations. JSON and
+msgpack are compact alternatives for files that are not edited by hand;
+msgpack needs the optional ``msgpack`` package. The format of a file is
+taken from its extension or, failing that, sniffed from its first bytes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Any, Optional
+
+import yaml
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+FORMATS = ("yaml", "json", "msgpack")
+SUFFIXES = {
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+    ".msgpack": "msgpack",
+    ".mpk": "msgpack",
+}
+
+
+def yaml_load(text: str) -> Any:
+    return yaml.load(text, Loader=YAML_LOADER)
+
+
+def yaml_dump(data: Any) -> str:
+    return yaml.dump(data, Dumper=YAML_DUMPER, sort_keys=False)
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise RuntimeError("The msgpack format needs the 'msgpack' package") from exc
+    return msgpack
+
+
+def sniff_format(head: bytes) -> str:
+    """Guess the format of a file from its first bytes."""
+    stripped = head.lstrip()
+    if stripped[:1] in (b"{", b"["):
+        return "json"
+    if head[:1] and (0x80 <= head[0] <= 0x8F or head[0] in (0xDE, 0xDF)):
+        # msgpack maps (fixmap, map16, map32); not valid UTF-8 text starts.
+        return "msgpack"
+    return "yaml"
+
+
+def detect_format(path: Path) -> str:
+    """Return the format of ``path`` from its suffix or its content."""
+    fmt = SUFFIXES.get(Path(path).suffix.lower())
+    if fmt is not None:
+        return fmt
+    try:
+        with Path(path).open("rb") as f:
+            return sniff_format(f.read(8))
+    except FileNotFoundError:
+        return "yaml"
+
+
+def atomic_write(path: Path, raw: bytes) -> None:
+    """Replace ``path`` with ``raw`` so readers see the old or new file, never a mix.
+
+    The data is written to a temporary file in the same directory, flushed
+    to disk and renamed over ``path``.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(tmp, path.stat().st_mode & 0o777)
+        else:
+            os.chmod(tmp, 0o666 & ~_umask())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def dumps(data: Any, fmt: str) -> bytes:
+    if fmt == "yaml":
+        return yaml_dump(data).encode("utf-8")
+    if fmt == "json":
+        return json.dumps(data, indent=2).encode("utf-8")
+    if fmt == "msgpack":
+        return _msgpack().packb(data, use_bin_type=True)
+    raise ValueError(f"Unknown format: {fmt}")
+
+
+def loads(raw: bytes, fmt: str) -> Any:
+    if fmt == "yaml":
+        return yaml_load(raw.decode("utf-8"))
+    if fmt == "json":
+        return json.loads(raw)
+    if fmt == "msgpack":
+        return _msgpack().unpackb(raw, raw=False)
+    raise ValueError(f"Unknown format: {fmt}")
+
+
+def load_data(path: Path, fmt: Optional[str] = None) -> Any:
+    """Read ``path`` in ``fmt`` (detected when omitted)."""
+    path = Path(path)
+    raw = path.read_bytes()
+    return loads(raw, fmt or SUFFIXES.get(path.suffix.lower()) or sniff_format(raw[:8]))
+
+
+def save_data(data: Any, path: Path, fmt: Optional[str] = None) -> None:
+    """Write ``data`` to ``path`` in ``fmt`` (taken from the suffix when omitted)."""
+    path = Path(path)
+    atomic_write(path, dumps(data, fmt or SUFFIXES.get(path.suffix.lower(), "yaml")))
+
+
+__all__ = [
+    "FORMATS",
+    "atomic_write",
+    "detect_format",
+    "dumps",
+    "load_data",
+    "loads",
+    "save_data",
+    "sniff_format",
+    "yaml_dump",
+    "yaml_load",
+]
@@ -0,0 +1,186 @@
+"""Live status display that redraws only what changed.
+
+:class:`FileWatcher` polls ``os.stat`` of a few files and reports a change
+when their modification time, size or inode differ from the last poll, so
+an idle watch costs one ``stat`` per file per interval and the project is
+only reloaded after a write (or after the terminal is resized).
+:class:`Screen` keeps the lines currently on the terminal and rewrites just
+the rows that differ.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from .progress import progress_bar
+from .render import fit_line
+
+POLL_INTERVAL = 1.0
+
+Signature = Optional[Tuple[int, int, int]]
+
+
+def _signature(path: Path) -> Signature:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class FileWatcher:
+    """Detect changes to a set of files by polling their ``stat``.
+
+    The inode is part of the signature because atomic saves replace the
+    file rather than modify it.
+    """
+
+    def __init__(self, paths: Sequence[Path]):
+        self.paths = [Path(p) for p in paths]
+        self._seen: Dict[Path, Signature] = {p: _signature(p) for p in self.paths}
+
+    def changed(self) -> bool:
+        """Return whether any file changed since the previous call."""
+        current = {p: _signature(p) for p in self.paths}
+        if current == self._seen:
+            return False
+        self._seen = current
+        return True
+
+
+class Screen:
+    """Draw a list of lines, rewriting only rows that changed since the last draw.
+
+    On a terminal rows are addressed with ANSI cursor movement; otherwise
+    each changed frame is printed in full.
+    """
+
+    def __init__(self, stream: TextIO = sys.stdout, ansi: Optional[bool] = None):
+        self.stream = stream
+        self.ansi = stream.isatty() if ansi is None else ansi
+        self._lines: Optional[List[str]] = None
+
+    def draw(self, lines: List[str]) -> int:
+        """Show ``lines`` and return the number of rows written."""
+        old = self._lines
+        if old == lines:
+            return 0
+        out: List[str] = []
+        if not self.ansi:
+            if old is not None:
+                out.append("\n")
+            out.extend(f"{line}\n" for line in lines)
+            written = len(lines)
+        elif old is None:
+            out.append("\x1b[?25l\x1b[2J\x1b[H")
+            out.append("\n".join(lines))
+            written = len(lines)
+        else:
+            written = 0
+            for row, line in enumerate(lines):
+                if row >= len(old) or old[row] != line:
+                    out.append(f"\x1b[{row + 1};1H{line}\x1b[K")
+                    written += 1
+            if len(lines) < len(old):
+                out.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+        self.stream.write("".join(out))
+        self.stream.flush()
+        self._lines = list(lines)
+        return written
+
+    def close(self) -> None:
+        """Move below the drawing and restore the cursor."""
+        if self.ansi and self._lines is not None:
+            self.stream.write(f"\x1b[{len(self._lines) + 1};1H\x1b[?25h")
+            self.stream.flush()
+
+
+def manuscript_lines(
+    path: Path, bar_width: int = 20, width: Optional[int] = None
+) -> List[str]:
+    """Return word counts of the sections in ``manuscript.yaml`` under ``path``.
+
+    Lines are fitted to ``width`` columns like those of
+    :func:`acm.render.iter_lines`.
+    """
+    from .manuscript import load_sections
+
+    sections = load_sections(path)
+    if not sections:
+        return []
+    lines = ["", fit_line("", "Manuscript:", ("",), width)]
+    for name, data in sections.items():
+        words = len((data.get("text") or "").split())
+        limit = data.get("limit")
+        if limit:
+            pct = min(words / limit * 100, 100)
+            suffixes: Tuple[str, ...] = (
+                f": [{progress_bar(pct, bar_width)}] {words}/{limit} words",
+                f": {words}/{limit} words",
+            )
+        else:
+            suffixes = (f": {words} words",)
+        lines.append(fit_line("  ", name, suffixes, width))
+    return lines
+
+
+def fit_screen(lines: List[str], height: Optional[int]) -> List[str]:
+    """Cut ``lines`` to ``height`` rows so the terminal never scrolls."""
+    if height is None or len(lines) <= height:
+        return lines
+    keep = max(height - 1, 0)
+    return lines[:keep] + [f"… {len(lines) - keep} more lines"]
+
+
+def watch(
+    render: Callable[[], List[str]],
+    paths: Sequence[Path],
+    screen: Screen,
+    interval: float = POLL_INTERVAL,
+    stop: Optional[threading.Event] = None,
+    size: Optional[Callable[[], object]] = None,
+) -> None:
+    """Draw ``render()`` now and again whenever one of ``paths`` changes.
+
+    ``size`` (e.g. :func:`shutil.get_terminal_size`) is polled along with
+    the files, and a different result redraws too. Runs until ``stop`` is
+    set (or the user interrupts). When ``render`` fails, e.g. on a file
+    saved half-way through an edit, the previous frame stays and the error
+    is shown on the last row.
+    """
+    watcher = FileWatcher(paths)
+    stop = stop or threading.Event()
+    last: List[str] = []
+    try:
+        while True:
+            shown = size() if size is not None else None
+            try:
+                last = render()
+                screen.draw(last)
+            except Exception as e:
+                # Anything from a partly written project: bad YAML, YAML of
+                # the wrong shape, a missing file, ...
+                screen.draw(last + [(f"! {e}".splitlines() or ["!"])[0]])
+            while True:
+                if stop.wait(interval):
+                    return
+                if watcher.changed() or (size is not None and size() != shown):
+                    break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        screen.close()
+
+
+__all__ = [
+    "FileWatcher",
+    "POLL_INTERVAL",
+    "Screen",
+    "fit_screen",
+    "manuscript_lines",
+    "watch",
+]
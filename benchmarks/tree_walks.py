@@ -0,0 +1,176 @@
+"""Compare the checklist tree walks with recursive walks on two trees.
+
+Run from the repository root::
+
+    python benchmarks/tree_walks.py
+
+Each walk is run next to a recursive version of it kept below, the way
+the walks were written before they used explicit stacks. Times are the
+best of ``--repeat`` runs. Peak memory and allocated blocks are measured
+in separate runs: ``peak`` under ``tracemalloc``, ``blocks`` as the change
+in :func:`sys.getallocatedblocks` with the result still alive (the
+objects a walk leaves behind). Recursive walks need ``--deep-limit`` (and
+a large thread stack) to finish the deep tree.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from acm.domain import TaskNode  # noqa: E402
+from acm.progress import TaskNode as ProgressTaskNode, progress_bar, render_tree  # noqa: E402
+
+
+def wide(tasks: int = 100, subtasks: int = 200) -> dict:
+    return {
+        "item": "root",
+        "subtasks": [
+            {
+                "item": f"task {i}",
+                "subtasks": [
+                    {"item": f"sub {i}.{j}", "done": j % 3 == 0, "percent": j % 100}
+                    for j in range(subtasks)
+                ],
+            }
+            for i in range(tasks)
+        ],
+    }
+
+
+def deep(depth: int = 3000, width: int = 2) -> dict:
+    root: Dict[str, Any] = {"item": "root"}
+    node = root
+    for level in range(depth):
+        children = [{"item": f"leaf {level}.{j}", "percent": 50} for j in range(width - 1)]
+        child = {"item": f"level {level}"}
+        node["subtasks"] = children + [child]
+        node = child
+    return root
+
+
+def recursive_from_dict(data: dict) -> TaskNode:
+    node = TaskNode(
+        item=data.get("item", ""),
+        done=data.get("done", False),
+        percent=data.get("percent"),
+    )
+    child_key = "tasks" if "tasks" in data else "subtasks"
+    for sub in data.get(child_key, []):
+        node.add_subtask(recursive_from_dict(sub))
+    return node
+
+
+def recursive_to_dict(node: TaskNode) -> dict:
+    data: Dict[str, Any] = {"item": node.item}
+    if node.done:
+        data["done"] = node.done
+    if node.percent is not None:
+        data["percent"] = node.percent
+    if node.subtasks:
+        data["subtasks"] = [recursive_to_dict(s) for s in node.subtasks]
+    return data
+
+
+def recursive_to_progress_node(node: TaskNode) -> ProgressTaskNode:
+    converted = ProgressTaskNode(name=node.item, percent=100 if node.done else node.percent)
+    converted.children = [recursive_to_progress_node(s) for s in node.subtasks]
+    return converted
+
+
+def recursive_render_tree(node: ProgressTaskNode, indent: int = 0, bar_width: int = 20) -> str:
+    pct = node.computed_percent()
+    bar = progress_bar(pct, bar_width)
+    lines = [f"{'  '*indent}{node.name}: [{bar}] {pct:6.2f}%"]
+    for child in node.children:
+        lines.append(recursive_render_tree(child, indent + 1, bar_width))
+    return "\n".join(lines)
+
+
+Setup = Callable[[], Any]
+Run = Callable[..., object]
+
+
+def best_of(repeat: int, setup: Setup, run: Run) -> float:
+    """Return the fastest of ``repeat`` runs in milliseconds, setup excluded."""
+    times = []
+    for _ in range(repeat):
+        arg = setup()
+        # Like timeit, keep the cyclic collector out of the measurement.
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run(arg)
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return min(times) * 1000
+
+
+def peak_kib(setup: Setup, run: Run) -> float:
+    arg = setup()
+    tracemalloc.start()
+    run(arg)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def allocated_blocks(setup: Setup, run: Run) -> int:
+    """Return how many more memory blocks are allocated after ``run``."""
+    arg = setup()
+    gc.collect()
+    gc.disable()
+    try:
+        before = sys.getallocatedblocks()
+        result = run(arg)
+        after = sys.getallocatedblocks()
+    finally:
+        gc.enable()
+    del result
+    return after - before
+
+
+def measure(repeat: int, setup: Setup, run: Run) -> str:
+    try:
+        ms = best_of(repeat, setup, run)
+    except RecursionError:
+        return f"{'RecursionError':>36}"
+    return f"{ms:9.1f} ms {peak_kib(setup, run):8.0f} KiB {allocated_blocks(setup, run):8d} blk"
+
+
+def bench(name: str, data: dict, repeat: int) -> None:
+    node = TaskNode.from_dict(data)
+    cases: Sequence[Tuple[str, Setup, Run, Run]] = (
+        ("from_dict", lambda: data, TaskNode.from_dict, recursive_from_dict),
+        ("to_dict", lambda: node, TaskNode.to_dict, recursive_to_dict),
+        ("to_progress_node", lambda: node, TaskNode.to_progress_node, recursive_to_progress_node),
+        # A fresh progress tree each run, so the roll-up is measured too.
+        ("render_tree", node.to_progress_node, render_tree, recursive_render_tree),
+    )
+    print(name)
+    for label, setup, run, recursive in cases:
+        print(f"  {label:<18}{measure(repeat, setup, run)}")
+        print(f"  {'  recursive':<18}{measure(repeat, setup, recursive)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--deep-limit", type=int, help="raise the recursion limit to this")
+    args = parser.parse_args()
+    if args.deep_limit:
+        sys.setrecursionlimit(args.deep_limit)
+    bench("wide (20k nodes, depth 2)", wide(), args.repeat)
+    bench("deep (6k nodes, depth 3000)", deep(), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
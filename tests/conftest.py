@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path_factory, monkeypatch):
+    """Keep the analysis cache out of the user's home directory."""
+    monkeypatch.setenv("ACM_CACHE_DIR", str(tmp_path_factory.mktemp("acm-cache")))
@@ -2,8 +2,21 @@ from pathlib import Path
 
 from docx import Document
 
-from acm.analysis import analyze_manuscript, journal_change_requests, parse_docx_sections
+from acm.analysis import (
+    NO_LIMIT,
+    CompiledGuidelineSet,
+    ManuscriptMetrics,
+    SectionSummary,
+    _parse_count_limit,
+    _parse_display_limit,
+    analyze_manuscript,
+    collect_metrics,
+    journal_change_requests,
+    parse_docx_sections,
+    rank_journals,
+)
 from acm.journal import Guideline
+from acm.parsers import FIGURE, HEADING, PARAGRAPH, TABLE, TITLE
 
 
 def _build_doc(tmp_path: Path) -> Path:
@@ -78,3 +91,146 @@ def test_journal_change_requests_include_abstract_limit(tmp_path: Path) -> None:
     changes = journal_change_requests(guideline, sections)
 
     assert any("Abstract exceeds limit" in change for change in changes)
+
+
+def test_streaming_parser_matches_python_docx(tmp_path: Path) -> None:
+    doc = Document()
+    doc.add_paragraph("Preamble text before any heading.")
+    doc.add_heading("Materials and Methods", level=2)
+    doc.add_paragraph("Tabbed\tand\nbroken text.")
+    table = doc.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "Cell words are not counted"
+    doc.add_heading("Discussion", level=1)
+    doc.add_paragraph("")
+    doc.add_paragraph("Closing remarks.")
+    path = tmp_path / "mixed.docx"
+    doc.save(path)
+
+    assert parse_docx_sections(path) == parse_docx_sections(path, streaming=False)
+
+    plain = Document()
+    plain.add_paragraph("No headings in this document at all.")
+    plain_path = tmp_path / "plain.docx"
+    plain.save(plain_path)
+
+    sections = parse_docx_sections(plain_path)
+    assert sections == parse_docx_sections(plain_path, streaming=False)
+    assert [(s.title, s.word_count) for s in sections] == [("Document", 7)]
+
+
+def test_compiled_guideline_set_evaluates_whole_catalog() -> None:
+    compiled = CompiledGuidelineSet(
+        [
+            Guideline(journal="A", article_type="Letter", word_limit="3,000 words"),
+            Guideline(journal="B", article_type="Report", structure="Methods; Discussion"),
+            Guideline(journal="C", article_type="Brief", abstract_limit="2 words"),
+        ]
+    )
+    sections = [
+        SectionSummary(title="Abstract", word_count=4, category="Abstract"),
+        SectionSummary(title="Methods", word_count=3000, category="Methods"),
+    ]
+
+    assert list(compiled.word_limits) == [3000, NO_LIMIT, NO_LIMIT]
+    assert compiled.evaluate(sections) == [
+        ["Reduce word count by 4 to meet 3000-word limit"],
+        ["Add sections covering: Discussion"],
+        ["Abstract exceeds limit: 4/2 words (reduce by 2)"],
+    ]
+
+
+def test_collect_metrics_in_one_pass() -> None:
+    blocks = [
+        (TITLE, "A rather long manuscript title"),
+        (HEADING, "Results"),
+        (PARAGRAPH, "As Figure 1 and Fig. 2 show, see also Table 1 and figure 1."),
+        (PARAGRAPH, "Figure 3: Caption of the third figure."),
+        (FIGURE, ""),
+        (TABLE, ""),
+        (HEADING, "References"),
+        (PARAGRAPH, "Smith J. Figure 9 of a cited paper. 2020."),
+        (PARAGRAPH, "Doe A. Another paper. 2021."),
+    ]
+
+    metrics = collect_metrics(blocks)
+
+    assert [(s.title, s.word_count) for s in metrics.sections] == [
+        ("Results", 21),
+        ("References", 14),
+    ]
+    assert metrics.title_chars == 30
+    assert (metrics.figures, metrics.figure_captions, metrics.tables) == (3, 1, 1)
+    assert metrics.references == 2
+
+    compiled = CompiledGuidelineSet(
+        [
+            Guideline(journal="A", article_type="Letter", title_limit="20 characters"),
+            Guideline(journal="B", article_type="Report", figure_limit="Up to 2 figures"),
+            Guideline(journal="C", article_type="Brief", figure_limit="3 display items"),
+            Guideline(journal="D", article_type="Note", reference_limit="1 reference"),
+        ]
+    )
+    assert compiled.evaluate(metrics) == [
+        ["Shorten title by 10 characters to meet 20-character limit"],
+        ["Reduce figures by 1 to meet limit of 2"],
+        ["Reduce display items (figures and tables) by 1 to meet limit of 3"],
+        ["Reduce references by 1 to meet 1-reference limit"],
+    ]
+    # Bare section summaries only get word and section checks.
+    assert compiled.evaluate(metrics.sections) == [[], [], [], []]
+
+
+def test_rank_journals_returns_cheapest_matches() -> None:
+    guidelines = [
+        Guideline(journal="Alpha", article_type="Letter", word_limit="100 words"),
+        Guideline(journal="Beta", article_type="Letter", structure="Methods"),
+        Guideline(journal="Alpha Reports", article_type="Article"),
+        Guideline(journal="Gamma", article_type="Research Letter", word_limit="10 words"),
+    ]
+    sections = [SectionSummary(title="Results", word_count=150, category="Results")]
+
+    ranked = rank_journals(sections, guidelines, k=3)
+    assert [(m.guideline.journal, m.cost) for m in ranked] == [
+        ("Alpha Reports", 0),
+        ("Alpha", 50),
+        ("Gamma", 140),
+    ]
+    assert ranked[0].changes == []
+    assert ranked[1].changes == ["Reduce word count by 50 to meet 100-word limit"]
+
+    filtered = rank_journals(sections, guidelines, k=5, journal_prefix="alpha", article_type="letter")
+    assert [m.guideline.journal for m in filtered] == ["Alpha"]
+
+
+def test_parse_count_limit_uses_first_count() -> None:
+    # Limits as written in journal_guidelines.json.
+    cases = {
+        "Up to 100 main‑text references; for meta‑analyses requiring more than 250 "
+        "total references, authors should contact the editors before submission": 100,
+        "Less than 60 references": 59,
+        "3–5 display items (figures or tables) with brief legends": 5,
+        "Up to 150 references (no more than 20% referring to the authors’ own work)": 150,
+        "1 figure (stand‑alone Perspectives may include 1 table instead)": 1,
+        "Not specified": None,
+    }
+    for text, expected in cases.items():
+        assert _parse_count_limit(text) == expected, text
+
+
+def test_figure_and_table_limits_are_combined_only_when_stated() -> None:
+    # Limits as written in journal_guidelines.json.
+    assert _parse_display_limit("Up to 8 figures and 3 tables") == (8, 3, False)
+    assert _parse_display_limit("Up to 8 display items (figures and/or tables)") == (8, None, True)
+    assert _parse_display_limit("Up to 2 figures or tables") == (2, None, True)
+    assert _parse_display_limit("No more than 3 figures") == (3, None, False)
+
+    guideline = Guideline(
+        journal="J", article_type="Research Article", figure_limit="Up to 8 figures and 3 tables"
+    )
+    compiled = CompiledGuidelineSet([guideline])
+    sections = [SectionSummary(title="Results", word_count=10, category="Results")]
+    within = ManuscriptMetrics(sections=sections, total_words=10, figures=8, tables=3)
+    too_many_tables = ManuscriptMetrics(sections=sections, total_words=10, figures=2, tables=7)
+
+    assert compiled.evaluate(within) == [[]]
+    assert compiled.evaluate(too_many_tables) == [["Reduce tables by 4 to meet limit of 3"]]
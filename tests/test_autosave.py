@@ -0,0 +1,59 @@
+from pathlib import Path
+import time
+
+import pytest
+
+from acm.autosave import Autosaver
+from acm.manuscript import autosaver, load_sections
+
+
+def test_bursts_are_coalesced_and_idle_does_no_io() -> None:
+    saves = []
+    sections = {"Intro": {"text": "a", "limit": None}}
+    saver = Autosaver(sections, lambda snapshot, dirty: saves.append((snapshot, dirty)), delay=0.05)
+
+    assert not saver.update("Intro", "a")
+    for text in ("ab", "abc", "abcd"):
+        assert saver.update("Intro", text)
+    saver.add("Methods")
+    deadline = time.monotonic() + 5
+    while not saves and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+
+    assert saves == [
+        (
+            {"Intro": {"text": "abcd", "limit": None}, "Methods": {"text": "", "limit": None}},
+            {"Intro", "Methods"},
+        )
+    ]
+    assert not saver.dirty
+    saver.close()
+    assert len(saves) == 1
+
+
+def test_failed_save_stays_dirty_until_close() -> None:
+    calls = []
+
+    def save(snapshot, dirty):
+        calls.append(dirty)
+        if len(calls) == 1:
+            raise OSError("disk full")
+
+    saver = Autosaver({}, save, delay=60)
+    saver.update("Intro", "text")
+    with pytest.raises(OSError):
+        saver.flush()
+    assert saver.dirty == {"Intro"}
+    saver.close()
+
+    assert calls == [{"Intro"}, {"Intro"}]
+    assert not saver.flush()
+
+
+def test_manuscript_autosaver_writes_atomically(tmp_path: Path) -> None:
+    with autosaver({}, tmp_path) as saver:
+        saver.update("Intro", "Hello world")
+
+    assert load_sections(tmp_path) == {"Intro": {"text": "Hello world", "limit": None}}
+    assert [p.name for p in tmp_path.iterdir()] == ["manuscript.yaml"]
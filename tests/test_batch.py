@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from docx import Document
+
+from acm.batch import analyze_batch, collect_manuscripts
+
+
+def _write_doc(path: Path, words: str) -> Path:
+    doc = Document()
+    doc.add_heading("Introduction", level=1)
+    doc.add_paragraph(words)
+    doc.save(path)
+    return path
+
+
+def test_collect_manuscripts_expands_directories_and_globs(tmp_path: Path) -> None:
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    first = _write_doc(tmp_path / "a.docx", "one two")
+    second = _write_doc(nested / "b.docx", "three")
+    (tmp_path / "~$a.docx").write_bytes(b"lock")
+
+    found = collect_manuscripts([str(tmp_path), str(tmp_path / "*.docx")])
+
+    assert found == [first, second]
+
+
+def test_analyze_batch_reports_failures_without_aborting(tmp_path: Path) -> None:
+    good = _write_doc(tmp_path / "good.docx", "a few intro words")
+    bad = tmp_path / "bad.docx"
+    bad.write_text("not a zip archive")
+
+    records = {r["file"]: r for r in analyze_batch([good, bad], workers=2)}
+
+    assert records[str(good)]["ok"]
+    assert records[str(good)]["total_words"] == 4
+    assert not records[str(bad)]["ok"]
+    assert "BadZipFile" in records[str(bad)]["error"]
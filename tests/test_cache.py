@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+
+from docx import Document
+
+from acm import analysis
+from acm.analysis import parse_docx_sections, parse_metrics
+from acm.cache import DEFAULT_MAX_BYTES, MAX_BYTES_ENV, AnalysisCache, default_cache
+
+
+def _write_doc(path: Path, text: str) -> Path:
+    doc = Document()
+    doc.add_heading("Introduction", level=1)
+    doc.add_paragraph(text)
+    doc.save(path)
+    return path
+
+
+def test_parse_uses_cache_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    path = _write_doc(tmp_path / "paper.docx", "one two three")
+    first = parse_docx_sections(path)
+
+    def fail(*_args):
+        raise AssertionError("manuscript was re-parsed")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(analysis, "iter_blocks", fail)
+        assert parse_docx_sections(path) == first
+        # Totals come from the cached payload too.
+        assert parse_metrics(path).total_words == 3
+    assert default_cache().stats().hits == 2
+
+    _write_doc(path, "one two three four")
+    assert parse_docx_sections(path)[0].word_count == 4
+    assert default_cache().stats().entries == 2
+
+
+def test_lru_eviction_and_prune(tmp_path: Path) -> None:
+    cache = AnalysisCache(tmp_path, max_bytes=80)
+    cache.put("a", {"payload": "x" * 20})
+    cache.put("b", {"payload": "y" * 20})
+    assert cache.get("a") is not None
+    cache.put("c", {"payload": "z" * 20})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.prune(0) == 2
+    assert cache.stats().entries == 0
+
+
+def test_invalid_max_bytes_falls_back_to_default(monkeypatch) -> None:
+    monkeypatch.setenv(MAX_BYTES_ENV, "64MB")
+    with pytest.warns(UserWarning, match=MAX_BYTES_ENV):
+        assert default_cache().max_bytes == DEFAULT_MAX_BYTES
+
+    monkeypatch.setenv(MAX_BYTES_ENV, "1024")
+    assert default_cache().max_bytes == 1024
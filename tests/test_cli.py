@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from acm.cli import app
+
+runner = CliRunner()
+
+
+def test_status_page_shows_tree(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    assert runner.invoke(app, ["init", "--project-name", "Paper"]).exit_code == 0
+
+    result = runner.invoke(app, ["status", "--page"])
+
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[0].startswith("Paper: [")
+    assert any(line.startswith("  Methods: [") for line in lines)
+
+
+def test_apply_reports_failing_lines_by_line_number(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    assert runner.invoke(app, ["init", "--project-name", "Paper"]).exit_code == 0
+    ops = tmp_path / "ops.jsonl"
+    ops.write_text(
+        '{"op": "check", "path": "Introduction"}\n'
+        "\n"
+        '{"op": "check", "path": \n'
+        '{"op": "check", "path": "No Such Task"}\n'
+        '{"op": "percent", "path": "Methods", "percent": 40}\n',
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(app, ["apply", str(ops)])
+
+    assert result.exit_code == 1
+    assert "line 3: invalid JSON" in result.stderr
+    assert "line 4: " in result.stderr and "No Such Task" in result.stderr
+    assert "line 1" not in result.stderr and "line 5" not in result.stderr
+    assert "Applied 2 operations (2 failed)" in result.stdout
+
+    status = runner.invoke(app, ["status"]).output
+    assert "Introduction: [████████████████████] 100.00%" in status
+    assert "Methods: [████████░░░░░░░░░░░░]  40.00%" in status
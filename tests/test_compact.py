@@ -0,0 +1,51 @@
+import pytest
+
+from acm import compact
+from acm.compact import CompactChecklist, CompactProject
+from acm.domain import ArticleProject, Checklist, TaskNode
+
+BACKENDS = [False] + ([True] if compact.np is not None else [])
+
+
+def _checklist() -> Checklist:
+    return Checklist(
+        tasks=[
+            TaskNode(item="Intro", subtasks=[
+                TaskNode(item="Hook", done=True),
+                TaskNode(item="Gap", percent=40),
+                TaskNode(item="Aims", subtasks=[TaskNode(item="Aim 1", percent=25), TaskNode(item="Aim 2")]),
+            ]),
+            TaskNode(item="Methods", percent=70, subtasks=[TaskNode(item="Stats")]),
+            TaskNode(item="Results"),
+        ]
+    )
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_compact_checklist_round_trips(use_numpy: bool) -> None:
+    checklist = _checklist()
+    packed = CompactChecklist.from_checklist(checklist, use_numpy=use_numpy)
+
+    assert len(packed) == 9
+    assert list(packed.parent) == [-1, 0, 0, 0, 3, 3, -1, 6, -1]
+    assert packed.to_dict() == checklist.to_dict()
+    assert CompactChecklist.from_yaml(checklist.to_yaml(), use_numpy).to_yaml() == checklist.to_yaml()
+
+    project = ArticleProject(name="Paper", checklist=checklist)
+    assert CompactProject.from_json(project.to_json(), use_numpy).to_json() == project.to_json()
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_compact_rollup_matches_task_nodes(use_numpy: bool) -> None:
+    checklist = _checklist()
+    packed = CompactChecklist.from_checklist(checklist, use_numpy=use_numpy)
+
+    expected = []
+    stack = list(reversed(checklist.tasks))
+    while stack:
+        node = stack.pop()
+        expected.append(node.computed_percent())
+        stack.extend(reversed(node.subtasks))
+
+    assert [float(v) for v in packed.rollup()] == pytest.approx(expected)
+    assert packed.computed_percent() == pytest.approx(checklist.computed_percent())
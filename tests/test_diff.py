@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from acm.diff import diff_checklists, load_checklist, subtree_digests
+from acm.domain import ArticleProject, Checklist, TaskNode
+from acm.oplog import ProjectJournal
+
+
+def _checklist() -> Checklist:
+    return Checklist(
+        tasks=[
+            TaskNode(item="Intro"),
+            TaskNode(item="Methods", subtasks=[TaskNode(item="Stats", subtasks=[TaskNode(item="Power")])]),
+            TaskNode(item="Results", subtasks=[TaskNode(item="Figures", percent=20)]),
+            TaskNode(item="Discussion"),
+        ]
+    )
+
+
+def test_identical_checklists_have_no_changes() -> None:
+    old, new = _checklist(), _checklist()
+
+    assert subtree_digests(old.root)[id(old.root)] == subtree_digests(new.root)[id(new.root)]
+    assert not diff_checklists(old, new)
+
+
+def test_diff_reports_every_kind_of_change() -> None:
+    old, new = _checklist(), _checklist()
+    new.find("Intro").item = "Introduction"
+    new.find("Results").add_subtask(new.find("Methods").subtasks.pop())
+    new.find("Results/Figures").percent = 60
+    new.remove("Discussion")
+    new.ensure("Results/Tables")
+
+    result = diff_checklists(old, new)
+
+    assert [str(change) for change in result.changes] == [
+        "~ Intro -> Introduction (renamed)",
+        "* Results/Figures: percent: 20 -> 60",
+        "> Methods/Stats -> Results/Stats (moved)",
+        "- Discussion",
+        "+ Results/Tables",
+    ]
+    assert result.to_dict()["percent"] == {"old": old.computed_percent(), "new": new.computed_percent()}
+
+
+def test_load_checklist_replays_project_log(tmp_path: Path) -> None:
+    project = ArticleProject(name="Paper", checklist=_checklist())
+    journal = ProjectJournal(tmp_path / "acm.yaml")
+    journal.compact(project)
+    journal.record(journal.load(), {"op": "set", "path": "Intro", "done": True})
+    (tmp_path / "bare.yaml").write_text(_checklist().to_yaml())
+
+    result = diff_checklists(load_checklist(tmp_path / "bare.yaml"), load_checklist(journal.file))
+
+    assert [change.to_dict() for change in result.changes] == [
+        {
+            "kind": "changed",
+            "path": "Intro",
+            "old": {"done": False, "percent": None},
+            "new": {"done": True, "percent": None},
+        }
+    ]
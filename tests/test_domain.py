@@ -1,3 +1,5 @@
+import pytest
+
 from acm.domain import TaskNode, Checklist, ArticleProject
 
 
@@ -26,3 +28,80 @@ def test_articleproject_serialisation():
     yaml_data = project.to_yaml()
     assert ArticleProject.from_json(json_data).to_dict() == project.to_dict()
     assert ArticleProject.from_yaml(yaml_data).to_dict() == project.to_dict()
+
+
+def test_computed_percent_is_cached_and_invalidated_upwards():
+    root = TaskNode(item="Root")
+    section = TaskNode(item="Section")
+    first, second = TaskNode(item="First"), TaskNode(item="Second", percent=50)
+    root.add_subtask(section)
+    section.add_subtask(first)
+    section.add_subtask(second)
+    root.add_subtask(TaskNode(item="Other", percent=100))
+
+    assert root.computed_percent() == 62.5
+    assert first.parent is section and section.parent is root
+
+    first.done = True
+    assert root.computed_percent() == 87.5
+    section.remove_subtask(0)
+    assert first.parent is None
+    assert root.computed_percent() == 75.0
+    section.subtasks = [TaskNode(item="New")]
+    assert root.computed_percent() == 50.0
+
+
+def test_checklist_path_lookup_tracks_changes():
+    checklist = Checklist()
+    leaf = checklist.ensure("Methods/Stats/Power")
+    assert checklist.ensure("Methods/Stats/Power") is leaf
+    assert checklist.find(["Methods", "Stats", "Power"]) is leaf
+
+    stats = checklist.find("Methods/Stats")
+    stats.item = "Statistics"
+    assert checklist.find("Methods/Statistics/Power") is leaf
+    with pytest.raises(KeyError):
+        checklist.find("Methods/Stats")
+
+    parent, position = checklist.locate("Methods/Statistics")
+    assert parent.subtasks[position] is stats
+    assert checklist.remove("Methods/Statistics") is stats
+    with pytest.raises(KeyError):
+        checklist.find("Methods/Statistics/Power")
+
+    checklist.tasks = [TaskNode(item="Intro", done=True), TaskNode(item="Methods")]
+    assert checklist.find("Intro").done
+    assert checklist.computed_percent() == 50.0
+
+
+def test_checklist_path_lookup_tracks_reordering():
+    checklist = Checklist(tasks=[TaskNode(item="B"), TaskNode(item="A")])
+    assert checklist.find("A").item == "A"
+
+    checklist.tasks.sort(key=lambda task: task.item)
+    assert checklist.find("A").item == "A"
+    checklist.tasks.reverse()
+    assert checklist.find("A").item == "A"
+
+    checklist.tasks *= 2
+    assert checklist.find("B") is checklist.tasks[0]
+    checklist.tasks *= 0
+    with pytest.raises(KeyError):
+        checklist.find("A")
+
+
+def test_deep_checklists_do_not_hit_recursion_limit():
+    data = {"item": "leaf", "percent": 50}
+    for i in range(5000):
+        data = {"item": f"level {i}", "subtasks": [data, {"item": "sibling", "percent": 50}]}
+
+    node = TaskNode.from_dict(data)
+    # dict equality itself recurses, so compare level by level.
+    pairs = [(node.to_dict(), data)]
+    while pairs:
+        ours, expected = pairs.pop()
+        assert ours.keys() == expected.keys() and ours["item"] == expected["item"]
+        pairs.extend(zip(ours.get("subtasks", []), expected.get("subtasks", [])))
+    assert node.computed_percent() == 50.0
+    progress = node.to_progress_node()
+    assert progress.computed_percent() == node.computed_percent()
@@ -1,7 +1,7 @@
 from pathlib import Path
 
 from acm.domain import Checklist, TaskNode
-from acm import drive
+from acm import drive, storage
 import pytest
 
 
@@ -12,3 +12,27 @@ def test_save_and_load_roundtrip(tmp_path: Path) -> None:
     drive.save(project, file)
     restored = drive.load(file)
     assert restored.to_dict() == project.to_dict()
+
+
+def test_json_and_sniffed_formats(tmp_path: Path) -> None:
+    project = Checklist()
+    project.add_task(TaskNode(item="Task", subtasks=[TaskNode(item="Sub", done=True)]))
+
+    json_file = tmp_path / "checklist.json"
+    drive.save(project, json_file)
+    assert json_file.read_text().startswith("{")
+
+    unnamed = tmp_path / "checklist"
+    unnamed.write_bytes(json_file.read_bytes())
+    assert storage.detect_format(unnamed) == "json"
+    assert drive.load(unnamed).to_dict() == project.to_dict()
+
+
+def test_msgpack_round_trip(tmp_path: Path) -> None:
+    pytest.importorskip("msgpack")
+    project = Checklist()
+    project.add_task(TaskNode(item="Task", percent=40))
+    file = tmp_path / "checklist.msgpack"
+    drive.save(project, file)
+    assert storage.sniff_format(file.read_bytes()[:8]) == "msgpack"
+    assert drive.load(file).to_dict() == project.to_dict()
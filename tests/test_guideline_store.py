@@ -0,0 +1,50 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from acm.analysis import CompiledGuidelineSet
+from acm.guideline_store import GuidelineRecord, GuidelineStore, compile_guidelines
+from acm.journal import GUIDELINES_FILE, load_guidelines
+
+
+def test_compiled_store_round_trips_catalog(tmp_path: Path) -> None:
+    target = tmp_path / "guidelines.sqlite3"
+    originals = load_guidelines()
+
+    assert compile_guidelines(GUIDELINES_FILE, target) == len(originals)
+
+    with GuidelineStore(target) as store:
+        records = list(store)
+        assert len(store) == len(records)
+        assert all(r._text is None for r in records)
+        assert [r.to_guideline() for r in records] == originals
+        assert [r.structure for r in records] == [g.structure for g in originals]
+        assert records[0]._text is not None
+
+        first = originals[0]
+        found = store.find(first.journal.upper(), first.article_type.lower())
+        assert found.to_guideline() == first
+        with pytest.raises(ValueError):
+            store.find("No Such Journal")
+
+
+def test_load_guidelines_accepts_compiled_store(tmp_path: Path, monkeypatch) -> None:
+    target = tmp_path / "guidelines.sqlite3"
+    compile_guidelines(GUIDELINES_FILE, target)
+    closed: List[None] = []
+    close = GuidelineStore.close
+    monkeypatch.setattr(GuidelineStore, "close", lambda self: closed.append(close(self)))
+
+    guidelines = load_guidelines(target)
+    assert len(closed) == 1
+    # Text is decoded on access, after the store has been closed.
+    assert all(isinstance(g, GuidelineRecord) and g._text is None for g in guidelines)
+    assert guidelines == load_guidelines()
+    assert all(isinstance(g, GuidelineRecord) and g._text is not None for g in guidelines)
+
+    compiled = CompiledGuidelineSet(guidelines)
+    reference = CompiledGuidelineSet(load_guidelines())
+
+    assert compiled.word_limits == reference.word_limits
+    assert compiled.required_masks == reference.required_masks
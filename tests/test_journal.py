@@ -1,4 +1,9 @@
-from acm.journal import load_guidelines, generate_template
+import json
+import os
+
+import pytest
+
+from acm.journal import GuidelineRegistry, load_guidelines, generate_template
 
 
 def test_load_guidelines():
@@ -10,3 +15,25 @@ def test_generate_template():
     checklist = generate_template("Science (AAAS)")
     assert checklist.tasks
     assert any("Title limit" in t.item for t in checklist.tasks)
+
+
+def test_guideline_registry_indexes_and_reloads(tmp_path):
+    path = tmp_path / "guidelines.json"
+    path.write_text(json.dumps([
+        {"journal": "Alpha", "article_type": "Letter", "word_limit": "100 words"},
+        {"journal": "Alpha", "article_type": "Review"},
+    ]))
+    registry = GuidelineRegistry(path)
+
+    assert registry.find("alpha").article_type == "Letter"
+    assert registry.find("ALPHA", "review").article_type == "Review"
+    assert registry.derived("count", len) == 2
+    assert registry.refresh() is False
+
+    path.write_text(json.dumps([{"journal": "Beta", "article_type": "Letter"}]))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert registry.find("beta").journal == "Beta"
+    assert registry.derived("count", len) == 1
+    with pytest.raises(ValueError):
+        registry.find("Alpha")
@@ -0,0 +1,55 @@
+from acm.analysis import SECTION_KEYWORDS, SECTION_KEYWORDS_I18N, SECTION_PRIORITIES
+from acm.keywords import KeywordMatcher
+
+
+def test_priority_decides_ambiguous_titles():
+    matcher = KeywordMatcher(SECTION_KEYWORDS, priorities=SECTION_PRIORITIES)
+    assert matcher.categorize("Results and Discussion") == "Results"
+    assert matcher.categorize("Discussion of results") == "Results"
+    assert matcher.categorize("Acknowledgements") == "Other"
+
+    reordered = KeywordMatcher(SECTION_KEYWORDS, priorities=["Discussion"])
+    assert reordered.categorize("Results and Discussion") == "Discussion"
+
+
+def test_extend_with_multilingual_and_custom_tables():
+    matcher = KeywordMatcher(SECTION_KEYWORDS, priorities=SECTION_PRIORITIES)
+    matcher.extend(SECTION_KEYWORDS_I18N["fr"])
+    matcher.extend({"data availability": "Data"})
+
+    assert matcher.categorize("MATÉRIEL ET MÉTHODES") == "Methods"
+    assert matcher.categorize("Data availability statement") == "Data"
+    assert matcher.categories("Résumé, Data Availability") == {"Abstract", "Data"}
+    assert matcher.mask("Data availability") == matcher.bit("Data")
+
+
+def test_spanish_conclusion_keywords():
+    matcher = KeywordMatcher(SECTION_KEYWORDS_I18N["es"])
+    assert matcher.categorize("Conclusión") == "Conclusion"
+    assert matcher.categorize("CONCLUSIONES") == "Conclusion"
+    assert matcher.categorize("Conclusivamente") == "Other"
+
+
+def test_registering_keywords_invalidates_derived_results(tmp_path, monkeypatch):
+    from docx import Document
+
+    from acm import analysis
+
+    monkeypatch.setattr(
+        analysis, "SECTION_MATCHER", KeywordMatcher(SECTION_KEYWORDS, priorities=SECTION_PRIORITIES)
+    )
+    doc = Document()
+    doc.add_heading("Data availability", level=1)
+    doc.add_paragraph("On request.")
+    path = tmp_path / "paper.docx"
+    doc.save(path)
+    compiled = analysis.compiled_catalog(analysis.guideline_registry())
+    version = analysis.analysis_version()
+    assert analysis.parse_sections(path)[0].category == "Other"
+
+    analysis.register_section_keywords({"data availability": "Data"})
+
+    assert analysis.analysis_version() != version
+    assert analysis.parse_sections(path)[0].category == "Data"
+    assert analysis.compiled_catalog(analysis.guideline_registry()) is not compiled
+    assert analysis._compiled(compiled) is not compiled
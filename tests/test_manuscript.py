@@ -1,8 +1,54 @@
 from pathlib import Path
-from acm.manuscript import load_sections, save_sections
+from typing import Dict
+
+import pytest
+
+from acm.manuscript import autosaver, join_sections, load_sections, save_sections, split_sections
+from acm.sections import SectionStore
 
 
 def test_roundtrip(tmp_path: Path) -> None:
     sections = {"Intro": {"text": "Hello", "limit": 100}}
     save_sections(sections, tmp_path)
     assert load_sections(tmp_path) == sections
+
+
+def test_split_sections_load_lazily_and_save_changes_only(tmp_path: Path) -> None:
+    sections: Dict[str, dict] = {
+        "Intro": {"text": "Hello", "limit": 100},
+        "Methods": {"text": "We did things.", "limit": None},
+    }
+    save_sections(sections, tmp_path)
+    assert split_sections(tmp_path) == 2
+    assert not (tmp_path / "manuscript.yaml").exists()
+
+    store = load_sections(tmp_path)
+    assert isinstance(store, SectionStore)
+    assert list(store) == ["Intro", "Methods"] and not store.is_loaded("Intro")
+    assert dict(store) == sections
+
+    methods = tmp_path / "manuscript" / "methods.md"
+    before = methods.stat().st_mtime_ns, methods.stat().st_ino
+    store["Intro"]["text"] = "Hello again"
+    store["Results"] = {"text": "It worked.", "limit": 50}
+    save_sections(store, tmp_path)
+    assert (methods.stat().st_mtime_ns, methods.stat().st_ino) == before
+
+    with autosaver(load_sections(tmp_path), tmp_path) as saver:
+        saver.update("Results", "It mostly worked.")
+        del saver.sections["Methods"]
+        saver.mark_dirty("Results")
+    assert not methods.exists()
+
+    assert join_sections(tmp_path) == 2
+    assert load_sections(tmp_path) == {
+        "Intro": {"text": "Hello again", "limit": 100},
+        "Results": {"text": "It mostly worked.", "limit": 50},
+    }
+    assert not (tmp_path / "manuscript").exists()
+
+
+def test_split_sections_requires_manuscript_file(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="manuscript.yaml not found"):
+        split_sections(tmp_path)
+    assert not (tmp_path / "manuscript").exists()
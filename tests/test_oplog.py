@@ -0,0 +1,129 @@
+import hashlib
+import json
+from pathlib import Path
+import warnings
+
+import pytest
+
+from acm.domain import ArticleProject, TaskNode
+from acm.oplog import LogReplayWarning, OpError, ProjectJournal
+from acm.storage import dumps
+
+
+def _journal(tmp_path: Path, **kwargs) -> ProjectJournal:
+    project = ArticleProject(name="Paper")
+    project.checklist.tasks = [TaskNode(item="Intro"), TaskNode(item="Methods")]
+    journal = ProjectJournal(tmp_path / "acm.yaml", **kwargs)
+    journal.compact(project)
+    return journal
+
+
+def test_operations_are_appended_and_replayed(tmp_path: Path) -> None:
+    journal = _journal(tmp_path)
+    snapshot = journal.file.read_bytes()
+    project = journal.load()
+    journal.record(project, {"op": "set", "path": "Intro", "done": True})
+    journal.record(project, {"op": "ensure", "path": "Methods/Stats"})
+    journal.record(project, {"op": "rename", "path": "Methods", "item": "Approach"})
+    with pytest.raises(OpError):
+        journal.record(project, {"op": "delete", "path": "Missing"})
+
+    assert journal.file.read_bytes() == snapshot
+    restored = ProjectJournal(journal.file).load()
+    assert restored.to_dict() == project.to_dict()
+    assert restored.checklist.find("Approach/Stats")
+
+    # A torn final record is ignored and the next write compacts.
+    with journal.log_path.open("ab") as f:
+        f.write(b'{"op":"set","pa')
+    again = ProjectJournal(journal.file)
+    reloaded = again.load()
+    assert reloaded.to_dict() == project.to_dict()
+    again.record(reloaded, {"op": "set", "path": "Approach", "percent": 10})
+    assert ProjectJournal(journal.file).load().checklist.find("Approach").percent == 10
+
+
+def test_log_is_compacted_past_threshold(tmp_path: Path) -> None:
+    journal = _journal(tmp_path, compact_bytes=200)
+    project = journal.load()
+    for percent in range(10):
+        journal.record(project, {"op": "set", "path": "Intro", "percent": percent})
+
+    assert journal.log_path.stat().st_size <= 200
+    assert ProjectJournal(journal.file).load().to_dict() == project.to_dict()
+
+
+def test_hand_edited_snapshot_keeps_logged_operations(tmp_path: Path) -> None:
+    journal = _journal(tmp_path)
+    project = journal.load()
+    journal.record(project, {"op": "set", "path": "Methods", "done": True})
+    journal.record(project, {"op": "delete", "path": "Intro"})
+    with journal.file.open("a") as f:
+        f.write("# reviewed\n")
+    text = journal.file.read_text()
+    journal.file.write_text(text.replace("item: Intro\n", "item: Intro\n    percent: 5\n"))
+
+    edited = ProjectJournal(journal.file)
+    with pytest.warns(LogReplayWarning, match="replayed"):
+        fresh = edited.load()
+    assert fresh.checklist.find("Methods").done
+    assert [t.item for t in fresh.checklist.tasks] == ["Methods"]
+
+    # The next write folds the replayed operations into the snapshot.
+    edited.record(fresh, {"op": "set", "path": "Methods", "percent": 50})
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        reloaded = ProjectJournal(journal.file).load()
+    assert reloaded.to_dict() == fresh.to_dict()
+
+
+def test_interrupted_compaction_does_not_replay(tmp_path: Path) -> None:
+    journal = _journal(tmp_path)
+    project = journal.load()
+    journal.record(project, {"op": "rename", "path": "Intro", "item": "Opening"})
+    raw = dumps(project.to_dict(), "yaml")
+    # Crash after the snapshot is replaced but before the log is reset.
+    journal._mark_compacting(hashlib.sha256(raw).hexdigest())
+    journal.file.write_bytes(raw)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert ProjectJournal(journal.file).load().to_dict() == project.to_dict()
+
+
+def test_rejected_set_changes_nothing(tmp_path: Path) -> None:
+    journal = _journal(tmp_path)
+    project = journal.load()
+    failures = journal.record_many(
+        project, [{"op": "set", "path": "Intro", "done": True, "percent": 150}]
+    )
+
+    assert len(failures) == 1
+    assert not project.checklist.find("Intro").done
+    with pytest.raises(OpError):
+        journal.record(project, {"op": "check", "path": "Intro", "done": True, "percent": True})
+    assert not project.checklist.find("Intro").done
+
+
+def test_record_many_skips_failures_and_logs_canonical_ops(tmp_path: Path) -> None:
+    journal = _journal(tmp_path)
+    project = journal.load()
+    failures = journal.record_many(
+        project,
+        [
+            {"op": "check", "path": "Intro"},
+            {"op": "percent", "path": "Methods"},
+            {"op": "add", "path": "Methods/Stats"},
+            {"op": "delete", "path": "Missing"},
+            "not an op",
+            {"op": "percent", "path": "Methods", "percent": 30},
+        ],
+    )
+
+    assert [index for index, _ in failures] == [1, 3, 4]
+    logged = journal.log_path.read_text().splitlines()[1:]
+    assert [json.loads(line)["op"] for line in logged] == ["set", "ensure", "set"]
+    restored = ProjectJournal(journal.file).load()
+    assert restored.checklist.find("Intro").done
+    assert restored.checklist.find("Methods").percent == 30
+    assert restored.checklist.find("Methods/Stats")
@@ -0,0 +1,91 @@
+from pathlib import Path
+import subprocess
+import sys
+import zipfile
+
+from docx import Document
+
+from acm.analysis import detect_format, parse_sections
+
+
+def _titles_and_counts(path: Path):
+    return [(s.title, s.word_count, s.category) for s in parse_sections(path)]
+
+
+def test_markdown_sections(tmp_path: Path) -> None:
+    path = tmp_path / "paper.md"
+    path.write_text(
+        "Preamble line\n\n"
+        "# Introduction #\n\nSome intro words.\nWrapped line.\n\n"
+        "```\n# not a heading\n```\n\n"
+        "Methods\n=======\n\nWe did things.\n"
+    )
+
+    # Fenced code is still counted as text but never yields headings.
+    assert _titles_and_counts(path) == [
+        ("Introduction", 9, "Introduction"),
+        ("Methods", 3, "Methods"),
+    ]
+
+
+def test_plain_text_and_latex(tmp_path: Path) -> None:
+    text = tmp_path / "notes.txt"
+    text.write_text("First paragraph here.\n\nSecond one.\n")
+    assert _titles_and_counts(text) == [("Document", 5, "Other")]
+
+    tex = tmp_path / "paper.tex"
+    tex.write_text(
+        "\\documentclass{article}\n\\usepackage{amsmath}\n\\begin{document}\n"
+        "\\begin{abstract}\nShort abstract text. % a comment\n\\end{abstract}\n"
+        "\\section{Results}\nWe found $x=1$ in \\emph{all} cases.\n"
+        "\\end{document}\n"
+    )
+    assert _titles_and_counts(tex) == [
+        ("Abstract", 3, "Abstract"),
+        ("Results", 5, "Results"),
+    ]
+
+
+def test_odt_sections_skip_tables(tmp_path: Path) -> None:
+    content = (
+        '<office:document-content'
+        ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+        ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"'
+        ' xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0">'
+        "<office:body><office:text>"
+        '<text:h text:outline-level="1">Discussion</text:h>'
+        "<text:p>Two<text:tab/>words</text:p>"
+        "<table:table><table:table-row><table:table-cell>"
+        "<text:p>ignored cell text</text:p>"
+        "</table:table-cell></table:table-row></table:table>"
+        "<text:list><text:list-item><text:p>listed item</text:p></text:list-item></text:list>"
+        "</office:text></office:body></office:document-content>"
+    )
+    path = tmp_path / "paper.odt"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("mimetype", "application/vnd.oasis.opendocument.text")
+        archive.writestr("content.xml", content)
+
+    assert _titles_and_counts(path) == [("Discussion", 4, "Discussion")]
+
+
+def test_format_detected_from_magic_bytes(tmp_path: Path) -> None:
+    doc = Document()
+    doc.add_heading("Introduction", level=1)
+    doc.add_paragraph("hello there")
+    path = tmp_path / "upload"
+    doc.save(path)
+
+    assert detect_format(path) == "docx"
+    assert _titles_and_counts(path) == [("Introduction", 2, "Introduction")]
+
+
+def test_format_parsers_are_imported_lazily() -> None:
+    code = (
+        "import sys, acm.analysis; "
+        "print(sorted(m for m in sys.modules if m.startswith('acm.parsers.') or m == 'docx'))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "[]"
@@ -19,3 +19,42 @@ def test_render_tree():
     ]
     assert output.splitlines() == expected_lines
 
+
+def test_computed_percent_updates_after_child_change():
+    child = TaskNode("Child", percent=20)
+    root = TaskNode("Root", children=[child, TaskNode("Other")])
+    assert root.computed_percent() == 10.0
+    child.percent = 80
+    assert root.computed_percent() == 40.0
+    root.children.append(TaskNode("Late", percent=100))
+    assert root.computed_percent() == 60.0
+
+
+def test_render_tree_handles_deep_trees():
+    root = node = TaskNode("0")
+    for depth in range(1, 2000):
+        child = TaskNode(str(depth))
+        node.children.append(child)
+        node = child
+    lines = render_tree(root, bar_width=1).splitlines()
+    assert len(lines) == 2000
+    assert lines[-1].startswith("  " * 1999 + "1999:")
+
+
+def test_render_tree_wide_mixed_tree():
+    # A node's own percent wins over its children; empty leaves count as 0.
+    groups = [
+        TaskNode(f"G{i}", percent=90 if i == 0 else None, children=[
+            TaskNode(f"G{i}.{j}", percent=j % 101 or None) for j in range(300)
+        ])
+        for i in range(3)
+    ]
+    root = TaskNode("Root", children=groups)
+    lines = render_tree(root, bar_width=1).splitlines()
+
+    leaves = sum(j % 101 for j in range(300)) / 300
+    assert root.computed_percent() == (90 + leaves + leaves) / 3
+    assert len(lines) == 1 + 3 * 301
+    assert lines[1] == "  G0: [█]  90.00%"
+    assert lines[2] == "    G0.0: [░]   0.00%"
+    assert lines[-1] == "    G2.299: [█]  97.00%"
@@ -0,0 +1,67 @@
+import sys
+
+from acm.domain import Checklist, TaskNode
+from acm.query import Query, walk
+
+
+def _checklist() -> Checklist:
+    return Checklist(
+        tasks=[
+            TaskNode(
+                item="Methods",
+                subtasks=[
+                    TaskNode(item="Stats", done=True, subtasks=[TaskNode(item="Power")]),
+                    TaskNode(item="Code", percent=30),
+                ],
+            ),
+            TaskNode(item="Results", subtasks=[TaskNode(item="Figures", percent=80)]),
+            TaskNode(item="References", done=True),
+        ]
+    )
+
+
+def test_walk_orders() -> None:
+    checklist = _checklist()
+    depth = [e.path_str for e in walk(checklist)]
+    breadth = [e.path_str for e in walk(checklist, order="breadth")]
+
+    assert depth == [
+        "Methods", "Methods/Stats", "Methods/Stats/Power", "Methods/Code",
+        "Results", "Results/Figures", "References",
+    ]
+    assert breadth[:3] == ["Methods", "Results", "References"]
+    assert sorted(breadth) == sorted(depth)
+    assert [e.path_str for e in walk(checklist, max_depth=0)] == ["Methods", "Results", "References"]
+
+
+def test_query_filters_compose() -> None:
+    q = _checklist().query()
+
+    assert [e.path_str for e in q.incomplete().leaves()] == ["Methods/Code", "Results/Figures"]
+    assert [e.path_str for e in q.below(50)] == ["Methods/Stats/Power", "Methods/Code"]
+    assert [e.path_str for e in q.matching("*s")] == [
+        "Methods", "Methods/Stats", "Results", "Results/Figures", "References",
+    ]
+    assert [e.path_str for e in q.matching("methods/*").max_depth(1)] == [
+        "Methods/Stats", "Methods/Code",
+    ]
+    assert q.breadth_first().leaves().first().path_str == "References"
+    assert q.limit(2).count() == 2
+
+
+def test_query_stops_early() -> None:
+    visited = []
+    q = Query(_checklist()).where(lambda e: visited.append(e.path_str) or True).limit(2)
+
+    assert len(list(q)) == 2
+    assert visited == ["Methods", "Methods/Stats"]
+
+
+def test_deep_query_does_not_recurse() -> None:
+    root = node = TaskNode(item="0")
+    for i in range(1, sys.getrecursionlimit() + 100):
+        child = TaskNode(item=str(i))
+        node.add_subtask(child)
+        node = child
+
+    assert Query(root).leaves().first().depth == sys.getrecursionlimit() + 99
@@ -0,0 +1,53 @@
+import sys
+
+from acm.domain import Checklist, TaskNode
+from acm.progress import render_tree
+from acm.render import iter_lines, render
+
+
+def _checklist() -> Checklist:
+    return Checklist(
+        tasks=[
+            TaskNode(item="Methods", done=True, subtasks=[TaskNode(item="Stats"), TaskNode(item="Code")]),
+            TaskNode(item="Results", subtasks=[TaskNode(item="Figures", percent=50)]),
+        ]
+    )
+
+
+def test_render_matches_render_tree() -> None:
+    checklist = _checklist()
+
+    assert render(checklist, name="Paper") == render_tree(checklist.to_progress_node("Paper"))
+
+
+def test_depth_and_done_collapse() -> None:
+    checklist = _checklist()
+
+    assert [line.split(":")[0] for line in iter_lines(checklist, name="Paper", max_depth=1)] == [
+        "Paper", "  Methods", "  Results",
+    ]
+    collapsed = list(iter_lines(checklist, name="Paper", collapse_done=True))
+    assert collapsed[1].endswith("100.00% [+2]")
+    assert collapsed[2].startswith("  Results:") and len(collapsed) == 4
+
+
+def test_lines_fit_width() -> None:
+    checklist = Checklist(tasks=[TaskNode(item="A very long task name " * 3)])
+    lines = list(iter_lines(checklist, name="Paper", width=60))
+
+    assert all(len(line) <= 60 for line in lines)
+    assert lines[1].startswith("  A very long") and "…: [" in lines[1]
+    narrow = list(iter_lines(checklist, name="Paper", width=20))
+    assert narrow[1] == "  A very long t…: 0%" and all(len(line) <= 20 for line in narrow)
+
+
+def test_streams_without_walking_the_whole_tree() -> None:
+    root = node = TaskNode(item="0")
+    for i in range(1, sys.getrecursionlimit() + 100):
+        child = TaskNode(item=str(i))
+        node.add_subtask(child)
+        node = child
+    lines = iter_lines(root)
+
+    assert next(lines).startswith("0: [")
+    assert sum(1 for _ in lines) == sys.getrecursionlimit() + 99
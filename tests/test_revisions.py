@@ -0,0 +1,87 @@
+from pathlib import Path
+
+from docx import Document
+
+from acm.analysis import collect_metrics, iter_blocks, parse_docx_sections
+from acm.revisions import RevisionSnapshot, RevisionTracker, analyze_revision
+
+
+def _write_doc(path: Path, sections) -> Path:
+    doc = Document()
+    for title, paragraphs in sections:
+        doc.add_heading(title, level=1)
+        for text in paragraphs:
+            doc.add_paragraph(text)
+    doc.save(path)
+    return path
+
+
+def test_revision_reuses_unchanged_paragraphs_and_reports_diff(tmp_path: Path) -> None:
+    first = _write_doc(
+        tmp_path / "v1.docx",
+        [("Introduction", ["one two three", "four five"]), ("Methods", ["six seven"])],
+    )
+    baseline = analyze_revision(first)
+    assert baseline.sections == parse_docx_sections(first, use_cache=False)
+    assert baseline.recounted == 3 and baseline.diff == []
+
+    snapshot_file = tmp_path / "v1.json"
+    baseline.snapshot.save(snapshot_file)
+
+    second = _write_doc(
+        tmp_path / "v2.docx",
+        [
+            ("Introduction", ["one two three", "four five six"]),
+            ("Methods", ["six seven"]),
+            ("Discussion", ["eight"]),
+        ],
+    )
+    revision = analyze_revision(second, RevisionSnapshot.load(snapshot_file))
+
+    assert revision.sections == parse_docx_sections(second, use_cache=False)
+    assert (revision.recounted, revision.reused) == (2, 2)
+    summary = {d.title: (d.status, d.added, d.removed) for d in revision.diff}
+    assert summary == {
+        "Introduction": ("changed", 3, 2),
+        "Methods": ("unchanged", 0, 0),
+        "Discussion": ("added", 1, 0),
+    }
+
+
+def test_unchanged_file_is_not_parsed_and_categories_are_current(
+    tmp_path: Path, monkeypatch
+) -> None:
+    doc = _write_doc(tmp_path / "v1.docx", [("Methods", ["one two"]), ("Notes", ["three"])])
+    baseline = analyze_revision(doc)
+    data = baseline.snapshot.to_dict()
+    data["sections"][0]["category"] = "Stale"
+    previous = RevisionSnapshot.from_dict(data)
+    assert previous.describes(doc)
+
+    def fail(path):
+        raise AssertionError("parsed an unchanged file")
+
+    monkeypatch.setattr("acm.revisions.iter_blocks", fail)
+    revision = analyze_revision(doc, previous)
+
+    assert revision.sections == baseline.sections
+    assert revision.sections[0].category == "Methods"
+    assert (revision.recounted, revision.reused) == (0, 2)
+    assert {d.status for d in revision.diff} == {"unchanged"}
+
+
+def test_tracker_snapshots_while_metrics_read_the_file(tmp_path: Path) -> None:
+    doc = _write_doc(tmp_path / "v1.docx", [("Methods", ["one two"]), ("Results", ["three"])])
+    expected = analyze_revision(doc)
+
+    tracker = RevisionTracker(doc)
+    metrics = collect_metrics(tracker.track(iter_blocks(doc)))
+    revision = tracker.result()
+
+    assert metrics.sections == revision.sections == expected.sections
+    assert revision.snapshot == expected.snapshot
+
+    # Blocks the consumer never read are hashed when the result is taken.
+    unread = RevisionTracker(doc)
+    unread.track(iter_blocks(doc))
+    assert unread.result().snapshot == expected.snapshot
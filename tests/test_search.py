@@ -0,0 +1,54 @@
+from acm.journal import Guideline
+from acm.search import MAX_PREFIX_TERMS, GuidelineIndex, guideline_index
+
+
+def _index() -> GuidelineIndex:
+    return GuidelineIndex(
+        [
+            Guideline(journal="Journal of Neuroscience", article_type="Research Article",
+                      other_requirements=["Significance Statement (120 words) required"]),
+            Guideline(journal="Neuron", article_type="Short Report"),
+            Guideline(journal="PLOS ONE", article_type="Research Article",
+                      structure="Introduction, Methods, Results, Discussion"),
+        ]
+    )
+
+
+def test_search_matches_words_prefixes_and_typos() -> None:
+    index = _index()
+
+    def journals(query: str):
+        return [hit.guideline.journal for hit in index.search(query)]
+
+    assert journals("significance statement") == ["Journal of Neuroscience"]
+    assert journals("neuro") == ["Journal of Neuroscience", "Neuron"]
+    assert journals("nuerosci") == ["Journal of Neuroscience"]
+    assert journals("reserch article") == ["Journal of Neuroscience", "PLOS ONE"]
+    assert journals("plos discusion") == ["PLOS ONE"]
+    assert journals("short article") == []
+    assert journals("") == []
+
+
+def test_prefix_expands_to_most_common_words() -> None:
+    # More rare words share the prefix than it expands to; the common word
+    # sorts after all of them but is still matched.
+    rare = [
+        Guideline(journal=f"Journal {i}", article_type="Letter", structure=f"stat{i:03d}")
+        for i in range(MAX_PREFIX_TERMS + 6)
+    ]
+    common = [
+        Guideline(journal=f"Common {i}", article_type="Letter", structure="statistics")
+        for i in range(2)
+    ]
+    index = GuidelineIndex(rare + common)
+
+    journals = [hit.guideline.journal for hit in index.search("stat", limit=None)]
+    # "statistics" and the first MAX_PREFIX_TERMS - 1 rare words.
+    assert len(journals) == MAX_PREFIX_TERMS + 1
+    assert journals[-2:] == ["Common 0", "Common 1"]
+    assert [hit.guideline.journal for hit in index.search("statis")] == ["Common 0", "Common 1"]
+
+
+def test_default_index_is_built_once() -> None:
+    assert guideline_index() is guideline_index()
+    assert guideline_index().search("science")
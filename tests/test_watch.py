@@ -0,0 +1,113 @@
+import io
+from pathlib import Path
+import threading
+
+from acm.watch import FileWatcher, Screen, fit_screen, manuscript_lines, watch
+
+
+def test_screen_rewrites_only_changed_rows() -> None:
+    stream = io.StringIO()
+    screen = Screen(stream, ansi=True)
+
+    assert screen.draw(["a", "b", "c"]) == 3
+    stream.seek(0), stream.truncate()
+    assert screen.draw(["a", "B", "c"]) == 1
+    assert stream.getvalue() == "\x1b[2;1HB\x1b[K"
+    assert screen.draw(["a", "B", "c"]) == 0
+    stream.seek(0), stream.truncate()
+    screen.draw(["a"])
+    assert stream.getvalue() == "\x1b[2;1H\x1b[J"
+    assert fit_screen(["1", "2", "3", "4"], 3) == ["1", "2", "… 2 more lines"]
+
+
+def test_watch_redraws_after_file_change(tmp_path: Path) -> None:
+    file = tmp_path / "acm.yaml"
+    file.write_text("one")
+    assert not FileWatcher([file]).changed()
+
+    stream = io.StringIO()
+    stop = threading.Event()
+    frames = []
+
+    def render():
+        frames.append(file.read_text())
+        if len(frames) == 2:
+            stop.set()
+        return [frames[-1]]
+
+    thread = threading.Thread(
+        target=watch, args=(render, [file, tmp_path / "missing"], Screen(stream, ansi=False), 0.01, stop)
+    )
+    thread.start()
+    while not frames:
+        stop.wait(0.01)
+    file.write_text("two!")
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert frames == ["one", "two!"]
+    assert stream.getvalue() == "one\n\ntwo!\n"
+
+
+def test_watch_keeps_frame_on_broken_project(tmp_path: Path) -> None:
+    from acm.cli import load_project, save_project
+    from acm.domain import ArticleProject
+
+    save_project(ArticleProject(name="Paper"), tmp_path)
+    stream = io.StringIO()
+    stop = threading.Event()
+    calls = []
+
+    def render():
+        calls.append(None)
+        if len(calls) == 1:
+            lines = [load_project(tmp_path).name]
+            # Half-typed YAML (a bare string), then no project file at all.
+            (tmp_path / "acm.yaml").write_text("chec")
+            return lines
+        if len(calls) == 2:
+            try:
+                load_project(tmp_path)
+            finally:
+                (tmp_path / "acm.yaml").unlink()
+        stop.set()
+        load_project(tmp_path)
+
+    watch(render, [tmp_path / "acm.yaml"], Screen(stream, ansi=False), 0.01, stop)
+
+    assert len(calls) == 3
+    frames = [frame.splitlines() for frame in stream.getvalue().split("\n\n")]
+    assert frames[0] == ["Paper"]
+    assert [frame[0] for frame in frames[1:]] == ["Paper", "Paper"]
+    assert all(frame[1].startswith("! ") for frame in frames[1:])
+
+
+def test_watch_redraws_when_terminal_resizes(tmp_path: Path) -> None:
+    sizes = [80, 80, 40]
+    stop = threading.Event()
+    frames = []
+
+    def size():
+        return sizes.pop(0) if len(sizes) > 1 else sizes[0]
+
+    def render():
+        frames.append(sizes[0])
+        if len(frames) == 2:
+            stop.set()
+        return [str(len(frames))]
+
+    watch(render, [tmp_path / "acm.yaml"], Screen(io.StringIO(), ansi=False), 0.01, stop, size)
+
+    assert frames == [80, 40]
+
+
+def test_manuscript_lines_fit_width(tmp_path: Path) -> None:
+    from acm.manuscript import save_sections
+
+    name = "A rather long section heading"
+    save_sections({name: {"text": "one two three", "limit": 100}}, tmp_path)
+
+    lines = manuscript_lines(tmp_path, width=30)
+
+    assert lines[2] == "  A rather long …: 3/100 words"
+    assert all(len(line) <= 30 for line in lines)